@@ -1,16 +1,22 @@
 import os
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Environment variables from .env are loaded by main.py and read by Settings
 
 # Import core components
 from .core.config import settings
 from .core.logging_config import get_logger
 from .core.error_handling import register_exception_handlers
+from .core.error_capture import ErrorCaptureMiddleware, get_error_aggregator
+from .core.hot_reload import get_hot_reloader
+from .core.loop_monitor import get_loop_monitor
+from .core.assets import PrecompressedStaticFiles, asset_url
+from .core.admission import AdmissionMiddleware
+from .core.metrics import MetricsMiddleware
+from .core.response_cache import ResponseCacheMiddleware
+from .core.startup import component, is_lazy, warm_up
+from .services.analytics import get_analytics
+from .services.contact_service import get_contact_pipeline
 
 # Initialize main application logger
 logger = get_logger(__name__)
@@ -23,22 +29,54 @@ app = FastAPI(
     # Add other FastAPI parameters if needed, e.g., lifespan context managers for DB connections
 )
 
-# Mount static files directory
+# Shed load by priority class ahead of the handlers (innermost: cache hits need no slot)
+if settings.ADMISSION_CONTROL:
+    app.add_middleware(AdmissionMiddleware)
+
+# Serve @cache_response routes from memory; added before metrics so they still see the hits
+if settings.RESPONSE_CACHE:
+    app.add_middleware(ResponseCacheMiddleware)
+
+# Record per-route request metrics (served on /api/metrics)
+app.add_middleware(MetricsMiddleware)
+
+# Answer unhandled exceptions with a 500 and aggregate their tracebacks; outermost,
+# so metrics record the 500 and ServerErrorMiddleware never sees the exception
+app.add_middleware(ErrorCaptureMiddleware)
+
+# Mount static files directory (fingerprinted assets under /static/dist are immutable)
 static_dir = os.path.join(os.path.dirname(__file__), 'static')
 if os.path.exists(static_dir) and os.path.isdir(static_dir):
-    app.mount("/static", StaticFiles(directory=static_dir), name="static")
+    app.mount("/static", PrecompressedStaticFiles(directory=static_dir), name="static")
     logger.info(f"Using static directory at {static_dir}")
 else:
     logger.warning(f"Static directory not found at {static_dir}. Create it if you need to serve static files.")
 
-# Configure Jinja2 templates
+# Configure Jinja2 templates (built on first use, or at startup in eager mode)
 templates_dir = os.path.join(os.path.dirname(__file__), 'templates')
-if os.path.exists(templates_dir) and os.path.isdir(templates_dir):
+
+@component("templates")
+def get_templates():
+    if not os.path.isdir(templates_dir):
+        logger.warning(f"Templates directory not found at {templates_dir}. Create it if you need to use Jinja2 templates.")
+        return None
+    from fastapi.templating import Jinja2Templates
     templates = Jinja2Templates(directory=templates_dir)
+    templates.env.globals["asset_url"] = asset_url
+    templates.env.globals["settings"] = settings
+    if settings.TEMPLATE_BYTECODE_CACHE_DIR:
+        # Compiled templates survive restarts, so cold starts skip the Jinja2 compiler
+        from jinja2 import FileSystemBytecodeCache
+        os.makedirs(settings.TEMPLATE_BYTECODE_CACHE_DIR, exist_ok=True)
+        templates.env.bytecode_cache = FileSystemBytecodeCache(settings.TEMPLATE_BYTECODE_CACHE_DIR)
     logger.info(f"Using templates directory at {templates_dir}")
-else:
-    templates = None
-    logger.warning(f"Templates directory not found at {templates_dir}. Create it if you need to use Jinja2 templates.")
+    return templates
+
+def __getattr__(name):
+    # ``from app import templates`` keeps working without importing Jinja2 up front
+    if name == "templates":
+        return get_templates()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Import and include routers after app creation
 from .api import routes as api_routes
@@ -55,19 +93,29 @@ app.include_router(frontend_routes.router, tags=["frontend"])
 # Register custom exception handlers
 register_exception_handlers(app)
 
-# Add root endpoint (optional)
-@app.get("/")
-async def read_root():
-    logger.info("Root endpoint accessed.")
-    return {"message": "Welcome to the FastAPI application!"}
+# "/" is the streamed portfolio page from the frontend router
 
 # --- Startup and Shutdown Events ---
 @app.on_event("startup")
 async def startup_event():
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION} ({settings.APP_ENV})")
     # Add any startup tasks here (database connections, etc.)
+    if not is_lazy():
+        warm_up()
+    await get_contact_pipeline().start()
+    await get_error_aggregator().start()
+    await get_loop_monitor().start()
+    await get_hot_reloader().start()
+    if settings.ANALYTICS:
+        await get_analytics().start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info(f"Shutting down {settings.APP_NAME}")
-    # Add any cleanup tasks here
\ No newline at end of file
+    # Add any cleanup tasks here
+    await get_contact_pipeline().stop()
+    await get_error_aggregator().stop()
+    await get_loop_monitor().stop()
+    await get_hot_reloader().stop()
+    if settings.ANALYTICS:
+        await get_analytics().stop()
\ No newline at end of file
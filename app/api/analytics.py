@@ -0,0 +1,80 @@
+from fastapi import APIRouter, Query, Request, Response, status
+from fastapi.responses import JSONResponse
+from typing import Dict, Tuple
+import asyncio
+import json
+
+from app.services.analytics import SECTIONS, get_analytics, visitor_key
+from app.services.portfolio_service import get_portfolio_service
+
+router = APIRouter(prefix="/analytics")
+
+# A beacon carries the events of one page interaction; anything larger is not ours
+MAX_BODY_BYTES = 4096
+MAX_EVENTS = 20
+
+# (content version, project title -> technologies)
+_projects: Tuple[int, Dict[str, Tuple[str, ...]]] = (-1, {})
+
+
+def _project_technologies() -> Dict[str, Tuple[str, ...]]:
+    """Technologies per project title, rebuilt when the content version changes."""
+    global _projects
+    service = get_portfolio_service()
+    version = service.version
+    if _projects[0] != version:
+        _projects = (version, {project.title: project.technologies for project in service.get_projects()})
+    return _projects[1]
+
+
+def _bad_request(detail: str) -> JSONResponse:
+    return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": detail})
+
+
+@router.post("/events", status_code=status.HTTP_204_NO_CONTENT)
+async def record_events(request: Request):
+    """Record a batch of page events sent by the page's beacon script.
+
+    The body is a JSON list (sent as text/plain by ``navigator.sendBeacon``) of
+    ``{"type": "page_view"}``, ``{"type": "section", "section": "projects"}`` or
+    ``{"type": "project_click", "project": "<title>"}``. Unknown sections and
+    projects are ignored, so the sketches only ever see keys from the content.
+    """
+    body = b""
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > MAX_BODY_BYTES:
+            return JSONResponse(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                                content={"detail": "Too many events."})
+    try:
+        events = json.loads(body)
+    except ValueError:
+        return _bad_request("Events must be a JSON list.")
+    if not isinstance(events, list) or len(events) > MAX_EVENTS:
+        return _bad_request(f"Events must be a JSON list of at most {MAX_EVENTS} items.")
+
+    analytics = get_analytics()
+    visitor = visitor_key(request.scope)
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+        kind = event.get("type")
+        if kind == "page_view":
+            analytics.record_page_view(visitor)
+        elif kind == "section" and event.get("section") in SECTIONS:
+            analytics.record_section(event["section"], visitor)
+        elif kind == "project_click" and isinstance(event.get("project"), str):
+            technologies = _project_technologies().get(event["project"])
+            if technologies is not None:
+                analytics.record_project_click(event["project"], technologies, visitor)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("")
+async def analytics_summary(days: int = Query(7, ge=1, le=366)):
+    """Unique visitors, page views, section navigations and the most clicked projects and technologies.
+
+    Visitor counts are HyperLogLog estimates and click counts count-min
+    estimates, covering the last ``days`` UTC days including unflushed events.
+    """
+    return await asyncio.to_thread(get_analytics().summary, days)
@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+import sys
+
+router = APIRouter()
+
+
+@router.get("/clients")
+async def clients():
+    """Connected NiceGUI clients with their element counts, estimated memory and idle time.
+
+    Limits are enforced by ``app/frontend/client_manager.py``; in FastAPI mode
+    there are no NiceGUI clients.
+    """
+    if "app.frontend.client_manager" not in sys.modules:
+        return {"enabled": False, "clients": 0, "items": []}
+    from app.frontend.client_manager import get_client_manager
+    return get_client_manager().stats()
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
+import math
+
+from app.core.config import settings
+from app.core.rate_limit import client_ip
+from app.models.contact import ContactRequest
+from app.services.contact_service import ContactQueueFullError, ContactRateLimitedError, get_contact_pipeline
+
+router = APIRouter(prefix="/contact")
+
+RETRY_AFTER_SECONDS = 30
+
+
+@router.post("", status_code=status.HTTP_202_ACCEPTED)
+async def submit_contact(contact: ContactRequest, request: Request):
+    """Queue a contact message for storage and delivery."""
+    client_key = client_ip(request.scope, settings.TRUST_FORWARDED_FOR, settings.CLIENT_IP_HEADER)
+    try:
+        queued = get_contact_pipeline().submit(contact.to_message(source="api"), client_key=client_key)
+    except ContactRateLimitedError as e:
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": "Too many messages from this client, please retry later."},
+            headers={"Retry-After": str(math.ceil(e.retry_after))},
+        )
+    except ContactQueueFullError:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Too many messages right now, please retry later."},
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
+    if not queued:
+        # Only accepted messages are remembered, so this one is already on its way
+        return JSONResponse(status_code=status.HTTP_200_OK,
+                            content={"status": "duplicate", "detail": "An identical message was already received."})
+    return {"status": "queued"}
+
+
+@router.get("/status")
+async def contact_status():
+    """Queue depth and delivery counters of the contact pipeline."""
+    return get_contact_pipeline().status()
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Request
+import hmac
+
+from app.core.config import settings
+from app.core.error_capture import get_error_aggregator
+
+router = APIRouter()
+
+
+def _authorized(request: Request) -> bool:
+    if not settings.ERROR_DETAILS_TOKEN:
+        return False
+    expected = f"Bearer {settings.ERROR_DETAILS_TOKEN}"
+    return hmac.compare_digest(request.headers.get("authorization", "").encode(), expected.encode())
+
+
+@router.get("/errors")
+async def captured_errors(request: Request):
+    """Errors seen by the exception handlers, aggregated by fingerprint (most frequent first).
+
+    Only types, routes and counts are public; code locations and the last
+    messages need the ``ERROR_DETAILS_TOKEN`` bearer token.
+    """
+    errors = get_error_aggregator().snapshot(details=_authorized(request))
+    return {"total": sum(error["count"] for error in errors), "errors": errors}
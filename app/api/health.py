@@ -1,19 +1,107 @@
 from fastapi import APIRouter
+from fastapi.responses import Response
 from datetime import datetime
-import os
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import json
+import sys
+import time
+
+from app.core.admission import get_admission_controller
+from app.core.config import settings
+from app.core.loop_monitor import get_loop_monitor
+from app.services.contact_service import get_contact_pipeline
+from app.services.portfolio_service import get_portfolio_service
 
 router = APIRouter()
 
+# Only the timestamp of the liveness answer changes while the process runs, so
+# the rest is serialized once and the timestamp spliced in per call
+_LIVE_TAIL = json.dumps({"environment": settings.APP_ENV, "version": settings.APP_VERSION})[1:]
+
+_ready_cache: Dict[str, Any] = {"expires": 0.0, "status": 200, "body": b""}
+_ready_lock = asyncio.Lock()
+
+
 @router.get("/health")
+@router.get("/health/live")
 async def health_check():
-    """Health check endpoint for monitoring and auto-scaling.
-    
-    This endpoint is used by fly.io to determine if the application is healthy
-    and to make decisions about auto-scaling and machine shutdown.
+    """Liveness check: the process is up and its event loop answers.
+
+    Served from a mostly prebuilt body so it stays cheap under any load; use
+    ``/health/ready`` to decide whether the machine should get traffic.
     """
+    body = f'{{"status": "ok", "timestamp": "{datetime.now().isoformat()}", {_LIVE_TAIL}'
+    return Response(content=body.encode("utf-8"), media_type="application/json")
+
+
+def _connected_clients() -> Optional[int]:
+    """Open NiceGUI websocket clients, or None when NiceGUI is not in use."""
+    if "nicegui" not in sys.modules:
+        return None
+    from nicegui import Client
+    return sum(1 for client in Client.instances.values() if client.has_socket_connection)
+
+
+async def _check_storage(name: str, ping: Callable[[], None], failures: List[str]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(asyncio.to_thread(ping), settings.READY_STORAGE_TIMEOUT_SECONDS)
+    except Exception as e:
+        failures.append(f"{name} storage unavailable: {type(e).__name__}")
+        return {"available": False}
+    return {"available": True, "latency_ms": round((time.perf_counter() - start) * 1000, 2)}
+
+
+async def _readiness() -> Dict[str, Any]:
+    failures: List[str] = []
+    monitor = get_loop_monitor()
+    lag = monitor.percentiles()
+    if not monitor.running:
+        failures.append("event-loop lag monitor is not running")
+    elif lag["p95"] > settings.READY_MAX_LOOP_LAG_SECONDS:
+        failures.append(f"event-loop lag p95 {lag['p95'] * 1000:.0f}ms > {settings.READY_MAX_LOOP_LAG_SECONDS * 1000:.0f}ms")
+
+    pipeline = get_contact_pipeline()
+    contact = pipeline.status()
+    if not contact["running"]:
+        failures.append("contact pipeline is not running")
+    elif contact["queue_depth"] > settings.READY_MAX_QUEUE_FILL * contact["queue_capacity"]:
+        failures.append(f"contact queue at {contact['queue_depth']}/{contact['queue_capacity']}")
+
+    clients = _connected_clients()
+    if clients is not None and settings.READY_MAX_CLIENTS and clients > settings.READY_MAX_CLIENTS:
+        failures.append(f"{clients} connected clients > {settings.READY_MAX_CLIENTS}")
+
+    storage = {
+        "portfolio": await _check_storage("portfolio", get_portfolio_service().store.ping, failures),
+        "contact": await _check_storage("contact", pipeline.store.ping, failures),
+    }
     return {
-        "status": "ok",
-        "timestamp": datetime.now().isoformat(),
-        "environment": os.getenv("APP_ENV", "development"),
-        "version": os.getenv("APP_VERSION", "1.0.0")
-    }
\ No newline at end of file
+        "status": "fail" if failures else "ok",
+        "failures": failures,
+        "loop_lag_ms": {key: round(value * 1000, 2) for key, value in lag.items()},
+        "queues": {
+            "contact": {"depth": contact["queue_depth"], "capacity": contact["queue_capacity"]},
+            "admission": get_admission_controller().status() if settings.ADMISSION_CONTROL else None,
+        },
+        "connected_clients": clients,
+        "storage": storage,
+    }
+
+
+@router.get("/health/ready")
+async def readiness_check():
+    """Readiness check: 503 while event-loop lag, queue depth, clients or storage exceed their limits.
+
+    Load balancers should route traffic on this endpoint so a saturated
+    machine sheds load before latency collapses. Results are cached for
+    ``READY_CACHE_SECONDS``.
+    """
+    async with _ready_lock:
+        if time.monotonic() >= _ready_cache["expires"]:
+            report = await _readiness()
+            _ready_cache.update(expires=time.monotonic() + settings.READY_CACHE_SECONDS,
+                                status=503 if report["failures"] else 200,
+                                body=json.dumps(report).encode("utf-8"))
+    return Response(content=_ready_cache["body"], status_code=_ready_cache["status"], media_type="application/json")
@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.core.metrics import registry
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics")
+async def metrics():
+    """Request and application metrics in the Prometheus text format."""
+    return Response(content=registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
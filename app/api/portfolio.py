@@ -0,0 +1,163 @@
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+from cachetools import LRUCache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import json
+import textwrap
+import threading
+
+from app.core.config import settings
+from app.core.http_cache import is_not_modified, make_etag
+from app.core.response_cache import cache_response
+from app.models.portfolio import to_jsonable
+from app.services.portfolio_service import PortfolioService, get_portfolio_service
+
+router = APIRouter(prefix="/portfolio")
+
+CACHE_CONTROL = "public, no-cache"
+
+# Policy of the JSON routes when RESPONSE_CACHE is on (app/core/response_cache.py)
+cached = cache_response(settings.RESPONSE_CACHE_TTL_SECONDS, settings.RESPONSE_CACHE_STALE_SECONDS)
+
+
+class SerializedEntry(NamedTuple):
+    version: int
+    body: bytes
+    etag: str
+
+
+class SerializedResponseCache:
+    """Keeps encoded JSON bodies per (section, query) until the content version changes."""
+
+    def __init__(self, maxsize: int = 256):
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple, version: int, build: Callable[[], Any]) -> SerializedEntry:
+        """Return the cached entry for ``key``, serializing ``build()`` once per version."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.version == version:
+            return entry
+        body = json.dumps(build(), ensure_ascii=False, separators=(",", ":"), default=to_jsonable).encode("utf-8")
+        entry = SerializedEntry(version, body, make_etag(version, body))
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = SerializedResponseCache()
+
+
+def _respond(request: Request, service: PortfolioService, key: Tuple, build: Callable[[], Any]) -> Response:
+    entry = response_cache.get(key, service.version, build)
+    headers = {"ETag": entry.etag, "Cache-Control": CACHE_CONTROL}
+    if is_not_modified(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def _text(value: str) -> str:
+    return textwrap.dedent(value).strip()
+
+
+def _page(items: Sequence[Any], total: int, offset: int, limit: int) -> Dict[str, Any]:
+    return {"items": items, "total": total, "offset": offset, "limit": limit}
+
+
+@router.get("/bio")
+@cached
+def get_bio(request: Request, service: PortfolioService = Depends(get_portfolio_service)):
+    """Short bio as markdown."""
+    return _respond(request, service, ("bio",), lambda: {"bio": _text(service.get_bio())})
+
+
+@router.get("/about")
+@cached
+def get_about(request: Request, service: PortfolioService = Depends(get_portfolio_service)):
+    """About section as markdown."""
+    return _respond(request, service, ("about",), lambda: {"about": _text(service.get_about())})
+
+
+@router.get("/skills")
+@cached
+def get_skills(request: Request, service: PortfolioService = Depends(get_portfolio_service)):
+    """Skills grouped by kind."""
+    return _respond(request, service, ("skills",), lambda: {
+        "technical": service.get_technical_skills(),
+        "ai_ml": service.get_ai_ml_skills(),
+        "tools_platforms": service.get_tools_platforms(),
+    })
+
+
+@router.get("/projects")
+@cached
+def get_projects(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    category: Optional[str] = None,
+    technology: Optional[str] = None,
+    service: PortfolioService = Depends(get_portfolio_service),
+):
+    """A page of projects, optionally filtered by category and technology."""
+    return _respond(request, service, ("projects", offset, limit, category, technology), lambda: _page(
+        service.get_projects(offset, limit, category=category, technology=technology),
+        service.count_projects(category=category, technology=technology),
+        offset, limit,
+    ))
+
+
+@router.get("/experience")
+@cached
+def get_experience(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    technology: Optional[str] = None,
+    service: PortfolioService = Depends(get_portfolio_service),
+):
+    """A page of work experience, optionally filtered by technology."""
+    return _respond(request, service, ("experience", offset, limit, technology), lambda: _page(
+        service.get_experience(offset, limit, technology=technology),
+        service.count_experience(technology=technology),
+        offset, limit,
+    ))
+
+
+@router.get("/education")
+@cached
+def get_education(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    service: PortfolioService = Depends(get_portfolio_service),
+):
+    """A page of education entries."""
+    return _respond(request, service, ("education", offset, limit), lambda: {
+        "items": service.get_education(offset, limit),
+        "offset": offset,
+        "limit": limit,
+    })
+
+
+@router.get("/technologies")
+@cached
+def filter_by_technologies(
+    request: Request,
+    all_of: List[str] = Query([], alias="all"),
+    any_of: List[str] = Query([], alias="any"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    service: PortfolioService = Depends(get_portfolio_service),
+):
+    """Projects and experience matching all of ``all`` and any of ``any``, with per-technology counts.
+
+    Without filters this returns the overall technology counts.
+    """
+    key = ("technologies", tuple(sorted(all_of)), tuple(sorted(any_of)), offset, limit)
+    return _respond(request, service, key, lambda: service.filter_by_technologies(all_of, any_of, offset, limit))
@@ -7,6 +7,30 @@ router = APIRouter()
 from .health import router as health_router
 router.include_router(health_router, tags=["health"])
 
+# Import and include portfolio content routes
+from .portfolio import router as portfolio_router
+router.include_router(portfolio_router, tags=["portfolio"])
+
+# Import and include contact form routes
+from .contact import router as contact_router
+router.include_router(contact_router, tags=["contact"])
+
+# Import and include metrics routes
+from .metrics import router as metrics_router
+router.include_router(metrics_router, tags=["metrics"])
+
+# Import and include NiceGUI client stats routes
+from .clients import router as clients_router
+router.include_router(clients_router, tags=["clients"])
+
+# Import and include captured error routes
+from .errors import router as errors_router
+router.include_router(errors_router, tags=["errors"])
+
+# Import and include visitor analytics routes
+from .analytics import router as analytics_router
+router.include_router(analytics_router, tags=["analytics"])
+
 @router.get('/ping')
 async def ping_pong():
     """A simple ping endpoint."""
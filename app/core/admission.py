@@ -0,0 +1,216 @@
+"""
+Admission control: priority classes, in-flight limits and queue deadlines.
+
+Every HTTP request is classified, most important first:
+
+- ``health``: health checks, static assets and NiceGUI's own endpoints;
+  always admitted, so probes and connected pages keep working under load;
+- ``api``: reads from the JSON API;
+- ``page``: page loads;
+- ``form``: writes to the API (contact form submissions).
+
+The other classes share ``ADMISSION_MAX_IN_FLIGHT`` slots and each has its own
+in-flight limit. A request that finds no free slot waits in its class's
+bounded queue; freed slots go to the most important waiting class first.
+When the queue is full, or the request has waited past its class deadline,
+it gets an immediate 503 with ``Retry-After`` instead of being built anyway
+(a NiceGUI page that starts too late times out in the browser regardless).
+
+NiceGUI form submissions travel over the websocket and are not seen here.
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, Mapping, NamedTuple, Optional
+import asyncio
+import json
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .config import settings
+from .metrics import registry
+
+logger = logging.getLogger(__name__)
+
+CLASSES = ("health", "api", "page", "form")
+
+admission_requests = registry.counter(
+    'http_admission_total', 'Requests by admission class and result (admitted, queued, rejected, timeout).',
+    ('class', 'result'))
+admission_in_flight = registry.gauge('http_admission_in_flight', 'Admitted requests in flight by class.', ('class',))
+admission_queued = registry.gauge('http_admission_queued', 'Requests waiting for admission by class.', ('class',))
+
+# Served outside the limits: probes, assets and the transport of already connected NiceGUI pages
+UNLIMITED_PREFIXES = ("/api/health", "/static/", "/_nicegui/", "/_nicegui_ws/", "/favicon.ico")
+
+
+def classify(scope: Scope) -> str:
+    path = scope["path"]
+    if path.startswith(UNLIMITED_PREFIXES):
+        return "health"
+    read = scope["method"] in ("GET", "HEAD", "OPTIONS")
+    if path.startswith("/api/"):
+        return "api" if read else "form"
+    return "page" if read else "form"
+
+
+class ClassLimits(NamedTuple):
+    max_in_flight: int
+    max_queue: int
+    queue_timeout: float
+
+
+class Rejected(Exception):
+    """The request could not be admitted; ``reason`` is ``rejected`` or ``timeout``."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class AdmissionController:
+    """Shared slots handed out by class priority, with per-class limits and bounded wait queues.
+
+    Only used from the event loop, so there are no locks.
+    """
+
+    def __init__(self, max_in_flight: int, limits: Mapping[str, ClassLimits]):
+        self.max_in_flight = max_in_flight
+        self.limits = dict(limits)
+        self.in_flight: Dict[str, int] = {name: 0 for name in CLASSES}
+        self._queues: Dict[str, Deque[asyncio.Future]] = {name: deque() for name in CLASSES}
+
+    @property
+    def total_in_flight(self) -> int:
+        return sum(count for name, count in self.in_flight.items() if name != "health")
+
+    def _has_slot(self, name: str) -> bool:
+        return (self.in_flight[name] < self.limits[name].max_in_flight
+                and self.total_in_flight < self.max_in_flight)
+
+    def _waiting_ahead(self, name: str) -> bool:
+        """Whether a request of this class, or of a more important one waiting for a shared slot, is queued."""
+        if self._queues[name]:
+            return True
+        return any(self._queues[other] and self.in_flight[other] < self.limits[other].max_in_flight
+                   for other in CLASSES[1:CLASSES.index(name)])
+
+    def _grant(self, name: str) -> None:
+        self.in_flight[name] += 1
+        admission_in_flight.set(self.in_flight[name], (name,))
+
+    async def acquire(self, name: str) -> None:
+        """Wait for a slot of class ``name``.
+
+        Raises:
+            Rejected: If the class queue is full or the wait exceeds its deadline.
+        """
+        if name == "health":
+            self._grant(name)
+            return
+        if self._has_slot(name) and not self._waiting_ahead(name):
+            self._grant(name)
+            admission_requests.inc((name, "admitted"))
+            return
+        queue = self._queues[name]
+        limits = self.limits[name]
+        if len(queue) >= limits.max_queue or limits.queue_timeout <= 0:
+            admission_requests.inc((name, "rejected"))
+            raise Rejected("rejected")
+        waiter = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        admission_queued.set(len(queue), (name,))
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), limits.queue_timeout)
+        except asyncio.TimeoutError:
+            if not waiter.done():
+                admission_requests.inc((name, "timeout"))
+                raise Rejected("timeout")
+        except asyncio.CancelledError:
+            # Client went away; hand on a slot granted in the meantime
+            if waiter.done() and not waiter.cancelled():
+                self.release(name)
+            raise
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+            if waiter in queue:
+                queue.remove(waiter)
+            admission_queued.set(len(queue), (name,))
+        admission_requests.inc((name, "queued"))
+
+    def release(self, name: str) -> None:
+        self.in_flight[name] -= 1
+        admission_in_flight.set(self.in_flight[name], (name,))
+        self._wake()
+
+    def _wake(self) -> None:
+        """Hand free slots to waiters, most important class first."""
+        for name in CLASSES[1:]:
+            queue = self._queues[name]
+            while queue and self._has_slot(name):
+                waiter = queue.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    self._grant(name)
+            admission_queued.set(len(queue), (name,))
+
+    def status(self) -> Dict[str, Dict[str, int]]:
+        return {name: {"in_flight": self.in_flight[name], "queued": len(self._queues[name])} for name in CLASSES}
+
+
+@lru_cache(maxsize=None)
+def get_admission_controller() -> AdmissionController:
+    """Return the process-wide admission controller configured from settings."""
+    limits = {
+        name: ClassLimits(
+            max_in_flight=settings.ADMISSION_CLASS_LIMITS.get(name, settings.ADMISSION_MAX_IN_FLIGHT),
+            max_queue=settings.ADMISSION_QUEUE_SIZES.get(name, 0),
+            queue_timeout=settings.ADMISSION_QUEUE_TIMEOUTS.get(name, 0.0),
+        )
+        for name in CLASSES
+    }
+    return AdmissionController(settings.ADMISSION_MAX_IN_FLIGHT, limits)
+
+
+class AdmissionMiddleware:
+    """Pure ASGI middleware admitting requests through ``AdmissionController``.
+
+    Add it before the response cache and metrics middlewares, so cached
+    responses are served without a slot and shed requests are still counted.
+    """
+
+    def __init__(self, app: ASGIApp, controller: Optional[AdmissionController] = None):
+        self.app = app
+        self.controller = controller or get_admission_controller()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        name = classify(scope)
+        try:
+            await self.controller.acquire(name)
+        except Rejected:
+            await self._overloaded(scope, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(name)
+
+    @staticmethod
+    async def _overloaded(scope: Scope, send: Send) -> None:
+        if scope["path"].startswith("/api/"):
+            body = json.dumps({"detail": "Server is overloaded, please retry shortly."}).encode()
+            content_type = b"application/json"
+        else:
+            body = b"Server is overloaded, please retry in a moment."
+            content_type = b"text/plain; charset=utf-8"
+        await send({"type": "http.response.start", "status": 503, "headers": [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(settings.ADMISSION_RETRY_AFTER_SECONDS).encode()),
+            (b"cache-control", b"no-store"),
+        ]})
+        await send({"type": "http.response.body", "body": body})
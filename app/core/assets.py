@@ -0,0 +1,230 @@
+"""
+Fingerprinted static assets: build step, runtime manifest and precompressed serving.
+
+``build_assets()`` copies every file under ``app/static`` to
+``app/static/dist/<name>.<hash>.<ext>`` and writes ``.br`` / ``.gz`` siblings
+for compressible types, recording everything in ``dist/manifest.json``.
+At runtime ``asset_url()`` resolves logical paths through that manifest and
+``PrecompressedStaticFiles`` serves the hashed files as immutable, picking
+the precompressed variant from ``Accept-Encoding``.
+"""
+from typing import Dict, List, Optional
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import shutil
+import threading
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip variants are still produced
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static')
+DIST_DIR = 'dist'
+# Content-hashed image derivatives (app.core.images); kept across asset builds
+IMAGES_DIR = f'{DIST_DIR}/images'
+MANIFEST_NAME = 'manifest.json'
+STATIC_URL = '/static'
+
+HASH_LENGTH = 10
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.mjs', '.json', '.map', '.svg', '.txt', '.html', '.xml', '.ico', '.ttf', '.otf'}
+MIN_COMPRESS_SIZE = 256
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'public, no-cache'
+
+# Preferred order when the client accepts several encodings
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def _fingerprinted_name(path: str, digest: str) -> str:
+    root, ext = os.path.splitext(path)
+    return f'{root}.{digest[:HASH_LENGTH]}{ext}'
+
+
+def _compress(data: bytes, encoding: str) -> Optional[bytes]:
+    if encoding == 'br':
+        return brotli.compress(data, quality=11) if brotli is not None else None
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def build_assets(static_dir: str = STATIC_DIR) -> Dict[str, Dict[str, object]]:
+    """Fingerprint and precompress every asset under ``static_dir``.
+
+    Returns the manifest that was written to ``<static_dir>/dist/manifest.json``.
+    """
+    dist_dir = os.path.join(static_dir, DIST_DIR)
+    images_dir = os.path.join(static_dir, IMAGES_DIR)
+    if os.path.isdir(dist_dir):
+        for entry in os.scandir(dist_dir):
+            if entry.path == images_dir:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
+    assets: Dict[str, Dict[str, object]] = {}
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = sorted(d for d in dirs if os.path.join(root, d) != dist_dir)
+        for name in sorted(files):
+            if name.startswith('.'):
+                continue
+            source = os.path.join(root, name)
+            logical = os.path.relpath(source, static_dir).replace(os.sep, '/')
+            with open(source, 'rb') as f:
+                data = f.read()
+            target = _fingerprinted_name(logical, hashlib.sha256(data).hexdigest())
+            target_path = os.path.join(dist_dir, target)
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            with open(target_path, 'wb') as f:
+                f.write(data)
+
+            encodings: List[str] = []
+            if os.path.splitext(name)[1].lower() in COMPRESSIBLE_EXTENSIONS and len(data) >= MIN_COMPRESS_SIZE:
+                for encoding, suffix in ENCODINGS:
+                    compressed = _compress(data, encoding)
+                    # Only keep variants that actually save bytes
+                    if compressed is not None and len(compressed) < len(data):
+                        with open(target_path + suffix, 'wb') as f:
+                            f.write(compressed)
+                        encodings.append(encoding)
+            assets[logical] = {'file': f'{DIST_DIR}/{target}', 'encodings': encodings}
+
+    manifest = {'assets': assets}
+    os.makedirs(dist_dir, exist_ok=True)
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    if brotli is None:
+        logger.warning("brotli is not installed; only gzip variants were built")
+    logger.info(f"Built {len(assets)} static assets into {dist_dir}")
+    return manifest
+
+
+class AssetManifest:
+    """Runtime view of ``dist/manifest.json``, loaded on first use."""
+
+    def __init__(self, static_dir: str = STATIC_DIR, url_prefix: str = STATIC_URL):
+        self.static_dir = os.path.realpath(static_dir)
+        self.url_prefix = url_prefix.rstrip('/')
+        self._assets: Optional[Dict[str, Dict[str, object]]] = None
+        self._encodings: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.static_dir, DIST_DIR, MANIFEST_NAME)
+
+    def _load(self) -> Dict[str, Dict[str, object]]:
+        assets = self._assets
+        if assets is not None:
+            return assets
+        with self._lock:
+            if self._assets is None:
+                try:
+                    with open(self.path, encoding='utf-8') as f:
+                        assets = json.load(f)['assets']
+                except FileNotFoundError:
+                    logger.warning(f"No asset manifest at {self.path}; serving unfingerprinted static files. "
+                                   "Run scripts/build_assets.py to build it.")
+                    assets = {}
+                self._encodings = {entry['file']: list(entry['encodings']) for entry in assets.values()}
+                self._assets = assets
+        return self._assets
+
+    def reload(self) -> None:
+        with self._lock:
+            self._assets = None
+
+    def url(self, path: str) -> str:
+        """Return the public URL of a logical asset path such as ``style.css``."""
+        path = path.lstrip('/')
+        entry = self._load().get(path)
+        return f"{self.url_prefix}/{entry['file'] if entry else path}"
+
+    def encodings(self, file: str) -> List[str]:
+        """Precompressed encodings available for a fingerprinted file (``dist/...``)."""
+        self._load()
+        return self._encodings.get(file, [])
+
+    def is_fingerprinted(self, file: str) -> bool:
+        """True for files whose name carries their content hash."""
+        if file.startswith(f'{IMAGES_DIR}/'):
+            return True
+        self._load()
+        return file in self._encodings
+
+
+manifest = AssetManifest()
+
+
+def asset_url(path: str) -> str:
+    """Resolve a logical static path to its fingerprinted URL."""
+    return manifest.url(path)
+
+
+def _accepted_encodings(headers: Headers) -> List[str]:
+    """Content codings the client accepts, ignoring those with ``q=0``."""
+    accepted = []
+    for item in headers.get('accept-encoding', '').split(','):
+        coding, _, params = item.partition(';')
+        name, _, value = params.strip().partition('=')
+        try:
+            if name.strip() == 'q' and float(value) == 0:
+                continue
+        except ValueError:
+            pass
+        accepted.append(coding.strip().lower())
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves fingerprinted assets immutably and precompressed.
+
+    Files listed in the manifest get a one-year ``immutable`` Cache-Control
+    and, when the client accepts it, the ``.br`` or ``.gz`` sibling with the
+    matching ``Content-Encoding``. Everything else is served as usual but
+    must be revalidated.
+    """
+
+    def __init__(self, *args, manifest: AssetManifest = manifest, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.manifest = manifest
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope,
+                      status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        file = os.path.relpath(full_path, self.manifest.static_dir).replace(os.sep, '/')
+        if not self.manifest.is_fingerprinted(file):
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+            response.headers['Cache-Control'] = REVALIDATE_CACHE_CONTROL
+        else:
+            available = self.manifest.encodings(file)
+            encoding = None
+            if available:
+                accepted = _accepted_encodings(request_headers)
+                encoding = next((name for name, _ in ENCODINGS if name in available and name in accepted), None)
+            if encoding is None:
+                response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+            else:
+                variant = f'{full_path}{dict(ENCODINGS)[encoding]}'
+                # Content type follows the original file, not the .br/.gz sibling
+                response = FileResponse(variant, status_code=status_code, stat_result=os.stat(variant),
+                                        media_type=mimetypes.guess_type(full_path)[0] or 'text/plain')
+                response.headers['Content-Encoding'] = encoding
+            if available:
+                response.headers['Vary'] = 'Accept-Encoding'
+            response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
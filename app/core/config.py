@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List, Optional
+from typing import Dict, List, Optional
 import os
 
 class Settings(BaseSettings):
@@ -20,6 +20,173 @@ class Settings(BaseSettings):
     OWNER_TWITTER: Optional[str] = None
     OWNER_PROFILE_IMAGE: str = "profile.jpg"
     
+    # Rendering Settings
+    # "dynamic" builds the NiceGUI element tree per visitor, "cached" serves
+    # pre-rendered HTML per content version and only hydrates the contact form
+    RENDER_MODE: str = "dynamic"
+    # Project cards fetched per scroll batch, and batches kept built per client
+    PROJECTS_BATCH_SIZE: int = 9
+    PROJECTS_MAX_RENDERED_BATCHES: int = 3
+    # Compiled Jinja2 templates are cached here across restarts (empty disables)
+    TEMPLATE_BYTECODE_CACHE_DIR: str = "data/jinja"
+    
+    # NiceGUI Client Settings
+    # Every open tab keeps its element tree on the server. Clients idle this
+    # long are evicted (the tab reloads on its next interaction), as are the
+    # least recently active ones above the client cap or memory budget (0 disables each)
+    CLIENT_IDLE_TIMEOUT_SECONDS: float = 900.0
+    CLIENT_MAX: int = 250
+    CLIENT_MEMORY_BUDGET_MB: float = 128.0
+    # Estimated server memory per element (measured ~2 KB for the portfolio page)
+    CLIENT_ELEMENT_BYTES: int = 2048
+    CLIENT_REAP_INTERVAL_SECONDS: float = 10.0
+    
+    # Storage Settings
+    # "memory" keeps content in Python lists, "sqlite" uses a local WAL-mode database
+    PORTFOLIO_BACKEND: str = "memory"
+    PORTFOLIO_DB_PATH: str = "data/portfolio.db"
+    # Markdown/YAML content sources and the bundle they compile to
+    # (scripts/build_content.py; rebuilt at startup when a source changed).
+    # A .json PORTFOLIO_CONTENT_PATH is loaded as is, see app/services/portfolio_content.py
+    CONTENT_SOURCE_DIR: str = "content"
+    PORTFOLIO_CONTENT_PATH: str = "data/portfolio.bundle"
+    
+    # Image Settings
+    # Widths (px) of the WebP/JPEG variants generated for static images
+    IMAGE_VARIANT_WIDTHS: List[int] = [256, 384, 512, 768, 1024]
+    IMAGE_WEBP_QUALITY: int = 80
+    IMAGE_JPEG_QUALITY: int = 82
+    
+    # Contact Pipeline Settings
+    CONTACT_QUEUE_SIZE: int = 1000
+    CONTACT_BATCH_SIZE: int = 50
+    CONTACT_BATCH_TIMEOUT_SECONDS: float = 0.5
+    CONTACT_DB_PATH: str = "data/messages.db"
+    CONTACT_MAX_ATTEMPTS: int = 5
+    CONTACT_RETRY_BASE_SECONDS: float = 2.0
+    CONTACT_RETRY_MAX_SECONDS: float = 300.0
+    # Messages picked up for delivery are claimed for this long, so several
+    # worker processes sharing the database never send the same message
+    CONTACT_DELIVERY_LEASE_SECONDS: float = 300.0
+    # Per-client token bucket: burst size and sustained submissions per hour (0 disables)
+    CONTACT_RATE_LIMIT_BURST: int = 3
+    CONTACT_RATE_LIMIT_PER_HOUR: float = 10.0
+    CONTACT_RATE_LIMIT_MAX_CLIENTS: int = 10_000
+    # Identical messages within this window are dropped (0 disables)
+    CONTACT_DEDUP_WINDOW_SECONDS: float = 3600.0
+    CONTACT_DEDUP_MAX_ENTRIES: int = 10_000
+    # Header carrying the client address, overwritten by the proxy in front
+    # (Fly-Client-IP on fly.io); takes precedence over X-Forwarded-For
+    CLIENT_IP_HEADER: Optional[str] = None
+    # Use the first X-Forwarded-For address as client IP (only behind a proxy
+    # that replaces the header; fly.io appends to it, so its first entry is the client's own)
+    TRUST_FORWARDED_FOR: bool = False
+    
+    # SMTP Settings (delivery is disabled while SMTP_HOST is empty)
+    SMTP_HOST: Optional[str] = None
+    SMTP_PORT: int = 587
+    SMTP_USERNAME: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    # STARTTLS on a plain connection, or implicit TLS (on by default for port 465);
+    # certificates are verified either way
+    SMTP_USE_TLS: bool = True
+    SMTP_USE_SSL: Optional[bool] = None
+    SMTP_FROM: Optional[str] = None
+    SMTP_TIMEOUT_SECONDS: float = 10.0
+    SMTP_POOL_SIZE: int = 2
+    
+    # Logging Settings
+    # "sync" writes from the logging thread, "queue" only enqueues and a
+    # background thread formats, batches, writes and rotates
+    LOG_MODE: str = "sync"
+    LOG_JSON: bool = False
+    LOG_FILE: str = "logs/app.log"
+    LOG_MAX_BYTES: int = 5 * 1024 * 1024
+    LOG_BACKUP_COUNT: int = 5
+    LOG_QUEUE_SIZE: int = 10_000
+    LOG_BATCH_SIZE: int = 256
+    LOG_FLUSH_INTERVAL_SECONDS: float = 0.2
+    # Per-logger sampling: records per second before only every Nth is kept,
+    # plus fixed keep fractions by logger name prefix, e.g. {"uvicorn.access": 0.1}
+    LOG_SAMPLE_BURST: int = 100
+    LOG_SAMPLE_KEEP_EVERY: int = 100
+    LOG_SAMPLE_RATES: Dict[str, float] = {}
+
+    # Error Capture Settings
+    # Bytes of a request body included when logging a validation error
+    ERROR_BODY_PREVIEW_BYTES: int = 1024
+    # Full tracebacks are logged at most once per interval per error fingerprint;
+    # occurrences in between are counted and logged as periodic summaries
+    ERROR_TRACE_INTERVAL_SECONDS: float = 60.0
+    ERROR_SUMMARY_INTERVAL_SECONDS: float = 60.0
+    ERROR_MAX_FINGERPRINTS: int = 1000
+    # /api/errors shows only types, routes and counts; code locations and the
+    # last messages are added for requests with "Authorization: Bearer <token>"
+    ERROR_DETAILS_TOKEN: Optional[str] = None
+
+    # Startup Settings
+    # "eager" builds services (portfolio, contact pipeline, images, templates) before
+    # serving; "lazy" builds each on first use to cut scale-to-zero cold starts
+    STARTUP_MODE: str = "eager"
+
+    # Hot Reload Settings
+    # Watch .env and PORTFOLIO_CONTENT_PATH and apply changes without a restart
+    # (inotify via watchfiles when installed, else polling every interval)
+    HOT_RELOAD: bool = True
+    HOT_RELOAD_FORCE_POLLING: bool = False
+    HOT_RELOAD_POLL_INTERVAL_SECONDS: float = 1.0
+
+    # Admission Control Settings
+    # Requests are admitted by priority class: health (always), api reads, page
+    # loads, then form submissions. The classes share ADMISSION_MAX_IN_FLIGHT
+    # slots, each within its own limit; a request without a slot waits in its
+    # class queue until its deadline and is then answered 503 with Retry-After
+    ADMISSION_CONTROL: bool = True
+    ADMISSION_MAX_IN_FLIGHT: int = 100
+    ADMISSION_CLASS_LIMITS: Dict[str, int] = {"api": 100, "page": 32, "form": 8}
+    ADMISSION_QUEUE_SIZES: Dict[str, int] = {"api": 200, "page": 50, "form": 20}
+    # Pages give up well before NiceGUI's 3s response timeout would
+    ADMISSION_QUEUE_TIMEOUTS: Dict[str, float] = {"api": 2.0, "page": 1.0, "form": 5.0}
+    ADMISSION_RETRY_AFTER_SECONDS: int = 2
+
+    # Response Cache Settings
+    # Serve GET routes declared with @cache_response from memory (see
+    # app/core/response_cache.py); bounded by the total size of the bodies
+    RESPONSE_CACHE: bool = False
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    RESPONSE_CACHE_MAX_ENTRY_BYTES: int = 1024 * 1024
+    # Fresh lifetime of the cached content routes, then how long a stale copy
+    # is served while it is refreshed in the background
+    RESPONSE_CACHE_TTL_SECONDS: float = 60.0
+    RESPONSE_CACHE_STALE_SECONDS: float = 300.0
+
+    # Health Check Settings
+    # Event-loop lag is sampled every interval; readiness looks at the last WINDOW samples
+    LOOP_LAG_INTERVAL_SECONDS: float = 0.5
+    LOOP_LAG_WINDOW: int = 120
+    # /api/health/ready fails above these limits (0 disables the client limit)
+    READY_MAX_LOOP_LAG_SECONDS: float = 0.5  # p95
+    READY_MAX_QUEUE_FILL: float = 0.9  # fraction of CONTACT_QUEUE_SIZE
+    READY_MAX_CLIENTS: int = 0
+    READY_STORAGE_TIMEOUT_SECONDS: float = 1.0
+    # Readiness results are reused for this long so frequent probes stay cheap
+    READY_CACHE_SECONDS: float = 1.0
+
+    # Analytics Settings
+    # Page views, section navigations and project clicks are aggregated in
+    # fixed-size sketches (see app/services/analytics.py) and merged into the
+    # per-day totals in ANALYTICS_DB_PATH every flush interval
+    ANALYTICS: bool = True
+    ANALYTICS_DB_PATH: str = "data/analytics.db"
+    ANALYTICS_FLUSH_INTERVAL_SECONDS: float = 60.0
+    # HyperLogLog of 2**precision bytes (14: 16 KB, ~0.8% error on unique visitors)
+    ANALYTICS_HLL_PRECISION: int = 14
+    # Count-min sketch of width x depth counters for projects and technologies
+    ANALYTICS_CMS_WIDTH: int = 2048
+    ANALYTICS_CMS_DEPTH: int = 4
+    ANALYTICS_TOP_N: int = 20
+    ANALYTICS_RETENTION_DAYS: int = 90
+
     # Server Settings
     HOST: str = "0.0.0.0"
     PORT: int = 8000
@@ -29,5 +196,12 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         case_sensitive = False
 
+# Settings that take effect without a restart when .env changes (see
+# app/core/hot_reload.py); everything else is read once at startup
+RELOADABLE_SETTINGS = frozenset((
+    "OWNER_NAME", "OWNER_TITLE", "OWNER_EMAIL", "OWNER_GITHUB", "OWNER_LINKEDIN",
+    "OWNER_TWITTER", "OWNER_PROFILE_IMAGE",
+))
+
 # Global configuration instance
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,244 @@
+"""
+Bounded, deduplicated error capture for the exception handlers.
+
+Errors are fingerprinted by exception type, route template and the code
+location that raised them. Each fingerprint keeps a counter in a bounded
+LRU, full tracebacks are logged at most once per interval per fingerprint,
+and a background task logs a summary of what was suppressed. Request bodies
+are only ever previewed up to a byte budget.
+
+Unhandled exceptions are caught by ``ErrorCaptureMiddleware`` rather than an
+exception handler: Starlette's ServerErrorMiddleware re-raises after calling
+the handler (so the server would log every traceback anyway) and skips it
+entirely in debug mode.
+"""
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import logging
+import os
+import reprlib
+import sysconfig
+import threading
+import time
+import traceback
+
+from cachetools import LRUCache
+from fastapi import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+from .metrics import registry, route_template
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_DIR = os.path.dirname(APP_DIR)
+LIBRARY_DIRS = tuple({sysconfig.get_path(name) for name in ('stdlib', 'platstdlib', 'purelib', 'platlib')})
+
+errors_total = registry.counter('app_errors_total', 'Errors captured by the exception handlers.', ('type', 'route'))
+
+
+@dataclass
+class ErrorEntry:
+    """Aggregated occurrences of one error fingerprint."""
+    fingerprint: str
+    type: str
+    route: str
+    location: str
+    count: int = 0
+    first_seen: float = field(default_factory=time.time)
+    last_seen: float = 0.0
+    last_message: str = ""
+    last_trace_at: float = 0.0
+    reported: int = 0  # count at the last summary
+
+
+def error_location(exc: BaseException) -> str:
+    """Innermost traceback frame outside the stdlib and installed packages, else the innermost frame."""
+    frames = traceback.extract_tb(exc.__traceback__) if exc.__traceback__ else []
+    if not frames:
+        return "<unknown>"
+    frame = next((f for f in reversed(frames) if not f.filename.startswith(LIBRARY_DIRS)), frames[-1])
+    filename = os.path.relpath(frame.filename, PROJECT_DIR) if frame.filename.startswith(PROJECT_DIR) \
+        else os.path.basename(frame.filename)
+    return f"{filename}:{frame.name}:{frame.lineno}"
+
+
+def truncate(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... [{len(text) - limit} more chars]"
+
+
+def preview_value(value: Any, limit: int) -> str:
+    """Bounded repr of an already parsed value; never serializes it in full."""
+    if isinstance(value, (bytes, bytearray)):
+        head = bytes(value[:limit])
+        suffix = f"... [{len(value) - limit} more bytes]" if len(value) > limit else ""
+        return head.decode("utf-8", errors="replace") + suffix
+    limited = reprlib.Repr()
+    limited.maxstring = limit
+    limited.maxother = limit
+    limited.maxlevel = 4
+    for name in ("maxdict", "maxlist", "maxtuple", "maxset"):
+        setattr(limited, name, 20)
+    return truncate(limited.repr(value), limit)
+
+
+async def preview_body(request: Request, limit: int) -> str:
+    """Read at most ``limit`` bytes of the request body for logging.
+
+    Uses the body Starlette already buffered if there is one; otherwise reads
+    the stream only until the budget is spent instead of buffering it all.
+    """
+    body = getattr(request, "_body", None)
+    if body is not None:
+        return preview_value(body, limit)
+    content_length = request.headers.get("content-length")
+    chunks: List[bytes] = []
+    size = 0
+    try:
+        async for chunk in request.stream():
+            chunks.append(chunk[:limit - size])
+            size += len(chunks[-1])
+            if size >= limit:
+                break
+    except Exception:
+        return "<body unavailable>"
+    preview = b"".join(chunks).decode("utf-8", errors="replace")
+    if content_length and content_length.isdigit() and int(content_length) > size:
+        preview += f"... [{int(content_length) - size} more bytes]"
+    return preview
+
+
+class ErrorAggregator:
+    """Counts errors per fingerprint and decides when a full trace is worth logging."""
+
+    def __init__(self, max_fingerprints: int = 1000, trace_interval: float = 60.0,
+                 summary_interval: float = 60.0):
+        self.trace_interval = trace_interval
+        self.summary_interval = summary_interval
+        self._entries: LRUCache = LRUCache(maxsize=max_fingerprints)
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, exc: BaseException, scope: Dict[str, Any], message: str = "",
+               detail: str = "") -> Tuple[ErrorEntry, bool]:
+        """Count an occurrence; returns the entry and whether to log the full trace now.
+
+        ``detail`` refines the fingerprint beyond type and location, e.g. the
+        failing fields of a validation error.
+        """
+        error_type = type(exc).__name__
+        route = route_template(scope)
+        location = error_location(exc)
+        key = hashlib.sha1(f"{error_type}|{route}|{location}|{detail}".encode("utf-8")).hexdigest()[:12]
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = ErrorEntry(key, error_type, route, location, first_seen=now)
+                self._entries[key] = entry
+            entry.count += 1
+            entry.last_seen = now
+            entry.last_message = truncate(message or str(exc), 500)
+            log_trace = now - entry.last_trace_at >= self.trace_interval
+            if log_trace:
+                entry.last_trace_at = now
+        errors_total.inc((error_type, route))
+        return entry, log_trace
+
+    def snapshot(self, details: bool = False) -> List[Dict[str, Any]]:
+        """All tracked fingerprints, most frequent first.
+
+        Code locations and exception messages are only included with
+        ``details``; they are not for anonymous clients.
+        """
+        with self._lock:
+            entries = [asdict(entry) for entry in self._entries.values()]
+        for entry in entries:
+            del entry["reported"], entry["last_trace_at"]
+            if not details:
+                del entry["location"], entry["last_message"]
+        return sorted(entries, key=lambda entry: entry["count"], reverse=True)
+
+    def summarize(self) -> None:
+        """Log one line per fingerprint that occurred since the last summary."""
+        with self._lock:
+            changed = [(entry, entry.count - entry.reported) for entry in self._entries.values()
+                       if entry.count > entry.reported]
+            for entry, _ in changed:
+                entry.reported = entry.count
+        for entry, new in sorted(changed, key=lambda item: item[1], reverse=True):
+            logger.warning(f"{new}x {entry.type} at {entry.location} on {entry.route} "
+                           f"(total {entry.count}, fingerprint {entry.fingerprint}): {entry.last_message}")
+
+    async def _summarize_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.summary_interval)
+            self.summarize()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._summarize_periodically(), name="error-summary")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.summarize()
+
+
+@lru_cache(maxsize=None)
+def get_error_aggregator() -> ErrorAggregator:
+    """Return the process-wide error aggregator."""
+    return ErrorAggregator(
+        max_fingerprints=settings.ERROR_MAX_FINGERPRINTS,
+        trace_interval=settings.ERROR_TRACE_INTERVAL_SECONDS,
+        summary_interval=settings.ERROR_SUMMARY_INTERVAL_SECONDS,
+    )
+
+
+class ErrorCaptureMiddleware:
+    """Pure ASGI middleware answering unhandled exceptions with a 500 and aggregating them.
+
+    Added last, so it sits just inside ServerErrorMiddleware and sees every
+    exception the routes and other middlewares raise. The exception is not
+    re-raised, so the full traceback is only logged once per fingerprint per
+    ``trace_interval``, in debug mode too.
+    """
+
+    def __init__(self, app: ASGIApp, aggregator: Optional[ErrorAggregator] = None):
+        self.app = app
+        self.aggregator = aggregator
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal started
+            if message['type'] == 'http.response.start':
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            entry, log_trace = (self.aggregator or get_error_aggregator()).record(exc, scope)
+            if log_trace:
+                logger.critical(f"Unhandled exception: {exc} for {scope['method']} {scope['path']} "
+                                f"(fingerprint {entry.fingerprint}, seen {entry.count}x)", exc_info=True)
+            if started:
+                # Too late for a 500; the server closes the unfinished response
+                return
+            response = JSONResponse(status_code=500,
+                                    content={"detail": "An unexpected internal server error occurred."})
+            await response(scope, receive, send)
@@ -1,9 +1,12 @@
 from fastapi import Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from .config import settings
+from .error_capture import get_error_aggregator, preview_body, preview_value
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -21,32 +24,34 @@ async def request_validation_exception_handler(request: Request, exc: RequestVal
         field = ".".join(str(loc) for loc in error["loc"])
         message = error["msg"]
         error_messages.append(f"Field '{field}': {message}")
-    
-    logger.warning(f"RequestValidationError: {error_messages} for {request.method} {request.url.path} - Body: {await request.body()}")
+
+    # Fingerprint on the failing fields so distinct bad inputs are counted separately;
+    # list indexes and JSON decode offsets are left out to keep the key space small
+    fields = ",".join(sorted({".".join(str(loc) for loc in error["loc"] if not isinstance(loc, int))
+                              for error in exc.errors()}))
+    _, log_details = get_error_aggregator().record(exc, request.scope, str(error_messages), detail=fields)
+    if log_details:
+        # FastAPI keeps the parsed body on the exception; only fall back to reading the stream
+        limit = settings.ERROR_BODY_PREVIEW_BYTES
+        body = preview_value(exc.body, limit) if exc.body is not None else await preview_body(request, limit)
+        logger.warning(f"RequestValidationError: {error_messages} for {request.method} {request.url.path} - Body: {body}")
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={"detail": "Validation Error", "errors": exc.errors()},
+        content={"detail": "Validation Error", "errors": jsonable_encoder(exc.errors())},
     )
 
 async def pydantic_validation_exception_handler(request: Request, exc: ValidationError):
     logger.warning(f"Pydantic ValidationError: {exc.errors()} for {request.method} {request.url.path}")
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={"detail": "Pydantic Validation Error", "errors": exc.errors()},
-    )
-
-async def unhandled_exception_handler(request: Request, exc: Exception):
-    logger.critical(f"Unhandled exception: {exc} for {request.method} {request.url.path}", exc_info=True)
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={"detail": "An unexpected internal server error occurred."},
+        content={"detail": "Pydantic Validation Error", "errors": jsonable_encoder(exc.errors())},
     )
 
 def register_exception_handlers(app):
     app.add_exception_handler(StarletteHTTPException, http_exception_handler)
     app.add_exception_handler(RequestValidationError, request_validation_exception_handler)
     app.add_exception_handler(ValidationError, pydantic_validation_exception_handler)
-    app.add_exception_handler(Exception, unhandled_exception_handler)
+    # Unhandled exceptions are answered by ErrorCaptureMiddleware (app/core/error_capture.py)
     logger.info("Custom exception handlers registered.")
 
 # The registration function should be called in the main application setup (app/__init__.py)
\ No newline at end of file
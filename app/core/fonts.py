@@ -0,0 +1,182 @@
+"""
+Self-hosted web fonts: subsetting build step and the inline head markup.
+
+``build_fonts()`` subsets Inter and the Font Awesome icon fonts to the glyphs
+the site uses and writes them as WOFF2 to ``app/static/fonts`` together with
+``fonts.json``. ``font_head_html()`` turns that manifest into preload hints
+and a small inline stylesheet (``@font-face`` rules with ``font-display`` and
+the icon classes), so first paint needs no third-party request.
+"""
+from typing import Dict, Iterable, List, Optional, Set
+import json
+import logging
+import os
+import re
+
+from app.core.assets import STATIC_DIR, asset_url
+
+
+logger = logging.getLogger(__name__)
+
+FONTS_DIR = 'fonts'
+FONTS_MANIFEST = 'fonts.json'
+
+TEXT_FAMILY = 'Inter'
+TEXT_WEIGHTS = (300, 700)
+# Latin-1, Latin Extended-A and the typographic punctuation used in prose;
+# characters found in the rendered content are added on top
+BASE_TEXT_RANGES = ((0x0020, 0x007E), (0x00A0, 0x017F), (0x2010, 0x2027), (0x2030, 0x203A),
+                    (0x20AC, 0x20AC), (0x2122, 0x2122), (0x2190, 0x2193))
+
+ICON_STYLES = {
+    # CSS class -> (source font file, family, weight)
+    'fab': ('fa-brands-400.ttf', 'Font Awesome 6 Brands', 400),
+    'fas': ('fa-solid-900.ttf', 'Font Awesome 6 Free', 900),
+}
+ICON_ALIASES = {'fa-brands': 'fab', 'fa-solid': 'fas'}
+ICON_PATTERN = re.compile(r'\b(fab|fas|fa-brands|fa-solid)\s+fa-([a-z0-9-]+)')
+
+
+def find_icons(texts: Iterable[str]) -> Dict[str, Set[str]]:
+    """Collect the Font Awesome icons referenced as ``<style> fa-<name>`` classes."""
+    icons: Dict[str, Set[str]] = {style: set() for style in ICON_STYLES}
+    for text in texts:
+        for style, name in ICON_PATTERN.findall(text):
+            icons[ICON_ALIASES.get(style, style)].add(name)
+    return icons
+
+
+def _unicode_range(codepoints: Iterable[int]) -> str:
+    """Compress codepoints into a CSS ``unicode-range`` value."""
+    ranges = []
+    for cp in sorted(set(codepoints)):
+        if ranges and cp == ranges[-1][1] + 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    return ','.join(f'U+{start:04X}' if start == end else f'U+{start:04X}-{end:04X}' for start, end in ranges)
+
+
+def _save_woff2(font, codepoints: Iterable[int], target: str) -> Set[int]:
+    """Subset ``font`` in place, write it as WOFF2 and return the codepoints it covers."""
+    from fontTools import subset
+
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    options.name_IDs = ['*']
+    options.notdef_outline = True
+    options.hinting = False
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=list(codepoints))
+    subsetter.subset(font)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    font.flavor = 'woff2'
+    font.save(target)
+    return set(font.getBestCmap())
+
+
+def build_fonts(text_source: str, icon_source_dir: Optional[str], texts: Iterable[str] = (),
+                static_dir: str = STATIC_DIR) -> Dict[str, object]:
+    """Subset the text and icon fonts and write them with ``fonts.json`` to ``<static_dir>/fonts``.
+
+    Args:
+        text_source: Path to the Inter font (static or variable, TTF/OTF/WOFF2).
+        icon_source_dir: Directory holding the Font Awesome webfonts, or None to skip icons.
+        texts: Rendered pages and templates; used for extra text glyphs and to find icons.
+    """
+    # Imported here so serving pages never pays for loading fontTools
+    try:
+        from fontTools.ttLib import TTFont
+        from fontTools.varLib import instancer
+    except ImportError:
+        raise RuntimeError("fontTools is required to build fonts (pip install fonttools)") from None
+    texts = list(texts)
+    out_dir = os.path.join(static_dir, FONTS_DIR)
+    if os.path.isdir(out_dir):
+        for name in os.listdir(out_dir):
+            if name.endswith('.woff2') or name == FONTS_MANIFEST:
+                os.remove(os.path.join(out_dir, name))
+    faces: List[Dict[str, object]] = []
+
+    codepoints = {cp for start, end in BASE_TEXT_RANGES for cp in range(start, end + 1)}
+    codepoints.update(ord(ch) for text in texts for ch in text if ch.isprintable())
+    font = TTFont(text_source)
+    if 'fvar' in font:
+        axes = {axis.axisTag: axis for axis in font['fvar'].axes}
+        limits = {}
+        if 'wght' in axes:
+            limits['wght'] = (max(TEXT_WEIGHTS[0], axes['wght'].minValue), min(TEXT_WEIGHTS[1], axes['wght'].maxValue))
+        for tag, axis in axes.items():
+            if tag != 'wght':
+                limits[tag] = axis.defaultValue
+        font = instancer.instantiateVariableFont(font, limits)
+    if 'fvar' in font:
+        wght = next(axis for axis in font['fvar'].axes if axis.axisTag == 'wght')
+        weight = f'{int(wght.minValue)} {int(wght.maxValue)}'
+    else:
+        weight = str(font['OS/2'].usWeightClass)
+    covered = _save_woff2(font, codepoints, os.path.join(out_dir, 'inter.woff2'))
+    faces.append({'family': TEXT_FAMILY, 'file': f'{FONTS_DIR}/inter.woff2', 'weight': weight,
+                  'display': 'swap', 'preload': True, 'unicode_range': _unicode_range(covered)})
+
+    icons: Dict[str, Dict[str, str]] = {}
+    if icon_source_dir:
+        for style, names in find_icons(texts).items():
+            if not names:
+                continue
+            source_file, family, weight = ICON_STYLES[style]
+            font = TTFont(os.path.join(icon_source_dir, source_file))
+            # Glyphs are also mapped to emoji codepoints; the Private Use Area one is canonical
+            by_name: Dict[str, int] = {}
+            for cp, glyph in sorted(font.getBestCmap().items(), key=lambda item: not 0xE000 <= item[0] <= 0xF8FF):
+                by_name.setdefault(glyph, cp)
+            missing = sorted(name for name in names if name not in by_name)
+            if missing:
+                logger.warning(f"Icons not found in {source_file}: {', '.join(missing)}")
+            found = {name: by_name[name] for name in sorted(names) if name in by_name}
+            if not found:
+                continue
+            file = f'{FONTS_DIR}/{os.path.splitext(source_file)[0]}.woff2'
+            _save_woff2(font, found.values(), os.path.join(static_dir, file))
+            # Icons have no meaningful fallback glyph, so hide them until the font is ready
+            faces.append({'family': family, 'file': file, 'weight': str(weight), 'display': 'block', 'preload': False})
+            icons[style] = {name: f'{cp:x}' for name, cp in found.items()}
+
+    manifest = {'faces': faces, 'icons': icons}
+    with open(os.path.join(out_dir, FONTS_MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def font_head_html(static_dir: str = STATIC_DIR) -> str:
+    """Preload links and inline CSS for the self-hosted fonts; empty if they were not built."""
+    path = os.path.join(static_dir, FONTS_DIR, FONTS_MANIFEST)
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        logger.info(f"No font manifest at {path}; using system fonts. Run scripts/build_fonts.py to build it.")
+        return ''
+
+    links = []
+    rules = []
+    for face in manifest['faces']:
+        url = asset_url(face['file'])
+        if face.get('preload'):
+            links.append(f'<link rel="preload" href="{url}" as="font" type="font/woff2" crossorigin>')
+        unicode_range = f"unicode-range:{face['unicode_range']};" if face.get('unicode_range') else ''
+        rules.append(
+            f"@font-face{{font-family:'{face['family']}';font-style:normal;font-weight:{face['weight']};"
+            f"font-display:{face['display']};src:url({url}) format('woff2');{unicode_range}}}"
+        )
+    icons = manifest.get('icons') or {}
+    if icons:
+        rules.append(','.join(f'.{style}' for style in icons)
+                     + '{display:inline-block;font-style:normal;font-variant:normal;line-height:1;'
+                       'text-rendering:auto;-webkit-font-smoothing:antialiased}')
+        for style, glyphs in icons.items():
+            _, family, weight = ICON_STYLES[style]
+            rules.append(f".{style}{{font-family:'{family}';font-weight:{weight}}}")
+            rules.extend(f'.fa-{name}:before{{content:"\\{cp}"}}' for name, cp in glyphs.items())
+    return ''.join(links) + f'<style>{"".join(rules)}</style>'
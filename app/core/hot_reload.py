@@ -0,0 +1,200 @@
+"""
+Hot reload of settings and portfolio content.
+
+``HotReloader`` watches ``.env`` and ``PORTFOLIO_CONTENT_PATH`` (inotify via
+watchfiles when installed, else by polling ``stat``). A changed file is parsed
+off the event loop into a complete snapshot, which is then swapped in as one
+step:
+
+- settings: the changed ``RELOADABLE_SETTINGS`` are copied onto ``settings``
+  together, ``current_settings()`` starts returning a new immutable snapshot
+  and only the caches registered for those fields are invalidated;
+- content: the store replaces the whole portfolio in one write, and the
+  version bump invalidates every cache keyed on it.
+
+Renders take one ``current_settings()`` snapshot up front, so a request in
+flight during a swap is served entirely from the old values. A file that
+fails to parse is logged and the running values are kept.
+"""
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+import asyncio
+import logging
+import os
+
+from dotenv import dotenv_values
+
+from .config import RELOADABLE_SETTINGS, Settings, settings
+
+try:
+    import watchfiles
+except ImportError:  # pragma: no cover - falls back to polling
+    watchfiles = None
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[str], Awaitable[None]]
+
+_snapshot: Settings = settings.model_copy()
+_listeners: List[Tuple[FrozenSet[str], Callable[[], None]]] = []
+
+
+def current_settings() -> Settings:
+    """Snapshot of the settings; a reload publishes a new one instead of mutating it."""
+    return _snapshot
+
+
+def on_settings_change(fields: Iterable[str], callback: Callable[[], None]) -> None:
+    """Call ``callback`` on the event loop after a reload changes any of ``fields``."""
+    _listeners.append((frozenset(fields), callback))
+
+
+def read_env_file(path: str) -> Settings:
+    """Build settings with the values in ``path`` taking precedence (blocking).
+
+    main.py loaded the file into ``os.environ`` at startup, so a plain
+    ``Settings()`` would still see the old values; passing the file's values
+    as arguments makes them win.
+    """
+    values = {key.upper(): value for key, value in dotenv_values(path).items() if value is not None}
+    return Settings(**{name: value for name, value in values.items() if name in Settings.model_fields})
+
+
+def apply_settings(new: Settings) -> Set[str]:
+    """Swap the reloadable fields of ``new`` in and return the names that changed.
+
+    Runs on the event loop, so no coroutine sees the fields half-updated.
+    """
+    global _snapshot
+    changed = {name for name in RELOADABLE_SETTINGS if getattr(new, name) != getattr(settings, name)}
+    ignored = sorted(name for name in Settings.model_fields
+                     if name not in RELOADABLE_SETTINGS and getattr(new, name) != getattr(settings, name))
+    if ignored:
+        logger.warning(f"Settings changed but need a restart to take effect: {', '.join(ignored)}")
+    if not changed:
+        return changed
+    settings.__dict__.update({name: getattr(new, name) for name in changed})
+    _snapshot = settings.model_copy()
+    for fields, callback in _listeners:
+        if fields & changed:
+            callback()
+    logger.info(f"Reloaded settings: {', '.join(sorted(changed))}")
+    return changed
+
+
+async def reload_settings(path: str) -> None:
+    if not os.path.exists(path):
+        logger.warning(f"{path} was removed; keeping the current settings")
+        return
+    apply_settings(await asyncio.to_thread(read_env_file, path))
+
+
+async def reload_content(path: str) -> None:
+    from app.services.portfolio_content import load_content
+    from app.services.portfolio_service import get_portfolio_service
+    if not os.path.exists(path):
+        logger.warning(f"{path} was removed; keeping the current portfolio content")
+        return
+    content = await asyncio.to_thread(load_content, path)
+    await asyncio.to_thread(get_portfolio_service().apply_content, content)
+
+
+class HotReloader:
+    """Runs an async handler for each watched file that changes."""
+
+    def __init__(self, handlers: Dict[str, Handler], enabled: bool = True,
+                 force_polling: bool = False, poll_interval: float = 1.0):
+        self.handlers = {os.path.abspath(path): handler for path, handler in handlers.items()}
+        self.enabled = enabled
+        self.force_polling = force_polling
+        self.poll_interval = poll_interval
+        self._task: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def uses_inotify(self) -> bool:
+        # watchfiles cannot watch a directory that does not exist (yet)
+        return (watchfiles is not None and not self.force_polling
+                and all(os.path.isdir(os.path.dirname(path)) for path in self.handlers))
+
+    async def _dispatch(self, paths: Iterable[str]) -> None:
+        for path in sorted(paths):
+            try:
+                await self.handlers[path](path)
+            except ValueError as e:
+                logger.error(f"Ignoring invalid {path}: {e}")
+            except Exception:
+                logger.exception(f"Reloading {path} failed")
+
+    async def _watch(self) -> None:
+        directories = sorted({os.path.dirname(path) for path in self.handlers})
+        async for changes in watchfiles.awatch(
+            *directories, recursive=False, stop_event=self._stop,
+            watch_filter=lambda change, path: os.path.abspath(path) in self.handlers,
+        ):
+            await self._dispatch({os.path.abspath(path) for _, path in changes})
+
+    @staticmethod
+    def _signature(path: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    async def _poll(self) -> None:
+        signatures = {path: self._signature(path) for path in self.handlers}
+        while True:
+            try:
+                await asyncio.wait_for(self._stop.wait(), self.poll_interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            changed = []
+            for path in self.handlers:
+                signature = self._signature(path)
+                if signature != signatures[path]:
+                    signatures[path] = signature
+                    changed.append(path)
+            if changed:
+                await self._dispatch(changed)
+
+    async def start(self) -> None:
+        if not self.enabled or self.running:
+            return
+        self._stop = asyncio.Event()
+        if self.uses_inotify:
+            self._task = asyncio.create_task(self._watch(), name="hot-reload")
+            logger.info(f"Hot reload watching {', '.join(sorted(self.handlers))}")
+        else:
+            self._task = asyncio.create_task(self._poll(), name="hot-reload")
+            logger.info(f"Hot reload polling {', '.join(sorted(self.handlers))} every {self.poll_interval}s")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            # Both loops end on the event; watchfiles checks it every 50ms,
+            # while cancelling awatch would leave its thread blocked until exit
+            self._stop.set()
+            try:
+                await asyncio.wait_for(self._task, timeout=2)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+            self._task = None
+
+
+@lru_cache(maxsize=None)
+def get_hot_reloader() -> HotReloader:
+    """Return the process-wide reloader for ``.env`` and the portfolio content file."""
+    handlers: Dict[str, Handler] = {Settings.model_config.get("env_file") or ".env": reload_settings}
+    if settings.PORTFOLIO_CONTENT_PATH:
+        handlers[settings.PORTFOLIO_CONTENT_PATH] = reload_content
+    return HotReloader(
+        handlers,
+        enabled=settings.HOT_RELOAD,
+        force_polling=settings.HOT_RELOAD_FORCE_POLLING,
+        poll_interval=settings.HOT_RELOAD_POLL_INTERVAL_SECONDS,
+    )
@@ -0,0 +1,29 @@
+"""
+Helpers for HTTP validators (ETag / Last-Modified) and conditional requests.
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Request
+
+
+def make_etag(version: int, body: bytes) -> str:
+    """Build a strong ETag from a content version and the encoded body."""
+    return f'"{version}-{hashlib.sha1(body).hexdigest()[:16]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return True if an ``If-None-Match`` header value matches the given ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(','))
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[str] = None) -> bool:
+    """Evaluate the request's conditional headers against the current validators."""
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    return last_modified is not None and request.headers.get('if-modified-since') == last_modified
@@ -0,0 +1,184 @@
+"""
+Responsive image derivatives for static images.
+
+``ImagePipeline`` resizes a source image under ``app/static`` to several
+widths in WebP and JPEG and caches the results in ``app/static/dist/images``
+under names derived from the source's content hash, so variants are only
+rebuilt when the source changes and can be served as immutable. Originals
+stay available under ``/static/<path>``.
+"""
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from app.core.assets import DIST_DIR, IMAGES_DIR, STATIC_DIR, STATIC_URL
+from app.core.config import settings
+from app.core.startup import component
+
+try:
+    import PIL  # Pillow itself is only imported when variants have to be generated
+except ImportError:  # Pillow is optional; pages then reference the originals
+    PIL = None
+
+logger = logging.getLogger(__name__)
+
+RASTER_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp', '.tiff'}
+DEFAULT_WIDTHS = (256, 384, 512, 768, 1024)
+HASH_LENGTH = 12
+
+
+class ResponsiveImage(NamedTuple):
+    """URLs and intrinsic size of an image's derivatives."""
+    src: str
+    jpeg_srcset: str
+    webp_srcset: str
+    width: int
+    height: int
+
+
+class ImagePipeline:
+    """Builds and caches resized WebP/JPEG variants of static images."""
+
+    def __init__(self, static_dir: str = STATIC_DIR, widths: Sequence[int] = DEFAULT_WIDTHS,
+                 webp_quality: int = 80, jpeg_quality: int = 82, url_prefix: str = STATIC_URL):
+        self.static_dir = os.path.realpath(static_dir)
+        self.cache_dir = os.path.join(self.static_dir, IMAGES_DIR)
+        self.widths = tuple(sorted(set(widths)))
+        self.webp_quality = webp_quality
+        self.jpeg_quality = jpeg_quality
+        self.url_prefix = url_prefix.rstrip('/')
+        # path -> ((size, mtime_ns), image) so unchanged sources are not re-hashed
+        self._entries: Dict[str, Tuple[Tuple[int, int], Optional[ResponsiveImage]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return PIL is not None
+
+    def _url(self, relative: str) -> str:
+        return f'{self.url_prefix}/{relative}'
+
+    def get(self, path: str) -> Optional[ResponsiveImage]:
+        """Return the derivatives of ``path`` (relative to the static dir), building them if needed.
+
+        Returns None if the source does not exist, is not a raster image or
+        Pillow is not installed.
+        """
+        path = path.lstrip('/')
+        if not self.enabled or os.path.splitext(path)[1].lower() not in RASTER_EXTENSIONS:
+            return None
+        source = os.path.join(self.static_dir, path)
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return None
+        signature = (stat.st_size, stat.st_mtime_ns)
+        cached = self._entries.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is None or cached[0] != signature:
+                try:
+                    image = self._build(path, source)
+                except Exception as e:
+                    logger.error(f"Could not build image variants for {path}: {e}")
+                    image = None
+                cached = (signature, image)
+                self._entries[path] = cached
+        return cached[1]
+
+    def _build(self, path: str, source: str) -> ResponsiveImage:
+        with open(source, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:HASH_LENGTH]
+        stem = os.path.splitext(path)[0]
+        prefix = f'{stem}.{digest}'
+        meta_path = os.path.join(self.cache_dir, f'{prefix}.json')
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = None
+        if meta is None or meta.get('requested') != list(self.widths):
+            meta = self._generate(source, prefix, meta_path)
+
+        def srcset(ext: str) -> str:
+            return ', '.join(f"{self._url(f'{IMAGES_DIR}/{prefix}.{w}w.{ext}')} {w}w" for w in meta['widths'])
+
+        largest = meta['widths'][-1]
+        return ResponsiveImage(
+            src=self._url(f'{IMAGES_DIR}/{prefix}.{largest}w.jpg'),
+            jpeg_srcset=srcset('jpg'),
+            webp_srcset=srcset('webp'),
+            width=meta['width'],
+            height=meta['height'],
+        )
+
+    def _generate(self, source: str, prefix: str, meta_path: str) -> Dict[str, object]:
+        from PIL import Image, ImageOps
+
+        with Image.open(source) as original:
+            image = ImageOps.exif_transpose(original)
+            image.load()
+        width, height = image.size
+        # Never upscale: keep the configured widths below the original plus the original itself
+        widths: List[int] = [w for w in self.widths if w < width]
+        if not widths or width <= self.widths[-1]:
+            widths.append(width)
+        has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        for w in widths:
+            h = max(1, round(height * w / width))
+            resized = image if w == width else image.resize((w, h), Image.LANCZOS)
+            webp = resized.convert('RGBA' if has_alpha else 'RGB')
+            self._save(webp, f'{prefix}.{w}w.webp', 'WEBP', quality=self.webp_quality, method=6)
+            jpeg = resized.convert('RGBA' if has_alpha else 'RGB')
+            if has_alpha:
+                background = Image.new('RGB', jpeg.size, (255, 255, 255))
+                background.paste(jpeg, mask=jpeg.getchannel('A'))
+                jpeg = background
+            self._save(jpeg, f'{prefix}.{w}w.jpg', 'JPEG', quality=self.jpeg_quality,
+                       optimize=True, progressive=True)
+        meta = {'width': width, 'height': height, 'widths': widths, 'requested': list(self.widths)}
+        self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        logger.info(f"Built {len(widths)} image variants for {os.path.relpath(source, self.static_dir)}")
+        return meta
+
+    def _save(self, image, name: str, fmt: str, **options) -> None:
+        target = os.path.join(self.cache_dir, name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp = f'{target}.{os.getpid()}.tmp'
+        image.save(tmp, fmt, **options)
+        os.replace(tmp, target)
+
+    @staticmethod
+    def _write_atomic(target: str, data: bytes) -> None:
+        tmp = f'{target}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, target)
+
+    def build_all(self) -> int:
+        """Build variants for every raster image under the static dir; returns how many."""
+        dist_dir = os.path.join(self.static_dir, DIST_DIR)
+        count = 0
+        for root, dirs, files in os.walk(self.static_dir):
+            dirs[:] = [d for d in dirs if os.path.join(root, d) != dist_dir]
+            for name in files:
+                path = os.path.relpath(os.path.join(root, name), self.static_dir).replace(os.sep, '/')
+                if self.get(path) is not None:
+                    count += 1
+        return count
+
+
+@component("image pipeline")
+def get_image_pipeline() -> ImagePipeline:
+    """Return the process-wide image pipeline configured from settings."""
+    return ImagePipeline(
+        widths=settings.IMAGE_VARIANT_WIDTHS,
+        webp_quality=settings.IMAGE_WEBP_QUALITY,
+        jpeg_quality=settings.IMAGE_JPEG_QUALITY,
+    )
@@ -1,33 +1,310 @@
+import atexit
+import gzip
+import json
 import logging
+import os
+import queue
+import shutil
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, RotatingFileHandler
+from typing import Dict, List, Optional, Sequence
+
+from .config import settings
 
 # Define log format
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(funcName)s:%(lineno)d - %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-# Create a custom logger
-logger = logging.getLogger("app")
-logger.setLevel(logging.INFO) # Default level, can be overridden by config
+# Attributes every LogRecord has; anything else was passed via ``extra=``
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "sampled"}
 
-# Create handlers
-console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
 
-# File handler (optional, but good for production)
-# Creates a logs directory if it doesn't exist
-import os
-if not os.path.exists('logs'):
-    os.makedirs('logs')
-file_handler = RotatingFileHandler('logs/app.log', maxBytes=1024*1024*5, backupCount=5, encoding='utf-8') # 5MB per file, 5 backup files
-file_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
+class JsonFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects, including ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "func": record.funcName,
+            "line": record.lineno,
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and key not in entry:
+                entry[key] = value
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def create_formatter() -> logging.Formatter:
+    if settings.LOG_JSON:
+        return JsonFormatter()
+    return logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+
+class SamplingFilter(logging.Filter):
+    """Per-logger sampling that keeps error storms from flooding the log pipeline.
+
+    Each logger may emit ``burst`` records per second; beyond that only every
+    ``keep_every``-th record passes until the next second. Optional static
+    ``rates`` keep a fixed fraction of a logger's records (matched by name
+    prefix). The next record that passes is annotated with the number of
+    records dropped since. The decision is stored on the record, so one
+    filter instance can be shared by several handlers.
+    """
+
+    def __init__(self, burst: int = 100, keep_every: int = 100, rates: Optional[Dict[str, float]] = None):
+        super().__init__()
+        self.burst = burst
+        self.keep_every = max(1, keep_every)
+        self.rates = sorted((rates or {}).items(), key=lambda item: -len(item[0]))
+        self._windows: Dict[str, List[float]] = {}  # logger -> [window start, count, dropped]
+        self._lock = threading.Lock()
+
+    def _rate(self, name: str) -> float:
+        for prefix, rate in self.rates:
+            if name == prefix or name.startswith(prefix + "."):
+                return rate
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        decided = getattr(record, "sampled", None)
+        if decided is not None:
+            return decided
+        record.sampled = self._decide(record)
+        return record.sampled
+
+    def _decide(self, record: logging.LogRecord) -> bool:
+        rate = self._rate(record.name)
+        with self._lock:
+            window = self._windows.get(record.name)
+            now = record.created
+            if window is None or now - window[0] >= 1.0:
+                dropped = window[2] if window else 0
+                window = self._windows[record.name] = [now, 0, dropped]
+            window[1] += 1
+            count = window[1]
+            keep = count <= self.burst or (count - self.burst) % self.keep_every == 0
+            if keep and rate < 1.0:
+                # Deterministic 1-in-N sampling keeps the kept fraction exact
+                keep = int(count * rate) != int((count - 1) * rate)
+            if not keep:
+                window[2] += 1
+                return False
+            dropped = int(window[2])
+            window[2] = 0
+        if dropped:
+            record.msg = f"{record.getMessage()} [{dropped} similar records sampled out]"
+            record.args = None
+            record.sampled_out = dropped
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks the caller; records are dropped if the queue is full."""
+
+    dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only resolve the message here; formatting happens on the listener thread.
+        # Resolving in place is equivalent for any other handler, so skip the copy
+        record.msg = record.getMessage()
+        record.args = None
+        record.stack_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            NonBlockingQueueHandler.dropped += 1
+
+
+class BatchStreamHandler(logging.StreamHandler):
+    """StreamHandler that can write a batch of records with one write and flush."""
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        try:
+            self.stream.write("".join(self.format(record) + self.terminator for record in records))
+            self.flush()
+        except Exception:
+            self.handleError(records[-1])
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
 
-# Add handlers to the logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+class GzipRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that gzips rotated segments and writes records in batches."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.namer = lambda name: name + ".gz"
+        self.rotator = _gzip_rotator
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        try:
+            data = "".join(self.format(record) + self.terminator for record in records)
+            if self.stream is None:
+                self.stream = self._open()
+            # tell() is a byte offset, so compare it with the encoded size, not the character count
+            size = len(data.encode(self.encoding or "utf-8"))
+            if self.maxBytes > 0 and self.stream.tell() + size >= self.maxBytes and self.stream.tell() > 0:
+                self.doRollover()
+            self.stream.write(data)
+            self.flush()
+        except Exception:
+            self.handleError(records[-1])
+
+
+class BatchingQueueListener:
+    """Background thread that drains the log queue and hands records to handlers in batches.
+
+    Handlers with ``emit_batch`` receive each batch in one call, so a burst
+    of records costs one write and one flush per handler; rotation and
+    compression also run here, never on the event loop.
+    """
+
+    _sentinel = None
+
+    def __init__(self, log_queue: queue.Queue, handlers: Sequence[logging.Handler],
+                 batch_size: int = 256, flush_interval: float = 0.5):
+        self.queue = log_queue
+        self.handlers = list(handlers)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="log-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Flush pending records and stop the thread."""
+        if self._thread is None:
+            return
+        self.queue.put(self._sentinel)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            record = self.queue.get()
+            if record is self._sentinel:
+                break
+            batch = [record]
+            # Give a burst a moment to accumulate so it is written in one go
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    record = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if record is self._sentinel:
+                    stopping = True
+                    break
+                batch.append(record)
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[logging.LogRecord]) -> None:
+        for handler in self.handlers:
+            records = [r for r in batch if r.levelno >= handler.level and handler.filter(r)]
+            if not records:
+                continue
+            emit_batch = getattr(handler, "emit_batch", None)
+            if emit_batch is None:
+                for record in records:
+                    handler.handle(record)
+                continue
+            handler.acquire()
+            try:
+                emit_batch(records)
+            finally:
+                handler.release()
+
+
+def log_file_path() -> str:
+    """``LOG_FILE``, suffixed with ``WORKER_INDEX`` when serve.py runs several workers.
+
+    Rotating one file from several processes loses records (a rotating
+    worker unlinks the file the others still write to), so each worker
+    writes and rotates its own.
+    """
+    index = os.getenv("WORKER_INDEX")
+    if not index:
+        return settings.LOG_FILE
+    root, ext = os.path.splitext(settings.LOG_FILE)
+    return f"{root}.{index}{ext}"
+
+
+def _create_handlers(batching: bool) -> List[logging.Handler]:
+    formatter = create_formatter()
+    stream_cls = BatchStreamHandler if batching else logging.StreamHandler
+    console_handler = stream_cls(sys.stdout)
+    console_handler.setFormatter(formatter)
+
+    # File handler (optional, but good for production)
+    # Creates a logs directory if it doesn't exist
+    log_file = log_file_path()
+    log_dir = os.path.dirname(log_file)
+    if log_dir and not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+    file_handler = GzipRotatingFileHandler(log_file, maxBytes=settings.LOG_MAX_BYTES,
+                                           backupCount=settings.LOG_BACKUP_COUNT, encoding='utf-8',
+                                           delay=True)  # opened on the first record, not at import
+    file_handler.setFormatter(formatter)
+    return [console_handler, file_handler]
+
+
+def configure_logging(target: logging.Logger) -> Optional[BatchingQueueListener]:
+    """Attach handlers to ``target`` according to ``LOG_MODE``.
+
+    In ``sync`` mode records are written by the calling thread. In ``queue``
+    mode the logger only enqueues and a ``BatchingQueueListener`` thread does
+    the formatting and I/O; that listener is returned, and ``target`` stops
+    propagating to the root logger.
+    """
+    sampling = SamplingFilter(settings.LOG_SAMPLE_BURST, settings.LOG_SAMPLE_KEEP_EVERY, settings.LOG_SAMPLE_RATES)
+    if settings.LOG_MODE != "queue":
+        for handler in _create_handlers(batching=False):
+            handler.addFilter(sampling)
+            target.addHandler(handler)
+        return None
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(sampling)
+    target.addHandler(queue_handler)
+    # Root's handlers (main.py's basicConfig) would write the same records synchronously
+    target.propagate = False
+    listener = BatchingQueueListener(log_queue, _create_handlers(batching=True),
+                                     batch_size=settings.LOG_BATCH_SIZE,
+                                     flush_interval=settings.LOG_FLUSH_INTERVAL_SECONDS)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+# Create a custom logger
+logger = logging.getLogger("app")
+logger.setLevel(logging.INFO) # Default level, can be overridden by config
+listener = configure_logging(logger)
 
 def get_logger(name: str) -> logging.Logger:
     """Returns a logger instance with the specified name, inheriting base config."""
     return logging.getLogger(name)
 
-# End of logging configuration
\ No newline at end of file
+# End of logging configuration.
@@ -0,0 +1,71 @@
+"""
+Event-loop lag sampler.
+
+A background task sleeps for a fixed interval and records how much later
+than requested it woke up. That overshoot is the time the loop spent on
+other callbacks, i.e. how long any request would have waited to be served.
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, Optional
+import asyncio
+import logging
+import time
+
+from .config import settings
+from .metrics import registry
+
+logger = logging.getLogger(__name__)
+
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+loop_lag = registry.histogram('event_loop_lag_seconds', 'Delay of the event loop in waking the lag sampler.',
+                              buckets=LAG_BUCKETS)
+
+
+class LoopLagMonitor:
+    """Keeps the last ``window`` lag samples taken every ``interval`` seconds."""
+
+    def __init__(self, interval: float = 0.5, window: int = 120):
+        self.interval = interval
+        self.samples: Deque[float] = deque(maxlen=window)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _sample(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - start - self.interval)
+            self.samples.append(lag)
+            loop_lag.observe(lag)
+
+    def percentiles(self) -> Dict[str, float]:
+        """p50/p95/p99/max lag in seconds over the sample window (zeros before the first sample)."""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+        def pick(q: float) -> float:
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+        return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": ordered[-1]}
+
+    async def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._sample(), name="loop-lag-monitor")
+            logger.info(f"Event-loop lag monitor started (every {self.interval}s)")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+@lru_cache(maxsize=None)
+def get_loop_monitor() -> LoopLagMonitor:
+    """Return the process-wide event-loop lag monitor."""
+    return LoopLagMonitor(interval=settings.LOOP_LAG_INTERVAL_SECONDS, window=settings.LOOP_LAG_WINDOW)
@@ -0,0 +1,133 @@
+"""
+In-process rate limiting and duplicate suppression.
+"""
+from typing import Any, Hashable, Iterable, Mapping, NamedTuple, Optional
+import hashlib
+import threading
+import time
+
+from cachetools import TTLCache
+
+
+class Bucket(NamedTuple):
+    tokens: float
+    updated_at: float
+
+
+class TokenBucketLimiter:
+    """Token buckets per key (client IP, NiceGUI client id, ...).
+
+    Each key may spend ``capacity`` requests in a burst and regains
+    ``refill_rate`` tokens per second. Buckets live in a size-bounded TTL
+    cache, so idle keys expire once they would be full again and a flood of
+    distinct keys evicts the least recently used ones instead of growing memory.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float, max_keys: int = 10_000):
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        ttl = self.capacity / self.refill_rate if self.refill_rate > 0 else 24 * 3600
+        self._buckets: TTLCache = TTLCache(maxsize=max_keys, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def _refill(self, bucket: Optional[Bucket], now: float) -> float:
+        if bucket is None:
+            return self.capacity
+        return min(self.capacity, bucket.tokens + (now - bucket.updated_at) * self.refill_rate)
+
+    def acquire(self, key: Hashable, cost: float = 1.0) -> float:
+        """Spend ``cost`` tokens for ``key``.
+
+        Returns 0 if the request is allowed, otherwise the number of seconds
+        until enough tokens are available again.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens = self._refill(self._buckets.get(key), now)
+            if tokens >= cost:
+                self._buckets[key] = Bucket(tokens - cost, now)
+                return 0.0
+            self._buckets[key] = Bucket(tokens, now)
+        if self.refill_rate <= 0:
+            return float('inf')
+        return (cost - tokens) / self.refill_rate
+
+    def refund(self, key: Hashable, cost: float = 1.0) -> None:
+        """Give back tokens spent by ``acquire()`` for a request that was not carried out."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                self._buckets[key] = Bucket(min(self.capacity, self._refill(bucket, now) + cost), now)
+
+    def reset(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._buckets.clear()
+            else:
+                self._buckets.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class DuplicateFilter:
+    """Remembers content hashes for ``ttl`` seconds to drop repeated submissions."""
+
+    def __init__(self, ttl: float, max_entries: int = 10_000):
+        self._seen: TTLCache = TTLCache(maxsize=max_entries, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(parts: Iterable[str]) -> bytes:
+        """Hash the given fields, ignoring case and whitespace differences."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(' '.join(part.lower().split()).encode('utf-8'))
+            digest.update(b'\x00')
+        return digest.digest()
+
+    def seen(self, fingerprint: bytes) -> bool:
+        """Return True if the fingerprint was seen within the TTL, recording it otherwise."""
+        with self._lock:
+            if fingerprint in self._seen:
+                return True
+            self._seen[fingerprint] = True
+            return False
+
+    def forget(self, fingerprint: bytes) -> None:
+        """Drop a recorded fingerprint, e.g. when its submission was not accepted after all."""
+        with self._lock:
+            self._seen.pop(fingerprint, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._seen.clear()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+
+def client_ip(scope: Mapping[str, Any], trust_forwarded: bool = False, header: Optional[str] = None) -> Optional[str]:
+    """Return the client address of an ASGI scope.
+
+    ``header`` names a request header set by the proxy in front (e.g.
+    ``Fly-Client-IP``) and wins when present. With ``trust_forwarded`` the
+    first ``X-Forwarded-For`` entry is used next; only enable that behind a
+    proxy which overwrites the header, as the client can set its first entry.
+    """
+    if header:
+        name = header.lower().encode('latin-1')
+        for key, value in scope.get('headers') or ():
+            if key == name:
+                address = value.decode('latin-1').strip()
+                if address:
+                    return address
+    if trust_forwarded:
+        for name, value in scope.get('headers') or ():
+            if name == b'x-forwarded-for':
+                forwarded = value.decode('latin-1').split(',')[0].strip()
+                if forwarded:
+                    return forwarded
+    client = scope.get('client')
+    return client[0] if client else None
@@ -0,0 +1,317 @@
+"""
+Opt-in in-process cache for GET responses.
+
+Routes opt in with ``@cache_response(ttl, stale_while_revalidate, vary)``
+(put it below the router decorator). With ``RESPONSE_CACHE=true`` the pure
+ASGI ``ResponseCacheMiddleware`` then keeps their 200 responses in a
+size-bounded LRU, keyed by path, query string and the ``vary`` request
+headers:
+
+- fresh (younger than ``ttl``): served from memory without running the route;
+- stale (within ``stale_while_revalidate`` after that): served from memory
+  while one background request refreshes the entry;
+- older, or evicted: the route runs and its response is stored.
+
+Entries are dropped when the portfolio content version or the reloadable
+settings change, and by ``invalidate()``. Cached routes also get an
+``s-maxage``/``stale-while-revalidate`` Cache-Control so the edge can keep
+them too, while browsers still revalidate with the ETag.
+
+Hits, stale hits and misses are counted per route on ``/api/metrics``.
+"""
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Set, Tuple
+import asyncio
+import logging
+import time
+
+from cachetools import LRUCache
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import RELOADABLE_SETTINGS, settings
+from .hot_reload import on_settings_change
+from .http_cache import etag_matches
+from .metrics import registry, route_template
+
+logger = logging.getLogger(__name__)
+
+Headers = List[Tuple[bytes, bytes]]
+
+cache_requests = registry.counter(
+    'http_response_cache_total', 'Cacheable requests by route and result (hit, stale, miss).', ('route', 'result'))
+
+# Requests carrying credentials always reach the route (cookies are not checked:
+# cached routes must not read them, and responses setting one are not stored)
+PRIVATE_REQUEST_HEADERS = (b'authorization',)
+# Forwarded to the route on a miss would turn the response into a 304 that cannot be stored
+CONDITIONAL_HEADERS = (b'if-none-match', b'if-modified-since')
+# Per-entry bookkeeping counted against the size bound on top of the body
+ENTRY_OVERHEAD_BYTES = 512
+
+
+class CachePolicy(NamedTuple):
+    ttl: float
+    stale_while_revalidate: float
+    vary: Tuple[bytes, ...]
+    cache_control: Optional[str]
+
+
+class CachedResponse(NamedTuple):
+    status: int
+    headers: Headers
+    body: bytes
+    stored_at: float
+    etag: Optional[str]
+
+
+def cache_response(ttl: float, stale_while_revalidate: float = 0, vary: Iterable[str] = (),
+                   cache_control: Optional[str] = '') -> Callable:
+    """Declare the cache policy of a GET route.
+
+    ``cache_control`` replaces the route's Cache-Control header; the default
+    lets shared caches keep the response for ``ttl`` and browsers revalidate,
+    and ``None`` leaves the route's own header alone.
+    """
+    if cache_control == '':
+        cache_control = f'public, max-age=0, s-maxage={int(ttl)}'
+        if stale_while_revalidate:
+            cache_control += f', stale-while-revalidate={int(stale_while_revalidate)}'
+    policy = CachePolicy(ttl, stale_while_revalidate, tuple(name.lower().encode('latin-1') for name in vary),
+                         cache_control)
+
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.__response_cache__ = policy
+        return endpoint
+    return decorator
+
+
+def _header(headers: Headers, name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+class ResponseCache:
+    """LRU of encoded responses, bounded by their total size in bytes.
+
+    Only used from the event loop, so there are no locks. Every write
+    carries the generation it started in; responses computed before an
+    ``invalidate()`` are dropped instead of stored.
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int,
+                 version_source: Optional[Callable[[], Any]] = None):
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes - ENTRY_OVERHEAD_BYTES)
+        self._entries: LRUCache = LRUCache(maxsize=max_bytes, getsizeof=self._size)
+        self._version_source = version_source
+        self._version: Any = None
+        self.generation = 0
+
+    @staticmethod
+    def _size(entry: CachedResponse) -> int:
+        return len(entry.body) + ENTRY_OVERHEAD_BYTES
+
+    def get(self, key: Tuple) -> Optional[CachedResponse]:
+        if self._version_source is not None:
+            version = self._version_source()
+            if version != self._version:
+                self._version = version
+                self.invalidate()
+        return self._entries.get(key)
+
+    def put(self, key: Tuple, entry: CachedResponse, generation: int) -> None:
+        if generation == self.generation and len(entry.body) <= self.max_entry_bytes:
+            self._entries[key] = entry
+
+    def invalidate(self) -> None:
+        """Drop every entry, including responses still being computed."""
+        self.generation += 1
+        self._entries.clear()
+
+    @property
+    def size(self) -> int:
+        return self._entries.currsize
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _content_version() -> int:
+    from app.services.portfolio_service import get_portfolio_service
+    return get_portfolio_service().version
+
+
+@lru_cache(maxsize=None)
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, invalidated on content and settings changes."""
+    cache = ResponseCache(settings.RESPONSE_CACHE_MAX_BYTES, settings.RESPONSE_CACHE_MAX_ENTRY_BYTES,
+                          version_source=_content_version)
+    on_settings_change(RELOADABLE_SETTINGS, cache.invalidate)
+    registry.gauge('http_response_cache_bytes', 'Size of the cached responses.', callback=lambda: cache.size)
+    registry.gauge('http_response_cache_entries', 'Responses in the cache.', callback=lambda: len(cache))
+    return cache
+
+
+async def _empty_receive() -> Message:
+    return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+
+class ResponseCacheMiddleware:
+    """Pure ASGI middleware serving ``@cache_response`` routes from ``ResponseCache``.
+
+    Add it before ``MetricsMiddleware`` so cache hits are still recorded
+    under their route.
+    """
+
+    def __init__(self, app: ASGIApp, cache: Optional[ResponseCache] = None):
+        self.app = app
+        self.cache = cache or get_response_cache()
+        # path -> (route, policy); routes do not change once the app serves
+        self._routes: LRUCache = LRUCache(maxsize=1024)
+        self._refreshing: Set[Tuple] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _resolve(self, scope: Scope) -> Tuple[Any, Optional[CachePolicy]]:
+        path = scope['path']
+        if path in self._routes:
+            return self._routes[path]
+        resolved = (None, None)
+        router = getattr(scope.get('app'), 'router', None)
+        for route in getattr(router, 'routes', ()):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                resolved = (route, getattr(getattr(route, 'endpoint', None), '__response_cache__', None))
+                break
+        self._routes[path] = resolved
+        return resolved
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['method'] != 'GET':
+            await self.app(scope, receive, send)
+            return
+        route, policy = self._resolve(scope)
+        headers = scope['headers']
+        if policy is None or any(name in PRIVATE_REQUEST_HEADERS for name, _ in headers):
+            await self.app(scope, receive, send)
+            return
+
+        key = (scope['path'], scope['query_string'], tuple(_header(headers, name) for name in policy.vary))
+        label = route_template({'route': route})
+        entry = self.cache.get(key)
+        age = time.monotonic() - entry.stored_at if entry is not None else None
+        if entry is not None and age < policy.ttl:
+            result = 'hit'
+        elif entry is not None and age < policy.ttl + policy.stale_while_revalidate:
+            result = 'stale'
+            self._revalidate(scope, key, policy)
+        else:
+            cache_requests.inc((label, 'miss'))
+            await self._fetch(scope, receive, send, key, policy)
+            return
+        cache_requests.inc((label, result))
+        # The router does not run for a hit; tell the metrics middleware which route this was
+        scope['route'] = route
+        await self._send_cached(scope, send, entry, age, policy, result.upper().encode())
+
+    def _response_headers(self, headers: Headers, policy: CachePolicy, result: bytes) -> Headers:
+        replaced = {b'x-cache', b'age'}
+        if policy.cache_control is not None:
+            replaced.add(b'cache-control')
+        if policy.vary:
+            replaced.add(b'vary')
+        out = [(name, value) for name, value in headers if name.lower() not in replaced]
+        out.append((b'x-cache', result))
+        if policy.cache_control is not None:
+            out.append((b'cache-control', policy.cache_control.encode('latin-1')))
+        if policy.vary:
+            vary = {v.strip().lower() for v in (_header(headers, b'vary') or b'').split(b',') if v.strip()}
+            out.append((b'vary', b', '.join(sorted(vary | set(policy.vary)))))
+        return out
+
+    async def _send_cached(self, scope: Scope, send: Send, entry: CachedResponse, age: float,
+                           policy: CachePolicy, result: bytes) -> None:
+        headers = self._response_headers(entry.headers, policy, result)
+        headers.append((b'age', str(int(age)).encode()))
+        if_none_match = _header(scope['headers'], b'if-none-match')
+        if entry.etag and if_none_match is not None and etag_matches(if_none_match.decode('latin-1'), entry.etag):
+            headers = [(name, value) for name, value in headers if name not in (b'content-length', b'content-type')]
+            await send({'type': 'http.response.start', 'status': 304, 'headers': headers})
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+        await send({'type': 'http.response.start', 'status': entry.status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': entry.body})
+
+    async def _fetch(self, scope: Scope, receive: Receive, send: Send, key: Tuple, policy: CachePolicy) -> None:
+        """Run the route, passing its response through (streamed as produced) and storing it."""
+        generation = self.cache.generation
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        size = 0
+        storable = True
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, size, storable
+            if message['type'] == 'http.response.start':
+                start = message
+                storable = self._storable(message)
+                if storable:
+                    message = dict(message, headers=self._response_headers(
+                        list(message.get('headers', [])), policy, b'MISS'))
+            elif message['type'] == 'http.response.body' and storable:
+                body = message.get('body', b'')
+                size += len(body)
+                if size > self.cache.max_entry_bytes:
+                    storable = False
+                    chunks.clear()
+                else:
+                    chunks.append(body)
+                    if not message.get('more_body', False):
+                        self._store(key, start, b''.join(chunks), generation)
+            await send(message)
+
+        # A conditional request could be answered with a 304 the cache cannot use
+        fetch_scope = dict(scope, headers=[(name, value) for name, value in scope['headers']
+                                           if name not in CONDITIONAL_HEADERS])
+        await self.app(fetch_scope, receive, send_wrapper)
+        for name in ('route', 'endpoint', 'path_params'):
+            if name in fetch_scope:
+                scope[name] = fetch_scope[name]
+
+    @staticmethod
+    def _storable(start: Message) -> bool:
+        if start['status'] != 200:
+            return False
+        headers = start.get('headers', [])
+        cache_control = (_header(headers, b'cache-control') or b'').lower()
+        return (_header(headers, b'set-cookie') is None
+                and b'no-store' not in cache_control and b'private' not in cache_control)
+
+    def _store(self, key: Tuple, start: Message, body: bytes, generation: int) -> None:
+        headers = list(start.get('headers', []))
+        etag = _header(headers, b'etag')
+        self.cache.put(key, CachedResponse(start['status'], headers, body, time.monotonic(),
+                                           etag.decode('latin-1') if etag else None), generation)
+
+    def _revalidate(self, scope: Scope, key: Tuple, policy: CachePolicy) -> None:
+        """Refresh a stale entry in the background, once per key at a time."""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        refresh_scope = dict(scope)
+
+        async def discard(message: Message) -> None:
+            pass
+
+        async def refresh() -> None:
+            try:
+                await self._fetch(refresh_scope, _empty_receive, discard, key, policy)
+            except Exception:
+                logger.exception(f"Refreshing cached response for {scope['path']} failed")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
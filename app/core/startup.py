@@ -0,0 +1,66 @@
+"""
+Startup bookkeeping: process-wide components that can be built lazily.
+
+Getters decorated with ``@component(name)`` behave like the usual
+``@lru_cache`` singletons, but record how long their first call took and are
+registered for ``warm_up()``. With ``STARTUP_MODE=eager`` the startup handler
+builds every registered component before the first request; with ``lazy``
+each one is built on first use, which keeps scale-to-zero cold starts short.
+``scripts/startup_profile.py`` reports both import and init timings.
+"""
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+import logging
+import time
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Component or step name -> seconds spent initializing it, in completion order
+init_timings: Dict[str, float] = {}
+components: Dict[str, Callable[[], Any]] = {}
+
+
+@contextmanager
+def timed_init(name: str) -> Iterator[None]:
+    """Record the duration of an initialization step under ``name``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        init_timings[name] = init_timings.get(name, 0.0) + elapsed
+        logger.debug(f"Initialized {name} in {elapsed * 1000:.1f}ms")
+
+
+def component(name: str) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """Decorator for zero-argument factories of process-wide singletons."""
+    def decorate(factory: Callable[[], T]) -> Callable[[], T]:
+        @lru_cache(maxsize=None)
+        @wraps(factory)
+        def getter() -> T:
+            with timed_init(name):
+                return factory()
+        components[name] = getter
+        return getter
+    return decorate
+
+
+def is_lazy() -> bool:
+    return settings.STARTUP_MODE == "lazy"
+
+
+def warm_up(names: Optional[list] = None) -> None:
+    """Build the registered components (all of them by default) now rather than on first use."""
+    for name, getter in list(components.items()):
+        if names is None or name in names:
+            getter()
+
+
+def pending_components() -> list:
+    """Registered components that have not been built yet."""
+    return [name for name, getter in components.items() if getter.cache_info().currsize == 0]
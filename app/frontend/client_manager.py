@@ -0,0 +1,216 @@
+"""
+Lifecycle manager for NiceGUI clients.
+
+Every open tab keeps its page's element tree on the server until its
+websocket has been gone for NiceGUI's ``reconnect_timeout``. ``ClientManager``
+bounds that state:
+
+- clients without a UI event for ``CLIENT_IDLE_TIMEOUT_SECONDS`` are evicted;
+- above ``CLIENT_MAX`` clients, or once their estimated memory exceeds
+  ``CLIENT_MEMORY_BUDGET_MB``, the least recently active ones are evicted.
+  This is checked whenever a page is built and every ``CLIENT_REAP_INTERVAL_SECONDS``.
+
+Memory is estimated as elements x ``CLIENT_ELEMENT_BYTES`` (about 2 KB per
+element for the portfolio page, measured with tracemalloc).
+
+An evicted tab keeps showing its page. It closes its websocket without the
+"connection lost" overlay and reloads on the next click or key press, so a
+visitor who comes back gets a fresh client and one who doesn't costs nothing.
+"""
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import time
+
+from nicegui import Client, app
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+evictions = registry.counter('nicegui_client_evictions_total', 'NiceGUI clients evicted, by reason.', ('reason',))
+
+# Runs in the evicted tab: drop the socket quietly, rebuild the page once the visitor interacts again
+EVICT_JS = (
+    "window.socket.off('disconnect'); window.socket.disconnect();"
+    "['pointerdown', 'keydown', 'focusin'].forEach(type => document.addEventListener("
+    "type, () => window.location.reload(), {once: true, capture: true}));"
+)
+# Time an evicted tab gets to disconnect before its client is deleted regardless
+EVICT_GRACE_SECONDS = 5.0
+
+
+class ClientManager:
+    """Tracks activity and estimated memory per NiceGUI client and evicts the idle or excess ones."""
+
+    def __init__(self, idle_timeout: float = 900.0, max_clients: int = 0, memory_budget: int = 0,
+                 element_bytes: int = 2048, interval: float = 10.0):
+        self.idle_timeout = idle_timeout
+        self.max_clients = max_clients
+        self.memory_budget = memory_budget
+        self.element_bytes = element_bytes
+        self.interval = interval
+        self._last_active: Dict[str, float] = {}
+        # client id -> time after which an evicted client is deleted
+        self._evicting: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._installed = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def install(self) -> None:
+        """Record UI events and reconnects as activity."""
+        if self._installed:
+            return
+        self._installed = True
+        handle_event = Client.handle_event
+
+        def handle_event_with_activity(client: Client, msg: Dict) -> None:
+            self.touch(client)
+            handle_event(client, msg)
+
+        # NOTE NiceGUI has no hook for incoming events; this wraps its dispatcher
+        Client.handle_event = handle_event_with_activity
+        app.on_connect(self.touch)
+        registry.gauge('nicegui_client_estimated_bytes', 'Estimated memory held by NiceGUI client element trees.',
+                       callback=lambda: sum(self.estimated_bytes(client) for client in self._clients()))
+
+    def touch(self, client: Client) -> None:
+        self._last_active[client.id] = time.monotonic()
+
+    def admit(self, client: Client) -> None:
+        """Register a freshly built page and evict others if it pushes the clients over a limit."""
+        self.touch(client)
+        self._enforce_limits(keep=client)
+
+    def estimated_bytes(self, client: Client) -> int:
+        return len(client.elements) * self.element_bytes
+
+    def _active_at(self, client: Client) -> float:
+        active = self._last_active.get(client.id)
+        if active is None:
+            # Built before the manager saw it; count from its creation
+            return time.monotonic() - (time.time() - client.created)
+        return active
+
+    def _clients(self) -> List[Client]:
+        """Page clients that are not already on their way out."""
+        return [client for client in list(Client.instances.values())
+                if not client.shared and client.id not in self._evicting]
+
+    def _enforce_limits(self, keep: Optional[Client] = None) -> None:
+        clients = sorted(self._clients(), key=self._active_at)
+        count = len(clients)
+        total = sum(self.estimated_bytes(client) for client in clients)
+        for client in clients:
+            over_count = self.max_clients and count > self.max_clients
+            over_memory = self.memory_budget and total > self.memory_budget
+            if not (over_count or over_memory):
+                break
+            if client is keep:
+                continue
+            self.evict(client, 'max_clients' if over_count else 'memory')
+            count -= 1
+            total -= self.estimated_bytes(client)
+
+    def evict(self, client: Client, reason: str) -> None:
+        evictions.inc((reason,))
+        logger.debug(f"Evicting NiceGUI client {client.id[:8]} ({reason}, {len(client.elements)} elements)")
+        if client.has_socket_connection:
+            self._evicting[client.id] = time.monotonic() + EVICT_GRACE_SECONDS
+            client.run_javascript(EVICT_JS)
+        else:
+            self._delete(client)
+
+    def _delete(self, client: Client) -> None:
+        # NOTE a pending NiceGUI disconnect task would delete the client a second time
+        disconnect_task = getattr(client, '_disconnect_task', None)
+        if disconnect_task is not None:
+            disconnect_task.cancel()
+        if client.id in Client.instances:
+            client.delete()
+        self._last_active.pop(client.id, None)
+
+    def reap(self) -> None:
+        """Delete evicted clients past their grace period, then evict the idle and excess ones."""
+        now = time.monotonic()
+        for client_id, deadline in list(self._evicting.items()):
+            client = Client.instances.get(client_id)
+            if client is None:
+                del self._evicting[client_id]
+            elif now >= deadline:
+                del self._evicting[client_id]
+                self._delete(client)
+        for client_id in set(self._last_active) - set(Client.instances):
+            del self._last_active[client_id]
+        if self.idle_timeout:
+            for client in self._clients():
+                if now - self._active_at(client) > self.idle_timeout:
+                    self.evict(client, 'idle')
+        self._enforce_limits()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.reap()
+            except Exception:
+                logger.exception("Reaping NiceGUI clients failed")
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals, limits and per-client activity, most idle first."""
+        now = time.monotonic()
+        items = [{
+            "id": client.id[:8],
+            "path": client.page.path,
+            "connected": client.has_socket_connection,
+            "evicting": client.id in self._evicting,
+            "age_seconds": round(time.time() - client.created, 1),
+            "idle_seconds": round(now - self._active_at(client), 1),
+            "elements": len(client.elements),
+            "estimated_bytes": self.estimated_bytes(client),
+        } for client in list(Client.instances.values()) if not client.shared]
+        items.sort(key=lambda item: item["idle_seconds"], reverse=True)
+        return {
+            "enabled": True,
+            "clients": len(items),
+            "connected": sum(1 for item in items if item["connected"]),
+            "elements": sum(item["elements"] for item in items),
+            "estimated_bytes": sum(item["estimated_bytes"] for item in items),
+            "limits": {
+                "idle_timeout_seconds": self.idle_timeout,
+                "max_clients": self.max_clients,
+                "memory_budget_bytes": self.memory_budget,
+            },
+            "evictions": {labels[0]: int(value) for labels, value in evictions.values.items()},
+            "items": items,
+        }
+
+    async def start(self) -> None:
+        if not self.running:
+            self.install()
+            self._task = asyncio.create_task(self._run(), name="nicegui-client-reaper")
+            logger.info(f"NiceGUI client manager started (idle timeout {self.idle_timeout}s, "
+                        f"max {self.max_clients or 'unlimited'} clients, "
+                        f"budget {self.memory_budget // (1024 * 1024) or 'unlimited'} MB)")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+@lru_cache(maxsize=None)
+def get_client_manager() -> ClientManager:
+    """Return the process-wide NiceGUI client manager."""
+    return ClientManager(
+        idle_timeout=settings.CLIENT_IDLE_TIMEOUT_SECONDS,
+        max_clients=settings.CLIENT_MAX,
+        memory_budget=int(settings.CLIENT_MEMORY_BUDGET_MB * 1024 * 1024),
+        element_bytes=settings.CLIENT_ELEMENT_BYTES,
+        interval=settings.CLIENT_REAP_INTERVAL_SECONDS,
+    )
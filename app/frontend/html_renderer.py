@@ -0,0 +1,311 @@
+"""
+Static HTML rendering of the portfolio page.
+
+Renders the same sections as the NiceGUI ``home_page()`` into a single HTML
+document, once per content version. Only the contact form stays interactive:
+it is embedded as a small NiceGUI page that hydrates over the websocket.
+"""
+import threading
+from dataclasses import dataclass
+from email.utils import formatdate
+from html import escape
+from typing import Iterable, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+from nicegui import __version__ as nicegui_version
+
+from app.core.config import Settings, settings
+from app.core.hot_reload import current_settings
+from app.core.http_cache import is_not_modified, make_etag
+from app.frontend.markup import (ANALYTICS_SCRIPT, PROFILE_IMAGE_SIZES, PROJECT_IMAGE_SIZES, render_markdown,
+                                 render_picture)
+from app.models.portfolio import Project
+from app.services.portfolio_service import PortfolioService
+
+
+def _tags(items: Iterable[str], classes: str) -> str:
+    return ''.join(f'<span class="{classes}">{escape(item)}</span>' for item in items)
+
+
+def _link(url: str, label: str, classes: str, new_tab: bool = True) -> str:
+    target = ' target="_blank" rel="noopener"' if new_tab else ''
+    return f'<a href="{escape(url)}" class="{classes}"{target}>{label}</a>'
+
+
+def render_navigation(config: Settings = settings) -> str:
+    links = [('Home', '/'), ('Projects', '/#projects'), ('Skills', '/#skills'),
+             ('Experience', '/#experience'), ('Contact', '/#contact')]
+    items = ''.join(_link(url, label, 'nav-link px-3 py-2', new_tab=False) for label, url in links)
+    return (
+        '<header class="flex justify-between items-center p-4 bg-white shadow-sm sticky top-0 z-10">'
+        f'<span class="text-xl font-bold text-gray-800">{escape(config.APP_NAME)}</span>'
+        f'<nav class="flex gap-2">{items}</nav>'
+        '</header>'
+    )
+
+
+def render_hero(service: PortfolioService, config: Settings = settings) -> str:
+    return (
+        '<section class="w-full hero-section">'
+        '<div class="w-full max-w-6xl mx-auto px-4 py-16 flex items-center flex-wrap">'
+        '<div class="w-full md:w-2/3 mb-8 md:mb-0">'
+        f'<h1 class="text-4xl font-bold mb-2">Hello, I\'m {escape(config.OWNER_NAME)}</h1>'
+        f'<p class="text-2xl mb-6">{escape(config.OWNER_TITLE)}</p>'
+        f'<div class="text-lg opacity-90">{render_markdown(service.get_bio())}</div>'
+        '<div class="flex mt-6 gap-4">'
+        + _link('/#projects', 'View Projects', 'px-4 py-2 rounded bg-white text-indigo-600 font-medium', new_tab=False)
+        + _link('/#contact', 'Contact Me', 'px-4 py-2 rounded border border-white text-white', new_tab=False)
+        + '</div></div>'
+        '<div class="w-full md:w-1/3 flex justify-center">'
+        + render_picture(config.OWNER_PROFILE_IMAGE, config.OWNER_NAME,
+                         'rounded-full w-64 h-64 object-cover border-4 border-white shadow-lg',
+                         PROFILE_IMAGE_SIZES, lazy=False) +
+        '</div></div></section>'
+    )
+
+
+def render_about(service: PortfolioService) -> str:
+    return (
+        '<section id="about" class="section">'
+        '<h2 class="text-3xl font-bold mb-6">About Me</h2>'
+        f'<div class="text-lg">{render_markdown(service.get_about())}</div>'
+        '</section>'
+    )
+
+
+def render_skills(service: PortfolioService) -> str:
+    groups = [
+        ('Technical Skills', service.get_technical_skills()),
+        ('AI & Machine Learning', service.get_ai_ml_skills()),
+        ('Tools & Platforms', service.get_tools_platforms()),
+    ]
+    body = ''.join(
+        f'<h3 class="text-xl font-semibold mb-4">{escape(title)}</h3>'
+        f'<div class="flex flex-wrap gap-2 mb-6">{_tags(skills, "skill-tag")}</div>'
+        for title, skills in groups
+    )
+    return (
+        '<section id="skills" class="section">'
+        f'<h2 class="text-3xl font-bold mb-6">Skills &amp; Expertise</h2>{body}'
+        '</section>'
+    )
+
+
+def render_project_card(project: Project) -> str:
+    image = ''
+    if project.image:
+        image = render_picture(project.image, project.title, 'w-full h-48 object-cover',
+                               PROJECT_IMAGE_SIZES)
+    links = ''
+    if project.demo_url:
+        links += _link(project.demo_url, 'Live Demo', 'text-sm text-primary font-medium')
+    if project.github_url:
+        links += _link(project.github_url, 'GitHub', 'text-sm text-primary font-medium')
+    return (
+        f'<div class="card h-full bg-white rounded shadow overflow-hidden" data-project="{escape(project.title)}">'
+        f'{image}'
+        '<div class="p-4">'
+        f'<h3 class="text-xl font-bold">{escape(project.title)}</h3>'
+        f'<p class="text-sm text-gray-500 mb-2">{escape(project.category)}</p>'
+        f'<div class="text-sm mb-4">{render_markdown(project.description)}</div>'
+        f'<div class="flex flex-wrap gap-1 mb-4">{_tags(project.technologies, "text-xs skill-tag py-1 px-2")}</div>'
+        f'<div class="flex gap-2">{links}</div>'
+        '</div></div>'
+    )
+
+
+def render_projects(service: PortfolioService) -> str:
+    cards = ''.join(render_project_card(project) for project in service.get_projects())
+    return (
+        '<section id="projects" class="section">'
+        '<h2 class="text-3xl font-bold mb-6">Featured Projects</h2>'
+        f'<div class="grid grid-cols-1 md:grid-cols-3 gap-6">{cards}</div>'
+        '</section>'
+    )
+
+
+def _render_timeline_item(title: str, dates: str, subtitle: str, description: str,
+                          technologies: Optional[Iterable[str]] = None) -> str:
+    tags = ''
+    if technologies:
+        tags = f'<div class="flex flex-wrap gap-1 mb-2">{_tags(technologies, "text-xs skill-tag py-1 px-2")}</div>'
+    return (
+        '<div class="timeline-item">'
+        '<div class="flex justify-between items-start mb-1">'
+        f'<h3 class="text-xl font-bold">{escape(title)}</h3>'
+        f'<span class="text-sm text-gray-500">{escape(dates)}</span>'
+        '</div>'
+        f'<p class="text-lg font-medium text-primary mb-2">{escape(subtitle)}</p>'
+        f'<div class="mb-2">{render_markdown(description)}</div>'
+        f'{tags}'
+        '</div>'
+    )
+
+
+def render_experience(service: PortfolioService) -> str:
+    items = ''.join(
+        _render_timeline_item(job.title, f"{job.start_date} - {job.end_date}",
+                              job.company, job.description, job.technologies)
+        for job in service.get_experience()
+    )
+    return (
+        '<section id="experience" class="section">'
+        f'<h2 class="text-3xl font-bold mb-6">Work Experience</h2>{items}'
+        '</section>'
+    )
+
+
+def render_education(service: PortfolioService) -> str:
+    items = ''.join(
+        _render_timeline_item(edu.degree, f"{edu.start_date} - {edu.end_date}",
+                              edu.institution, edu.description)
+        for edu in service.get_education()
+    )
+    return (
+        '<section id="education" class="section">'
+        f'<h2 class="text-3xl font-bold mb-6">Education</h2>{items}'
+        '</section>'
+    )
+
+
+def render_contact(contact_form_path: str, config: Settings = settings) -> str:
+    contacts = [('email', f'mailto:{config.OWNER_EMAIL}', config.OWNER_EMAIL, False)]
+    if config.OWNER_GITHUB:
+        contacts.append(('code', config.OWNER_GITHUB, 'GitHub', True))
+    if config.OWNER_LINKEDIN:
+        contacts.append(('work', config.OWNER_LINKEDIN, 'LinkedIn', True))
+    if config.OWNER_TWITTER:
+        contacts.append(('chat', config.OWNER_TWITTER, 'Twitter', True))
+    info = ''.join(
+        '<div class="flex items-center">'
+        f'<i class="material-icons text-primary mr-2">{icon}</i>'
+        + _link(url, escape(label), 'text-primary', new_tab=new_tab)
+        + '</div>'
+        for icon, url, label, new_tab in contacts
+    )
+    return (
+        '<section id="contact" class="section">'
+        '<h2 class="text-3xl font-bold mb-6">Get In Touch</h2>'
+        '<div class="flex flex-wrap">'
+        '<div class="w-full lg:w-1/2 pr-0 lg:pr-8 mb-8 lg:mb-0">'
+        '<h3 class="text-xl font-semibold mb-4">Send me a message</h3>'
+        f'<iframe src="{escape(contact_form_path)}" title="Contact form" loading="lazy" '
+        'class="w-full border-0" style="height: 30rem;"></iframe>'
+        '</div>'
+        '<div class="w-full lg:w-1/2">'
+        '<h3 class="text-xl font-semibold mb-4">Contact Information</h3>'
+        f'<div class="space-y-4">{info}</div>'
+        '</div></div></section>'
+    )
+
+
+def render_footer(config: Settings = settings) -> str:
+    icons = [
+        (config.OWNER_GITHUB, 'fab fa-github'),
+        (config.OWNER_LINKEDIN, 'fab fa-linkedin'),
+        (config.OWNER_TWITTER, 'fab fa-twitter'),
+        (f'mailto:{config.OWNER_EMAIL}' if config.OWNER_EMAIL else None, 'fas fa-envelope'),
+    ]
+    links = ''.join(
+        _link(url, f'<i class="{icon}"></i>', 'social-icon', new_tab=True)
+        for url, icon in icons if url
+    )
+    return (
+        '<footer class="p-6 bg-gray-800 text-white">'
+        '<div class="w-full max-w-6xl mx-auto flex justify-between items-center flex-wrap">'
+        f'<span class="text-gray-400">&copy; {escape(config.OWNER_NAME)} 2024</span>'
+        f'<div class="flex gap-4">{links}</div>'
+        '</div></footer>'
+    )
+
+
+def render_portfolio_html(service: PortfolioService, head_html: str,
+                          contact_form_path: str = '/contact-form', config: Settings = settings) -> str:
+    """Render the complete portfolio page as a standalone HTML document."""
+    static_prefix = f'/_nicegui/{nicegui_version}/static'
+    return (
+        '<!DOCTYPE html><html lang="en"><head>'
+        '<meta charset="utf-8">'
+        f'<title>{escape(config.APP_NAME)}</title>'
+        f'<link href="{static_prefix}/fonts.css" rel="stylesheet">'
+        f'<script src="{static_prefix}/tailwindcss.min.js"></script>'
+        f'{head_html}'
+        '</head><body>'
+        + render_navigation(config)
+        + render_hero(service, config)
+        + '<main class="w-full max-w-6xl mx-auto px-4 py-8">'
+        + render_about(service)
+        + render_skills(service)
+        + render_projects(service)
+        + render_experience(service)
+        + render_education(service)
+        + render_contact(contact_form_path, config)
+        + '</main>'
+        + render_footer(config)
+        + (ANALYTICS_SCRIPT if config.ANALYTICS else '')
+        + '</body></html>'
+    )
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """A rendered page together with its validators."""
+    version: int
+    body: bytes
+    etag: str
+    last_modified: str
+
+
+class PortfolioPageCache:
+    """Keeps the rendered portfolio in memory, re-rendering once per content version."""
+
+    def __init__(self, head_html: str, contact_form_path: str = '/contact-form'):
+        self._head_html = head_html
+        self._contact_form_path = contact_form_path
+        self._page: Optional[CachedPage] = None
+        self._lock = threading.Lock()
+        # Bumped by invalidate(); a page rendered before is served once but not kept
+        self._epoch = 0
+
+    def invalidate(self) -> None:
+        """Drop the cached page, e.g. after the settings it shows were reloaded.
+
+        Does not wait for the lock, so the event loop never blocks on a render.
+        """
+        self._epoch += 1
+        self._page = None
+
+    def get(self, service: PortfolioService) -> CachedPage:
+        """Return the cached page, rendering it if the content version changed."""
+        page = self._page
+        if page is not None and page.version == service.version:
+            return page
+        with self._lock:
+            page = self._page
+            if page is None or page.version != service.version:
+                epoch = self._epoch
+                version = service.version
+                body = render_portfolio_html(service, self._head_html, self._contact_form_path,
+                                             current_settings()).encode('utf-8')
+                page = CachedPage(
+                    version=version,
+                    body=body,
+                    etag=make_etag(version, body),
+                    last_modified=formatdate(service.updated_at, usegmt=True),
+                )
+                if epoch == self._epoch:
+                    self._page = page
+        return page
+
+    def response(self, request: Request, service: PortfolioService) -> Response:
+        """Serve the cached page, answering conditional requests with 304."""
+        page = self.get(service)
+        headers = {
+            'ETag': page.etag,
+            'Last-Modified': page.last_modified,
+            'Cache-Control': 'no-cache',
+        }
+        if is_not_modified(request, page.etag, page.last_modified):
+            return Response(status_code=304, headers=headers)
+        return Response(content=page.body, media_type='text/html', headers=headers)
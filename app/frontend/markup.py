@@ -0,0 +1,68 @@
+"""
+Markup helpers shared by the NiceGUI page and the server-rendered (Jinja2) view.
+"""
+import json
+import textwrap
+from html import escape
+
+import markdown2
+
+from app.core.assets import asset_url
+from app.core.images import get_image_pipeline
+from app.services.analytics import SECTIONS
+from app.services.portfolio_content import rendered_markdown
+
+MARKDOWN_EXTRAS = ['fenced-code-blocks', 'tables']
+
+# Rendered widths for the srcset ``sizes`` attribute: cards fill a third of the
+# max-w-6xl grid from md up, the avatar is w-64
+PROJECT_IMAGE_SIZES = '(min-width: 1152px) 368px, (min-width: 768px) 33vw, 100vw'
+PROFILE_IMAGE_SIZES = '256px'
+
+# Beacon for the pre-rendered and Jinja2 pages (NiceGUI records on the server):
+# a page view on load, then clicks on section anchors and on links inside a
+# ``data-project`` card, each sent to /api/analytics/events
+ANALYTICS_SCRIPT = '''<script>
+(() => {
+    const sections = new Set(%s);
+    const send = (event) => navigator.sendBeacon('/api/analytics/events', JSON.stringify([event]));
+    document.addEventListener('click', (event) => {
+        const link = event.target.closest('a[href]');
+        if (!link) return;
+        const card = link.closest('[data-project]');
+        const section = link.hash.slice(1);
+        if (card) {
+            send({type: 'project_click', project: card.dataset.project});
+        } else if (sections.has(section) && link.pathname === location.pathname) {
+            send({type: 'section', section});
+        }
+    });
+    send({type: 'page_view'});
+})();
+</script>''' % json.dumps(SECTIONS)
+
+
+def render_markdown(text: str) -> str:
+    """Render indented markdown the same way ``ui.markdown`` does.
+
+    Bodies from the compiled content bundle come pre-rendered.
+    """
+    html = rendered_markdown(text)
+    if html is None:
+        html = markdown2.markdown(textwrap.dedent(text).strip(), extras=MARKDOWN_EXTRAS)
+    return html
+
+
+def render_picture(path: str, alt: str, classes: str, sizes: str, lazy: bool = True) -> str:
+    """Render a static image as ``<picture>`` with WebP/JPEG srcsets, or a plain ``<img>`` fallback."""
+    loading = ' loading="lazy" decoding="async"' if lazy else ' fetchpriority="high"'
+    image = get_image_pipeline().get(path)
+    if image is None:
+        return f'<img src="{escape(asset_url(path))}" alt="{escape(alt)}"{loading} class="{classes}">'
+    return (
+        '<picture>'
+        f'<source type="image/webp" srcset="{escape(image.webp_srcset)}" sizes="{sizes}">'
+        f'<img src="{escape(image.src)}" srcset="{escape(image.jpeg_srcset)}" sizes="{sizes}" '
+        f'width="{image.width}" height="{image.height}" alt="{escape(alt)}"{loading} class="{classes}">'
+        '</picture>'
+    )
@@ -1,33 +1,90 @@
 """
 AI Engineer Portfolio - NiceGUI Implementation
 """
-from nicegui import ui, app
+from nicegui import ui, app, context, Client
+from fastapi import Request
+from fastapi.responses import Response
 import logging
-from app.core.config import settings
-from app.services.portfolio_service import PortfolioService
+from app.core.config import RELOADABLE_SETTINGS, settings
+from app.services.portfolio_service import get_portfolio_service
+from app.api.routes import router as api_router
+from app.frontend.client_manager import get_client_manager
+from app.frontend.html_renderer import PortfolioPageCache
+from app.frontend.markup import PROFILE_IMAGE_SIZES, render_picture
+from app.frontend.project_grid import ProjectGrid
+from app.models.contact import ContactMessage
+from app.core.assets import PrecompressedStaticFiles
+from app.core.fonts import font_head_html
+from app.core.hot_reload import get_hot_reloader, on_settings_change
+from app.core.loop_monitor import get_loop_monitor
+from app.core.startup import is_lazy, warm_up
+from app.core.admission import AdmissionMiddleware
+from app.core.metrics import COUNT_BUCKETS, MetricsMiddleware, registry
+from app.core.response_cache import ResponseCacheMiddleware
+from app.core.rate_limit import client_ip
+from app.services.analytics import get_analytics, visitor_key
+from app.services.contact_service import ContactQueueFullError, ContactRateLimitedError, get_contact_pipeline
 import os
 
 logger = logging.getLogger(__name__)
 
-# Initialize the portfolio service
-portfolio_service = PortfolioService()
-
 # Configure NiceGUI app
 app.title = settings.APP_NAME
 app.favicon = "💻"
 
-# Add static files directory for images, CSS, etc.
+# Serve the JSON API alongside the pages
+app.include_router(api_router, prefix="/api", tags=["api"])
+
+# Shed load by priority class instead of building pages that would time out anyway
+if settings.ADMISSION_CONTROL:
+    app.add_middleware(AdmissionMiddleware)
+
+# Serve the cached API routes from memory (the pages are per-client and not cached)
+if settings.RESPONSE_CACHE:
+    app.add_middleware(ResponseCacheMiddleware)
+
+# Request metrics, plus NiceGUI gauges, exposed on /api/metrics
+app.add_middleware(MetricsMiddleware)
+registry.gauge('nicegui_connected_clients', 'NiceGUI clients with an open websocket connection.',
+               callback=lambda: sum(1 for client in Client.instances.values() if client.has_socket_connection))
+page_elements = registry.histogram('nicegui_page_elements', 'Elements built per NiceGUI page render.',
+                                   ('page',), buckets=COUNT_BUCKETS)
+
+# Build the portfolio service and other components before serving unless
+# STARTUP_MODE=lazy defers each to its first use
+if not is_lazy():
+    app.on_startup(lambda: warm_up())
+
+# Background workers
+app.on_startup(get_contact_pipeline().start)
+# NiceGUI passes the client to handlers with parameters, so wrap stop(timeout)
+app.on_shutdown(lambda: get_contact_pipeline().stop())
+app.on_startup(get_loop_monitor().start)
+app.on_shutdown(get_loop_monitor().stop)
+# Apply changes to .env and the portfolio content file without a restart
+app.on_startup(get_hot_reloader().start)
+app.on_shutdown(get_hot_reloader().stop)
+# Evict idle clients and keep the per-client element trees within budget
+app.on_startup(get_client_manager().start)
+app.on_shutdown(get_client_manager().stop)
+# Aggregate visitor analytics in memory and merge them into the store periodically
+if settings.ANALYTICS:
+    app.on_startup(get_analytics().start)
+    app.on_shutdown(get_analytics().stop)
+
+# Add static files directory for images, CSS, etc.; URLs are resolved through
+# the asset manifest so fingerprinted files can be cached as immutable
 static_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static')
 if os.path.exists(static_dir):
-    app.add_static_files('/static', static_dir)
+    app.mount('/static', PrecompressedStaticFiles(directory=static_dir), name='static')
     logger.info(f"Serving static files from {static_dir}")
 else:
     os.makedirs(static_dir, exist_ok=True)
     logger.info(f"Created static directory at {static_dir}")
 
-# Add custom CSS
-with ui.head():
-    ui.html("""
+# Custom CSS shared by the NiceGUI pages and the pre-rendered HTML page, followed
+# by the self-hosted font faces and icon classes (see scripts/build_fonts.py)
+HEAD_HTML = """
     <style>
         :root {
             --primary: #4F46E5;
@@ -143,8 +200,14 @@ with ui.head():
         }
     </style>
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    """)
+    """ + font_head_html()
+ui.add_head_html(HEAD_HTML, shared=True)
+
+def go_to_section(section: str) -> None:
+    """Scroll to a section of the page, counting the navigation in the visitor analytics."""
+    if settings.ANALYTICS:
+        get_analytics().record_section(section, visitor_key(context.get_client().environ['asgi.scope']))
+    ui.navigate.to(f'/#{section}')
 
 # Create navigation component
 def create_navigation():
@@ -153,10 +216,10 @@ def create_navigation():
         
         with ui.row().classes('gap-2'):
             ui.button('Home', on_click=lambda: ui.navigate.to('/')).props('flat').classes('nav-link')
-            ui.button('Projects', on_click=lambda: ui.navigate.to('/#projects')).props('flat').classes('nav-link')
-            ui.button('Skills', on_click=lambda: ui.navigate.to('/#skills')).props('flat').classes('nav-link')
-            ui.button('Experience', on_click=lambda: ui.navigate.to('/#experience')).props('flat').classes('nav-link')
-            ui.button('Contact', on_click=lambda: ui.navigate.to('/#contact')).props('flat').classes('nav-link')
+            ui.button('Projects', on_click=lambda: go_to_section('projects')).props('flat').classes('nav-link')
+            ui.button('Skills', on_click=lambda: go_to_section('skills')).props('flat').classes('nav-link')
+            ui.button('Experience', on_click=lambda: go_to_section('experience')).props('flat').classes('nav-link')
+            ui.button('Contact', on_click=lambda: go_to_section('contact')).props('flat').classes('nav-link')
 
 # Create footer component
 def create_footer():
@@ -167,18 +230,65 @@ def create_footer():
                 
                 with ui.row().classes('gap-4'):
                     if settings.OWNER_GITHUB:
-                        ui.link(target=settings.OWNER_GITHUB, new_tab=True).classes('social-icon').style('color: white;').html('<i class="fab fa-github"></i>')
+                        with ui.link(target=settings.OWNER_GITHUB, new_tab=True).classes('social-icon').style('color: white;'):
+                            ui.html('<i class="fab fa-github"></i>')
                     if settings.OWNER_LINKEDIN:
-                        ui.link(target=settings.OWNER_LINKEDIN, new_tab=True).classes('social-icon').style('color: white;').html('<i class="fab fa-linkedin"></i>')
+                        with ui.link(target=settings.OWNER_LINKEDIN, new_tab=True).classes('social-icon').style('color: white;'):
+                            ui.html('<i class="fab fa-linkedin"></i>')
                     if settings.OWNER_TWITTER:
-                        ui.link(target=settings.OWNER_TWITTER, new_tab=True).classes('social-icon').style('color: white;').html('<i class="fab fa-twitter"></i>')
+                        with ui.link(target=settings.OWNER_TWITTER, new_tab=True).classes('social-icon').style('color: white;'):
+                            ui.html('<i class="fab fa-twitter"></i>')
                     if settings.OWNER_EMAIL:
-                        ui.link(f'mailto:{settings.OWNER_EMAIL}', new_tab=True).classes('social-icon').style('color: white;').html('<i class="fas fa-envelope"></i>')
+                        with ui.link(target=f'mailto:{settings.OWNER_EMAIL}', new_tab=True).classes('social-icon').style('color: white;'):
+                            ui.html('<i class="fas fa-envelope"></i>')
+
+# Create contact form component
+def create_contact_form():
+    name_input = ui.input('Your Name').classes('w-full mb-4')
+    email_input = ui.input('Your Email').classes('w-full mb-4').props('type=email')
+    subject_input = ui.input('Subject').classes('w-full mb-4')
+    message_input = ui.textarea('Message').classes('w-full mb-4').props('rows=5')
+    client = context.get_client()
+
+    async def handle_contact_form():
+        if not name_input.value or not email_input.value or not message_input.value:
+            ui.notify('Please fill out all required fields', type='negative')
+            return
+
+        # Only enqueue here; storage and SMTP delivery happen in the background pipeline
+        client_key = client_ip(client.environ['asgi.scope'], settings.TRUST_FORWARDED_FOR,
+                               settings.CLIENT_IP_HEADER) if client.environ else None
+        try:
+            queued = get_contact_pipeline().submit(ContactMessage(
+                name=name_input.value,
+                email=email_input.value,
+                subject=subject_input.value or '',
+                message=message_input.value,
+            ), client_key=client_key or client.id)
+        except ContactRateLimitedError:
+            ui.notify('You have sent several messages already. Please try again later.', type='warning')
+            return
+        except ContactQueueFullError:
+            ui.notify('Too many messages right now. Please try again in a minute.', type='warning')
+            return
+
+        if queued:
+            ui.notify('Message sent successfully! I will get back to you soon.', type='positive')
+        else:
+            ui.notify('This message was already sent. I will get back to you soon.', type='info')
+        name_input.value = ''
+        email_input.value = ''
+        subject_input.value = ''
+        message_input.value = ''
+
+    ui.button('Send Message', on_click=handle_contact_form).props('unelevated').classes('bg-primary text-white')
 
 # Define page routes
-@ui.page('/')
-def home_page():
+def home_page(request: Request):
     """Main portfolio page."""
+    portfolio_service = get_portfolio_service()
+    if settings.ANALYTICS:
+        get_analytics().record_page_view(visitor_key(request.scope))
     create_navigation()
     
     # Hero Section
@@ -192,13 +302,14 @@ def home_page():
                     ui.markdown(portfolio_service.get_bio()).classes('text-lg opacity-90')
                     
                     with ui.row().classes('mt-6 gap-4'):
-                        ui.button('View Projects', on_click=lambda: ui.navigate.to('/#projects')).props('unelevated').classes('bg-white text-indigo-600 font-medium')
-                        ui.button('Contact Me', on_click=lambda: ui.navigate.to('/#contact')).props('outline').classes('text-white border-white')
+                        ui.button('View Projects', on_click=lambda: go_to_section('projects')).props('unelevated').classes('bg-white text-indigo-600 font-medium')
+                        ui.button('Contact Me', on_click=lambda: go_to_section('contact')).props('outline').classes('text-white border-white')
                 
                 # Profile image
                 with ui.column().classes('w-full md:w-1/3 flex justify-center'):
-                    profile_path = f"/static/{settings.OWNER_PROFILE_IMAGE}"
-                    ui.image(profile_path).classes('rounded-full w-64 h-64 object-cover border-4 border-white shadow-lg')
+                    ui.html(render_picture(settings.OWNER_PROFILE_IMAGE, settings.OWNER_NAME,
+                                           'rounded-full w-64 h-64 object-cover border-4 border-white shadow-lg',
+                                           PROFILE_IMAGE_SIZES, lazy=False))
     
     # Main content
     with ui.column().classes('w-full max-w-6xl mx-auto px-4 py-8'):
@@ -236,26 +347,11 @@ def home_page():
             projects_section.props('id=projects')
             ui.label('Featured Projects').classes('text-3xl font-bold mb-6')
             
-            with ui.grid(columns=3).classes('gap-6'):
-                for project in portfolio_service.get_projects():
-                    with ui.card().classes('card h-full'):
-                        if project.get('image'):
-                            ui.image(f"/static/{project['image']}").classes('w-full h-48 object-cover')
-                        
-                        with ui.card_section():
-                            ui.label(project['title']).classes('text-xl font-bold')
-                            ui.label(project['category']).classes('text-sm text-gray-500 mb-2')
-                            ui.markdown(project['description']).classes('text-sm mb-4')
-                            
-                            with ui.row().classes('flex-wrap gap-1 mb-4'):
-                                for tech in project['technologies']:
-                                    ui.label(tech).classes('text-xs skill-tag py-1 px-2')
-                            
-                            with ui.row().classes('gap-2'):
-                                if project.get('demo_url'):
-                                    ui.link('Live Demo', project['demo_url'], new_tab=True).classes('text-sm text-primary font-medium')
-                                if project.get('github_url'):
-                                    ui.link('GitHub', project['github_url'], new_tab=True).classes('text-sm text-primary font-medium')
+            ProjectGrid(
+                portfolio_service,
+                batch_size=settings.PROJECTS_BATCH_SIZE,
+                max_batches=settings.PROJECTS_MAX_RENDERED_BATCHES,
+            )
         
         # Experience Section
         with ui.column().classes('section') as experience_section:
@@ -265,13 +361,13 @@ def home_page():
             for job in portfolio_service.get_experience():
                 with ui.column().classes('timeline-item'):
                     with ui.row().classes('justify-between items-start mb-1'):
-                        ui.label(job['title']).classes('text-xl font-bold')
-                        ui.label(f"{job['start_date']} - {job['end_date']}").classes('text-sm text-gray-500')
-                    ui.label(job['company']).classes('text-lg font-medium text-primary mb-2')
-                    ui.markdown(job['description']).classes('mb-2')
+                        ui.label(job.title).classes('text-xl font-bold')
+                        ui.label(f"{job.start_date} - {job.end_date}").classes('text-sm text-gray-500')
+                    ui.label(job.company).classes('text-lg font-medium text-primary mb-2')
+                    ui.markdown(job.description).classes('mb-2')
                     
                     with ui.row().classes('flex-wrap gap-1 mb-2'):
-                        for tech in job['technologies']:
+                        for tech in job.technologies:
                             ui.label(tech).classes('text-xs skill-tag py-1 px-2')
         
         # Education Section
@@ -282,10 +378,10 @@ def home_page():
             for edu in portfolio_service.get_education():
                 with ui.column().classes('timeline-item'):
                     with ui.row().classes('justify-between items-start mb-1'):
-                        ui.label(edu['degree']).classes('text-xl font-bold')
-                        ui.label(f"{edu['start_date']} - {edu['end_date']}").classes('text-sm text-gray-500')
-                    ui.label(edu['institution']).classes('text-lg font-medium text-primary mb-2')
-                    ui.markdown(edu['description']).classes('mb-2')
+                        ui.label(edu.degree).classes('text-xl font-bold')
+                        ui.label(f"{edu.start_date} - {edu.end_date}").classes('text-sm text-gray-500')
+                    ui.label(edu.institution).classes('text-lg font-medium text-primary mb-2')
+                    ui.markdown(edu.description).classes('mb-2')
         
         # Contact Section
         with ui.column().classes('section') as contact_section:
@@ -297,24 +393,7 @@ def home_page():
                 with ui.column().classes('w-full lg:w-1/2 pr-0 lg:pr-8 mb-8 lg:mb-0'):
                     ui.label('Send me a message').classes('text-xl font-semibold mb-4')
                     
-                    name_input = ui.input('Your Name').classes('w-full mb-4')
-                    email_input = ui.input('Your Email').classes('w-full mb-4').props('type=email')
-                    subject_input = ui.input('Subject').classes('w-full mb-4')
-                    message_input = ui.textarea('Message').classes('w-full mb-4').props('rows=5')
-                    
-                    async def handle_contact_form():
-                        # In a real app, this would send an email or store the message
-                        if not name_input.value or not email_input.value or not message_input.value:
-                            ui.notify('Please fill out all required fields', type='negative')
-                            return
-                        
-                        ui.notify('Message sent successfully! I will get back to you soon.', type='positive')
-                        name_input.value = ''
-                        email_input.value = ''
-                        subject_input.value = ''
-                        message_input.value = ''
-                    
-                    ui.button('Send Message', on_click=handle_contact_form).props('unelevated').classes('bg-primary text-white')
+                    create_contact_form()
                 
                 # Contact information
                 with ui.column().classes('w-full lg:w-1/2'):
@@ -341,242 +420,31 @@ def home_page():
                                 ui.link(settings.OWNER_TWITTER, 'Twitter', new_tab=True).classes('text-primary')
     
     create_footer()
+    client = context.get_client()
+    page_elements.observe(len(client.elements), ('/',))
+    get_client_manager().admit(client)
 
-# Create the portfolio service:
-<HST-write file_path="app/services/portfolio_service.py">
-"""
-Portfolio Service - Manages portfolio data and content
-"""
-from typing import List, Dict, Any, Optional
-import logging
-import os
-from app.core.config import settings
 
-logger = logging.getLogger(__name__)
+def contact_form_page():
+    """Contact form embedded in the pre-rendered page; the only hydrated part."""
+    ui.query('body').style('background-color: transparent')
+    with ui.column().classes('w-full'):
+        create_contact_form()
+    get_client_manager().admit(context.get_client())
 
-class PortfolioService:
-    """Service for managing portfolio content."""
-    
-    def __init__(self):
-        """Initialize the portfolio service with default data."""
-        self._initialize_data()
-    
-    def _initialize_data(self):
-        """Initialize portfolio data."""
-        # Bio - short introduction
-        self._bio = """
-        I'm a passionate AI Engineer with expertise in machine learning, deep learning, 
-        and natural language processing. I build intelligent systems that solve real-world problems.
-        """
-        
-        # About - longer description
-        self._about = """
-        As an AI Engineer with over 5 years of experience, I specialize in developing cutting-edge 
-        artificial intelligence solutions that drive business value. My expertise spans machine learning, 
-        deep learning, natural language processing, and computer vision.
 
-        I'm passionate about creating AI systems that are not only technically sound but also 
-        ethical, explainable, and user-friendly. My approach combines strong theoretical knowledge 
-        with practical implementation skills to deliver solutions that make a real impact.
+if settings.RENDER_MODE == "cached":
+    page_cache = PortfolioPageCache(HEAD_HTML, contact_form_path='/contact-form')
+    on_settings_change(RELOADABLE_SETTINGS, page_cache.invalidate)
 
-        Throughout my career, I've worked on diverse projects ranging from recommendation systems 
-        and predictive analytics to conversational AI and image recognition. I enjoy tackling 
-        complex problems and transforming raw data into actionable insights and intelligent applications.
-        """
-        
-        # Technical skills
-        self._technical_skills = [
-            "Python", "TensorFlow", "PyTorch", "Scikit-learn", "Keras", 
-            "SQL", "NoSQL", "Docker", "Kubernetes", "Git", 
-            "REST APIs", "FastAPI", "Flask", "Django", "AWS"
-        ]
-        
-        # AI & ML skills
-        self._ai_ml_skills = [
-            "Machine Learning", "Deep Learning", "Natural Language Processing", 
-            "Computer Vision", "Reinforcement Learning", "Neural Networks", 
-            "Generative AI", "LLMs", "Transformers", "BERT", "GPT", 
-            "Data Mining", "Feature Engineering", "Model Deployment"
-        ]
-        
-        # Tools & platforms
-        self._tools_platforms = [
-            "AWS SageMaker", "Google Cloud AI", "Azure ML", "Hugging Face", 
-            "MLflow", "Weights & Biases", "Jupyter", "Pandas", "NumPy", 
-            "Matplotlib", "Streamlit", "Gradio", "CUDA", "Ray"
-        ]
-        
-        # Projects
-        self._projects = [
-            {
-                "title": "Intelligent Document Processing System",
-                "category": "Natural Language Processing",
-                "description": "Developed an end-to-end document processing system using transformer-based models to extract, classify, and analyze information from unstructured documents.",
-                "technologies": ["PyTorch", "Transformers", "FastAPI", "Docker", "AWS"],
-                "image": "project1.jpg",
-                "github_url": "https://github.com/yourusername/document-processing",
-                "demo_url": "https://demo-url.com/document-processing"
-            },
-            {
-                "title": "Predictive Maintenance AI",
-                "category": "Time Series Analysis",
-                "description": "Built a predictive maintenance system for industrial equipment using time series forecasting and anomaly detection algorithms.",
-                "technologies": ["TensorFlow", "Keras", "Prophet", "Docker", "Azure"],
-                "image": "project2.jpg",
-                "github_url": "https://github.com/yourusername/predictive-maintenance"
-            },
-            {
-                "title": "Conversational AI Assistant",
-                "category": "Natural Language Processing",
-                "description": "Created a domain-specific conversational AI assistant using fine-tuned LLMs and retrieval-augmented generation techniques.",
-                "technologies": ["PyTorch", "Hugging Face", "LangChain", "FastAPI", "Redis"],
-                "image": "project3.jpg",
-                "github_url": "https://github.com/yourusername/conversational-ai",
-                "demo_url": "https://demo-url.com/assistant"
-            },
-            {
-                "title": "Computer Vision for Retail Analytics",
-                "category": "Computer Vision",
-                "description": "Implemented a computer vision system for retail stores to analyze customer behavior, optimize store layouts, and improve the shopping experience.",
-                "technologies": ["PyTorch", "OpenCV", "YOLO", "TensorRT", "Kubernetes"],
-                "image": "project4.jpg",
-                "github_url": "https://github.com/yourusername/retail-vision"
-            },
-            {
-                "title": "Recommendation Engine",
-                "category": "Recommender Systems",
-                "description": "Designed and deployed a hybrid recommendation engine combining collaborative filtering and content-based approaches for a media streaming platform.",
-                "technologies": ["TensorFlow", "Scikit-learn", "FastAPI", "PostgreSQL", "AWS"],
-                "image": "project5.jpg",
-                "github_url": "https://github.com/yourusername/recommendation-engine"
-            },
-            {
-                "title": "AI Model Monitoring Platform",
-                "category": "MLOps",
-                "description": "Built a comprehensive platform for monitoring ML models in production, detecting drift, and automating retraining processes.",
-                "technologies": ["Python", "Prometheus", "Grafana", "Docker", "Kubernetes"],
-                "image": "project6.jpg",
-                "github_url": "https://github.com/yourusername/model-monitoring"
-            }
-        ]
-        
-        # Experience
-        self._experience = [
-            {
-                "title": "Senior AI Engineer",
-                "company": "TechCorp AI",
-                "start_date": "Jan 2022",
-                "end_date": "Present",
-                "description": """
-                * Led the development of a large-scale NLP system for document processing, improving accuracy by 35%
-                * Designed and implemented a computer vision solution for manufacturing quality control
-                * Mentored junior engineers and established best practices for ML model development and deployment
-                * Collaborated with product teams to define AI roadmap and technical requirements
-                """,
-                "technologies": ["PyTorch", "Transformers", "FastAPI", "Docker", "Kubernetes", "AWS"]
-            },
-            {
-                "title": "Machine Learning Engineer",
-                "company": "DataSmart Solutions",
-                "start_date": "Mar 2019",
-                "end_date": "Dec 2021",
-                "description": """
-                * Developed recommendation algorithms that increased user engagement by 28%
-                * Built and deployed predictive models for customer churn reduction
-                * Implemented data pipelines for efficient processing of large datasets
-                * Collaborated with data scientists to optimize model performance
-                """,
-                "technologies": ["TensorFlow", "Scikit-learn", "Keras", "SQL", "Airflow", "GCP"]
-            },
-            {
-                "title": "Data Scientist",
-                "company": "AI Innovations",
-                "start_date": "Jun 2017",
-                "end_date": "Feb 2019",
-                "description": """
-                * Conducted exploratory data analysis and feature engineering for various ML projects
-                * Developed classification models for customer segmentation
-                * Created interactive dashboards for visualizing model results
-                * Participated in client meetings to present findings and recommendations
-                """,
-                "technologies": ["Python", "Pandas", "Scikit-learn", "Matplotlib", "SQL", "Tableau"]
-            }
-        ]
-        
-        # Education
-        self._education = [
-            {
-                "degree": "Master of Science in Artificial Intelligence",
-                "institution": "Stanford University",
-                "start_date": "2015",
-                "end_date": "2017",
-                "description": """
-                * Specialized in Machine Learning and Natural Language Processing
-                * Research assistant in the AI Lab working on deep learning applications
-                * Thesis: "Attention Mechanisms in Neural Networks for Document Classification"
-                """
-            },
-            {
-                "degree": "Bachelor of Science in Computer Science",
-                "institution": "University of California, Berkeley",
-                "start_date": "2011",
-                "end_date": "2015",
-                "description": """
-                * Minor in Mathematics
-                * Dean's List for Academic Excellence
-                * Participated in AI and Machine Learning student research group
-                """
-            }
-        ]
-    
-    def get_bio(self) -> str:
-        """Get the short bio."""
-        return self._bio
-    
-    def get_about(self) -> str:
-        """Get the about section content."""
-        return self._about
-    
-    def get_technical_skills(self) -> List[str]:
-        """Get technical skills list."""
-        return self._technical_skills
-    
-    def get_ai_ml_skills(self) -> List[str]:
-        """Get AI and ML specific skills."""
-        return self._ai_ml_skills
-    
-    def get_tools_platforms(self) -> List[str]:
-        """Get tools and platforms list."""
-        return self._tools_platforms
-    
-    def get_projects(self) -> List[Dict[str, Any]]:
-        """Get projects list."""
-        return self._projects
-    
-    def get_experience(self) -> List[Dict[str, Any]]:
-        """Get work experience list."""
-        return self._experience
-    
-    def get_education(self) -> List[Dict[str, Any]]:
-        """Get education list."""
-        return self._education
-    
-    def update_bio(self, new_bio: str) -> None:
-        """Update the bio."""
-        self._bio = new_bio
-    
-    def update_about(self, new_about: str) -> None:
-        """Update the about section."""
-        self._about = new_about
-    
-    def add_project(self, project: Dict[str, Any]) -> None:
-        """Add a new project."""
-        self._projects.append(project)
-    
-    def add_experience(self, experience: Dict[str, Any]) -> None:
-        """Add a new work experience."""
-        self._experience.append(experience)
-    
-    def add_education(self, education: Dict[str, Any]) -> None:
-        """Add a new education entry."""
-        self._education.append(education)
\ No newline at end of file
+    app.remove_route('/')  # NOTE replaces NiceGUI's auto-index page
+
+    @app.api_route('/', methods=['GET', 'HEAD'], include_in_schema=False)
+    def cached_home_page(request: Request) -> Response:
+        """Serve the pre-rendered portfolio from memory."""
+        return page_cache.response(request, get_portfolio_service())
+
+    ui.page('/contact-form')(contact_form_page)
+    logger.info("Serving pre-rendered portfolio page (RENDER_MODE=cached)")
+else:
+    ui.page('/')(home_page)
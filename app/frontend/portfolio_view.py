@@ -0,0 +1,135 @@
+"""
+Server-rendered portfolio page for the FastAPI mode (Jinja2).
+
+The page is ``portfolio.html`` (extending ``base.html``) with one template per
+section under ``sections/``. Rendered sections are cached per content
+version (and dropped when reloaded settings change them), so a page view mostly joins cached fragments. The response is
+streamed section by section: the document head, navigation and hero go out
+before the remaining sections are rendered.
+"""
+import threading
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from jinja2 import Environment
+from markupsafe import Markup
+from starlette.concurrency import iterate_in_threadpool
+
+from app.core.config import RELOADABLE_SETTINGS, Settings
+from app.core.hot_reload import current_settings, on_settings_change
+from app.core.startup import component
+from app.frontend.markup import (ANALYTICS_SCRIPT, PROFILE_IMAGE_SIZES, PROJECT_IMAGE_SIZES, render_markdown,
+                                 render_picture)
+from app.services.portfolio_service import PortfolioService
+
+SECTIONS = ('hero', 'about', 'skills', 'projects', 'experience', 'education', 'contact')
+
+
+class FragmentCache:
+    """Rendered HTML fragments of the current content version and settings."""
+
+    def __init__(self):
+        # Bumped by invalidate(); renders that started before are not stored
+        self.epoch = 0
+        # (version, epoch) and its fragments, replaced together so readers need no lock
+        self._entry: Tuple[Optional[Tuple[int, int]], Dict[str, str]] = (None, {})
+        self._lock = threading.Lock()
+
+    def get(self, name: str, version: int, epoch: int, render: Callable[[], str]) -> str:
+        """Return fragment ``name`` for ``version``, rendering it on a miss.
+
+        Fragments of older versions are dropped as soon as a newer one is asked
+        for; renders for an invalidated ``epoch`` are returned but not stored.
+        """
+        key = (version, epoch)
+        cached_key, fragments = self._entry
+        fragment = fragments.get(name) if cached_key == key else None
+        if fragment is not None:
+            return fragment
+        with self._lock:
+            if epoch != self.epoch:
+                return render()
+            if self._entry[0] != key:
+                self._entry = (key, {})
+            fragments = self._entry[1]
+            fragment = fragments.get(name)
+            if fragment is None:
+                fragment = render()
+                fragments[name] = fragment
+        return fragment
+
+    def has_all(self, names: Iterable[str], version: int) -> bool:
+        """True if every fragment in ``names`` is cached for ``version`` and the current settings."""
+        key, fragments = self._entry
+        return key == (version, self.epoch) and all(name in fragments for name in names)
+
+    def invalidate(self) -> None:
+        """Drop every fragment, e.g. after the settings they show were reloaded."""
+        with self._lock:
+            self.epoch += 1
+            self._entry = (None, {})
+
+
+class PortfolioView:
+    """Streams the portfolio page from Jinja2 templates with per-section fragment caching."""
+
+    def __init__(self, env: Environment, sections: Tuple[str, ...] = SECTIONS):
+        self.env = env
+        self.sections = sections
+        self.fragments = FragmentCache()
+        env.filters.setdefault('markdown', lambda text: Markup(render_markdown(text)))
+        env.globals.setdefault('picture', lambda *args, **kwargs: Markup(render_picture(*args, **kwargs)))
+        env.globals.setdefault('PROJECT_IMAGE_SIZES', PROJECT_IMAGE_SIZES)
+        env.globals.setdefault('PROFILE_IMAGE_SIZES', PROFILE_IMAGE_SIZES)
+        env.globals.setdefault('analytics_script', Markup(ANALYTICS_SCRIPT))
+
+    def render_section(self, name: str, service: PortfolioService, config: Settings) -> str:
+        return self.env.get_template(f'sections/{name}.html').render(portfolio=service, settings=config)
+
+    def stream(self, service: PortfolioService, version: Optional[int] = None) -> Iterator[bytes]:
+        """Yield the page in chunks that each end with a complete section (blocking)."""
+        version = service.version if version is None else version
+        # Epoch before the snapshot: a render that sees the new epoch also sees the new settings
+        epoch = self.fragments.epoch
+        config = current_settings()
+        section_done = False
+
+        def fragment(name: str) -> Markup:
+            nonlocal section_done
+            section_done = True
+            return Markup(self.fragments.get(
+                name, version, epoch, lambda: self.render_section(name, service, config)))
+
+        buffer = []
+        template = self.env.get_template('portfolio.html')
+        for chunk in template.generate(sections=self.sections, fragment=fragment, settings=config):
+            buffer.append(chunk)
+            if section_done:
+                yield ''.join(buffer).encode('utf-8')
+                buffer.clear()
+                section_done = False
+        if buffer:
+            yield ''.join(buffer).encode('utf-8')
+
+    async def stream_async(self, service: PortfolioService) -> AsyncIterator[bytes]:
+        """Stream the page for a ``StreamingResponse``.
+
+        Uncached sections (markdown, store reads) render in the threadpool, off
+        the event loop, and each is flushed as it completes. Once every section
+        is cached, only the layout is left to render; that is cheaper than a
+        thread hop, so it runs on the loop and the page goes out in one write.
+        """
+        version = service.version
+        if self.fragments.has_all(self.sections, version):
+            yield b''.join(self.stream(service, version))
+        else:
+            async for chunk in iterate_in_threadpool(self.stream(service, version)):
+                yield chunk
+
+
+@component("portfolio view")
+def get_portfolio_view() -> PortfolioView:
+    """Return the process-wide server-rendered portfolio view."""
+    from app import get_templates
+    view = PortfolioView(get_templates().env)
+    on_settings_change(RELOADABLE_SETTINGS, view.fragments.invalidate)
+    return view
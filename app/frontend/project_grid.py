@@ -0,0 +1,148 @@
+"""
+Incrementally loaded, windowed project grid for the NiceGUI page.
+"""
+import asyncio
+import logging
+import math
+from typing import Dict, List
+
+from nicegui import context, ui
+
+from app.core.config import settings
+from app.frontend.markup import PROJECT_IMAGE_SIZES, render_picture
+from app.models.portfolio import Project
+from app.services.analytics import get_analytics, visitor_key
+from app.services.portfolio_service import PortfolioService
+
+logger = logging.getLogger(__name__)
+
+
+def record_click(project: Project) -> None:
+    """Count a click on one of the project's links in the visitor analytics."""
+    get_analytics().record_project_click(project.title, project.technologies,
+                                         visitor_key(context.get_client().environ['asgi.scope']))
+
+
+def create_project_card(project: Project) -> None:
+    """Build a single project card in the current container."""
+    with ui.card().classes('card h-full'):
+        if project.image:
+            ui.html(render_picture(project.image, project.title, 'w-full h-48 object-cover',
+                                   PROJECT_IMAGE_SIZES)).classes('w-full')
+
+        with ui.card_section():
+            ui.label(project.title).classes('text-xl font-bold')
+            ui.label(project.category).classes('text-sm text-gray-500 mb-2')
+            ui.markdown(project.description).classes('text-sm mb-4')
+
+            with ui.row().classes('flex-wrap gap-1 mb-4'):
+                for tech in project.technologies:
+                    ui.label(tech).classes('text-xs skill-tag py-1 px-2')
+
+            with ui.row().classes('gap-2'):
+                links = []
+                if project.demo_url:
+                    links.append(ui.link('Live Demo', project.demo_url, new_tab=True)
+                                 .classes('text-sm text-primary font-medium'))
+                if project.github_url:
+                    links.append(ui.link('GitHub', project.github_url, new_tab=True)
+                                 .classes('text-sm text-primary font-medium'))
+                if settings.ANALYTICS:
+                    for link in links:
+                        link.on('click', lambda: record_click(project))
+
+
+class ProjectGrid:
+    """Project cards fetched batch by batch as the visitor scrolls down.
+
+    Only the first batch is built with the page. A ``q-intersection`` sentinel
+    below the grid requests the next batch through a paginated service call.
+    At most ``max_batches`` batches keep their elements on the server; batches
+    far from the viewport are released and replaced by an empty placeholder of
+    the same height, which rebuilds them when they scroll back into view. The
+    per-client element tree therefore stays bounded however large the catalog is.
+    """
+
+    def __init__(self, service: PortfolioService, batch_size: int = 9, max_batches: int = 3):
+        self.service = service
+        self.batch_size = max(1, batch_size)
+        self.max_batches = max(2, max_batches)
+        self.batch_count = math.ceil(service.count_projects() / self.batch_size)
+        self._slots: List[ui.element] = []
+        self._rendered: Dict[int, ui.element] = {}
+        self._lock = asyncio.Lock()
+
+        self.container = ui.column().classes('w-full gap-6')
+        if self.batch_count:
+            self._append_slot()
+            self._render_batch(0)
+            self._create_sentinel()
+
+    @property
+    def rendered_batches(self) -> List[int]:
+        return sorted(self._rendered)
+
+    def _append_slot(self) -> ui.element:
+        with self.container:
+            slot = ui.element('div').classes('w-full')
+        self._slots.append(slot)
+        return slot
+
+    def _render_batch(self, batch: int) -> None:
+        slot = self._slots[batch]
+        slot.clear()
+        slot.style(replace='')
+        projects = self.service.get_projects(batch * self.batch_size, self.batch_size)
+        with slot:
+            with ui.grid(columns=3).classes('gap-6 w-full') as grid:
+                for project in projects:
+                    create_project_card(project)
+        self._rendered[batch] = grid
+
+    def _create_sentinel(self) -> None:
+        # NOTE a fresh q-intersection reports its initial visibility, so the
+        # next batch is requested again if the sentinel is still on screen
+        with self.container:
+            self._sentinel = ui.element('q-intersection').style('height: 1px; width: 100%')
+        self._sentinel.on('visibility', self._handle_sentinel)
+
+    async def _handle_sentinel(self, event) -> None:
+        if not event.args:
+            return
+        async with self._lock:
+            next_batch = len(self._slots)
+            if next_batch >= self.batch_count:
+                return
+            self._sentinel.delete()
+            self._append_slot()
+            self._render_batch(next_batch)
+            await self._release_far_batches(next_batch)
+            if next_batch + 1 < self.batch_count:
+                self._create_sentinel()
+
+    async def _handle_placeholder(self, batch: int, event) -> None:
+        if not event.args or batch in self._rendered:
+            return
+        async with self._lock:
+            if batch in self._rendered:
+                return
+            self._render_batch(batch)
+            await self._release_far_batches(batch)
+
+    async def _release_far_batches(self, focus: int) -> None:
+        """Release rendered batches farthest from ``focus`` until the window fits."""
+        while len(self._rendered) > self.max_batches:
+            batch = max(self._rendered, key=lambda b: abs(b - focus))
+            grid = self._rendered.pop(batch)
+            slot = self._slots[batch]
+            try:
+                height = await self.container.client.run_javascript(
+                    f'(e => (e.$el || e).offsetHeight)(getElement({grid.id}))', timeout=2.0)
+            except TimeoutError:
+                height = None
+            slot.clear()
+            slot.style(f'min-height: {int(height or 0) or 480}px')
+            with slot:
+                placeholder = ui.element('q-intersection').classes('w-full').style('min-height: inherit')
+            placeholder.on('visibility', lambda event, batch=batch: self._handle_placeholder(batch, event))
+            logger.debug(f"Released project batch {batch}; rendered batches: {self.rendered_batches}")
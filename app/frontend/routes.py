@@ -1,25 +1,20 @@
-from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-import os
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.response_cache import cache_response
+from app.frontend.portfolio_view import get_portfolio_view
+from app.services.portfolio_service import get_portfolio_service
 
 router = APIRouter()
 
-# This file is mainly for FastAPI routes, but we're using NiceGUI as our primary UI
-# So this is just a placeholder that redirects to the NiceGUI interface
+# Server-rendered portfolio for the FastAPI mode; the NiceGUI mode serves its own pages
+
 
-@router.get("/", response_class=HTMLResponse)
-async def read_root(request: Request):
-    """Redirect to the NiceGUI interface."""
-    return """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta http-equiv="refresh" content="0;url=/" />
-        <title>Redirecting...</title>
-    </head>
-    <body>
-        <p>Redirecting to the portfolio...</p>
-    </body>
-    </html>
-    """
\ No newline at end of file
+@router.get("/", response_class=StreamingResponse)
+@cache_response(settings.RESPONSE_CACHE_TTL_SECONDS, settings.RESPONSE_CACHE_STALE_SECONDS)
+async def read_root():
+    """Stream the portfolio page, flushing the hero before the remaining sections render."""
+    view = get_portfolio_view()
+    return StreamingResponse(view.stream_async(get_portfolio_service()), media_type="text/html",
+                             headers={"Cache-Control": "no-cache"})
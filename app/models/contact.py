@@ -0,0 +1,41 @@
+"""
+Contact form models
+"""
+from dataclasses import dataclass, field
+from typing import Optional
+import time
+
+from pydantic import BaseModel, Field, field_validator
+
+
+@dataclass
+class ContactMessage:
+    """A contact form submission on its way to storage and delivery."""
+    name: str
+    email: str
+    message: str
+    subject: str = ""
+    source: str = "form"
+    created_at: float = field(default_factory=time.time)
+    id: Optional[int] = None
+    attempts: int = 0
+
+
+class ContactRequest(BaseModel):
+    """Contact submission accepted by the JSON API."""
+    name: str = Field(..., min_length=1, max_length=200)
+    email: str = Field(..., min_length=3, max_length=320)
+    subject: str = Field("", max_length=300)
+    message: str = Field(..., min_length=1, max_length=10_000)
+
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, value: str) -> str:
+        local, _, domain = value.partition("@")
+        if not local or "." not in domain:
+            raise ValueError("invalid email address")
+        return value
+
+    def to_message(self, source: str = "api") -> ContactMessage:
+        return ContactMessage(name=self.name, email=self.email, subject=self.subject,
+                              message=self.message, source=source)
@@ -0,0 +1,88 @@
+"""
+Portfolio entry models
+
+Entries are frozen, slotted dataclasses: no per-instance ``__dict__``, and
+safe to hand out from the store without defensive copies. Strings that
+repeat across entries (technologies, categories, employers) are interned,
+so 10k projects using the same 50 technologies hold 50 strings, not 10k
+copies of each.
+"""
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Type, TypeVar
+import sys
+
+E = TypeVar("E", bound="PortfolioEntry")
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+def _intern_all(values: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values)
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioEntry:
+    """Shared conversion between entries and their JSON/dict form."""
+
+    @classmethod
+    def from_dict(cls: Type[E], data: Mapping[str, Any]) -> E:
+        """Build an entry from a dict (unknown keys are ignored)."""
+        return cls(**{field.name: data[field.name] for field in fields(cls) if field.name in data})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for JSON responses and storage; unset optional fields are left out."""
+        return {field.name: value for field in fields(self)
+                if (value := getattr(self, field.name)) is not None}
+
+
+@dataclass(frozen=True, slots=True)
+class Project(PortfolioEntry):
+    title: str
+    category: str
+    description: str
+    technologies: Tuple[str, ...] = ()
+    image: Optional[str] = None
+    github_url: Optional[str] = None
+    demo_url: Optional[str] = None
+    date: Optional[str] = None
+
+    def __post_init__(self):
+        # Frozen: normalize through object.__setattr__
+        object.__setattr__(self, "category", _intern(self.category))
+        object.__setattr__(self, "technologies", _intern_all(self.technologies))
+
+
+@dataclass(frozen=True, slots=True)
+class Experience(PortfolioEntry):
+    title: str
+    company: str
+    start_date: str
+    end_date: str
+    description: str
+    technologies: Tuple[str, ...] = ()
+    location: Optional[str] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "company", _intern(self.company))
+        object.__setattr__(self, "technologies", _intern_all(self.technologies))
+
+
+@dataclass(frozen=True, slots=True)
+class Education(PortfolioEntry):
+    degree: str
+    institution: str
+    start_date: str
+    end_date: str
+    description: str
+
+    def __post_init__(self):
+        object.__setattr__(self, "institution", _intern(self.institution))
+
+
+def to_jsonable(value: Any) -> Any:
+    """``json.dumps(default=...)`` hook for responses that contain entries."""
+    if isinstance(value, PortfolioEntry):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,322 @@
+"""
+Analytics - Visitor statistics aggregated in fixed memory
+
+Page views, section navigations (the ``/#projects``, ``/#skills``, ... links)
+and project link clicks are folded into per-day aggregates as they happen:
+a HyperLogLog of visitors, event counters, and count-min top-k sketches of
+projects and of their technologies. Nothing per event or per visitor is
+kept; visitors are identified by a hash of IP address and user agent that
+only ever enters the HyperLogLog.
+
+The aggregates of the current flush interval are merged into an SQLite file
+in one transaction, so several workers can share it and memory stays the
+same however much traffic comes in.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import asyncio
+import logging
+import marshal
+import os
+import sqlite3
+import threading
+import time
+
+from app.core.config import settings
+from app.core.rate_limit import client_ip
+from app.core.startup import component
+from app.services.sketches import CountMinSketch, HyperLogLog, TopK
+
+logger = logging.getLogger(__name__)
+
+# Sections a navigation event may name (the anchors of the portfolio page)
+SECTIONS = ("about", "skills", "projects", "experience", "education", "contact")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily (
+    day TEXT PRIMARY KEY,
+    state BLOB NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def visitor_key(scope: Dict[str, Any]) -> str:
+    """Stable key of the visitor making a request (hashed into the HyperLogLog, never stored)."""
+    user_agent = next((value for name, value in scope.get('headers', ()) if name == b'user-agent'), b'')
+    address = client_ip(scope, settings.TRUST_FORWARDED_FOR, settings.CLIENT_IP_HEADER)
+    return f"{address}|{user_agent.decode('latin-1')}"
+
+
+def today() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+@dataclass
+class DailyAggregate:
+    """Everything recorded for one UTC day; the same size whatever the traffic."""
+    precision: int = 14
+    width: int = 2048
+    depth: int = 4
+    top_n: int = 20
+    visitors: HyperLogLog = None
+    events: Dict[str, int] = field(default_factory=dict)
+    projects: TopK = None
+    technologies: TopK = None
+
+    def __post_init__(self):
+        if self.visitors is None:
+            self.visitors = HyperLogLog(self.precision)
+        if self.projects is None:
+            self.projects = TopK(self.top_n, CountMinSketch(self.width, self.depth))
+        if self.technologies is None:
+            self.technologies = TopK(self.top_n, CountMinSketch(self.width, self.depth))
+
+    def count(self, event: str) -> None:
+        self.events[event] = self.events.get(event, 0) + 1
+
+    def merge(self, other: "DailyAggregate") -> None:
+        self.visitors.merge(other.visitors)
+        for event, count in other.events.items():
+            self.events[event] = self.events.get(event, 0) + count
+        self.projects.merge(other.projects)
+        self.technologies.merge(other.technologies)
+
+    def to_bytes(self) -> bytes:
+        return marshal.dumps({
+            "shape": (self.precision, self.width, self.depth),
+            "visitors": self.visitors.to_bytes(),
+            "events": self.events,
+            "projects": (self.projects.sketch.to_rows(), list(self.projects.candidates)),
+            "technologies": (self.technologies.sketch.to_rows(), list(self.technologies.candidates)),
+        })
+
+    @classmethod
+    def from_bytes(cls, raw: bytes, top_n: int) -> "DailyAggregate":
+        """Decode a stored aggregate.
+
+        Raises:
+            ValueError: If ``raw`` is corrupt.
+        """
+        try:
+            state = marshal.loads(raw)
+            precision, width, depth = state["shape"]
+            return cls(
+                precision, width, depth, top_n,
+                visitors=HyperLogLog(precision, state["visitors"]),
+                events=dict(state["events"]),
+                projects=TopK(top_n, CountMinSketch(width, depth, state["projects"][0]), state["projects"][1]),
+                technologies=TopK(top_n, CountMinSketch(width, depth, state["technologies"][0]),
+                                  state["technologies"][1]),
+            )
+        except (EOFError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"corrupt analytics aggregate: {e}") from e
+
+
+class AnalyticsStore:
+    """Per-day aggregates in a WAL-mode SQLite file, merged in place on each flush."""
+
+    def __init__(self, path: str, top_n: int = 20):
+        self.path = path
+        self.top_n = top_n
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def merge(self, aggregates: Dict[str, DailyAggregate], retention_days: int = 0) -> None:
+        """Add each day's aggregate to the stored one in a single transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for day, aggregate in aggregates.items():
+                    row = self._conn.execute("SELECT state FROM daily WHERE day = ?", (day,)).fetchone()
+                    if row is not None:
+                        try:
+                            stored = DailyAggregate.from_bytes(row[0], self.top_n)
+                            stored.merge(aggregate)
+                            aggregate = stored
+                        except ValueError as e:
+                            # Sketch settings changed or the row is damaged; the day restarts from this batch
+                            logger.warning(f"Replacing analytics for {day}: {e}")
+                    self._conn.execute(
+                        "INSERT INTO daily (day, state, updated_at) VALUES (?, ?, ?) "
+                        "ON CONFLICT (day) DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at",
+                        (day, aggregate.to_bytes(), time.time()),
+                    )
+                if retention_days:
+                    cutoff = (datetime.now(timezone.utc) - timedelta(days=retention_days)).strftime("%Y-%m-%d")
+                    self._conn.execute("DELETE FROM daily WHERE day < ?", (cutoff,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def days(self, first: str, last: str) -> Iterable[Tuple[str, DailyAggregate]]:
+        """Stored aggregates from ``first`` to ``last`` (inclusive), decoded one at a time."""
+        with self._lock:
+            rows = self._conn.execute("SELECT day FROM daily WHERE day BETWEEN ? AND ? ORDER BY day",
+                                      (first, last)).fetchall()
+        for (day,) in rows:
+            with self._lock:
+                row = self._conn.execute("SELECT state FROM daily WHERE day = ?", (day,)).fetchone()
+            if row is None:
+                continue
+            try:
+                yield day, DailyAggregate.from_bytes(row[0], self.top_n)
+            except ValueError as e:
+                logger.warning(f"Skipping analytics for {day}: {e}")
+
+    def ping(self) -> None:
+        with self._lock:
+            self._conn.execute("SELECT 1").fetchone()
+
+
+class Analytics:
+    """Records events into the current day's in-memory aggregate and flushes it periodically."""
+
+    def __init__(self, store: AnalyticsStore, flush_interval: float = 60.0, precision: int = 14,
+                 width: int = 2048, depth: int = 4, top_n: int = 20, retention_days: int = 0):
+        self.store = store
+        self.flush_interval = flush_interval
+        self.shape = dict(precision=precision, width=width, depth=depth, top_n=top_n)
+        self.retention_days = retention_days
+        # Day -> events since the last flush; one day except around midnight
+        self._pending: Dict[str, DailyAggregate] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def _aggregate(self) -> DailyAggregate:
+        day = today()
+        aggregate = self._pending.get(day)
+        if aggregate is None:
+            aggregate = self._pending[day] = DailyAggregate(**self.shape)
+        return aggregate
+
+    def record_page_view(self, visitor: str) -> None:
+        with self._lock:
+            aggregate = self._aggregate()
+            aggregate.visitors.add(visitor)
+            aggregate.count("page_view")
+
+    def record_section(self, section: str, visitor: str) -> None:
+        """Count a navigation to one of ``SECTIONS``.
+
+        Raises:
+            ValueError: If ``section`` is not a section of the page.
+        """
+        if section not in SECTIONS:
+            raise ValueError(f"unknown section {section!r}")
+        with self._lock:
+            aggregate = self._aggregate()
+            aggregate.visitors.add(visitor)
+            aggregate.count(f"section:{section}")
+
+    def record_project_click(self, title: str, technologies: Iterable[str], visitor: str) -> None:
+        """Count a click on a project's demo or repository link, and on its technologies."""
+        with self._lock:
+            aggregate = self._aggregate()
+            aggregate.visitors.add(visitor)
+            aggregate.count("project_click")
+            aggregate.projects.add(title)
+            for technology in technologies:
+                aggregate.technologies.add(technology)
+
+    def flush(self) -> int:
+        """Merge the pending aggregates into the store (blocking); returns the number of days written."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            self.store.merge(pending, self.retention_days)
+        except Exception:
+            # Keep the batch for the next flush rather than dropping it
+            with self._lock:
+                for day, aggregate in pending.items():
+                    current = self._pending.get(day)
+                    if current is not None:
+                        aggregate.merge(current)
+                    self._pending[day] = aggregate
+            raise
+        return len(pending)
+
+    def summary(self, days: int = 7) -> Dict[str, Any]:
+        """Totals over the last ``days`` UTC days, including events not flushed yet (blocking)."""
+        last = today()
+        first = (datetime.now(timezone.utc) - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+        with self._lock:
+            pending = {day: DailyAggregate.from_bytes(aggregate.to_bytes(), self.shape["top_n"])
+                       for day, aggregate in self._pending.items() if first <= day <= last}
+        total = DailyAggregate(**self.shape)
+        per_day: List[Dict[str, Any]] = []
+
+        def add_day(day: str, aggregate: DailyAggregate) -> None:
+            if day in pending:
+                aggregate.merge(pending.pop(day))
+            total.merge(aggregate)
+            per_day.append({"day": day, "unique_visitors": aggregate.visitors.count(),
+                            "page_views": aggregate.events.get("page_view", 0)})
+
+        for day, aggregate in self.store.days(first, last):
+            add_day(day, aggregate)
+        for day in sorted(pending):
+            add_day(day, pending[day])
+        per_day.sort(key=lambda item: item["day"])
+        return {
+            "from": first,
+            "to": last,
+            "unique_visitors": total.visitors.count(),
+            "page_views": total.events.get("page_view", 0),
+            "sections": {section: total.events.get(f"section:{section}", 0) for section in SECTIONS},
+            "project_clicks": total.events.get("project_click", 0),
+            "top_projects": [{"title": title, "clicks": count} for title, count in total.projects.items()],
+            "top_technologies": [{"technology": name, "clicks": count} for name, count in total.technologies.items()],
+            "days": per_day,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception:
+                logger.exception("Flushing analytics failed; retrying with the next batch")
+
+    async def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="analytics-flush")
+            logger.info(f"Analytics started (flush every {self.flush_interval}s to {self.store.path})")
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write what is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception:
+                logger.exception("Flushing analytics on shutdown failed")
+
+
+@component("analytics")
+def get_analytics() -> Analytics:
+    """Return the process-wide analytics recorder."""
+    return Analytics(
+        AnalyticsStore(settings.ANALYTICS_DB_PATH, top_n=settings.ANALYTICS_TOP_N),
+        flush_interval=settings.ANALYTICS_FLUSH_INTERVAL_SECONDS,
+        precision=settings.ANALYTICS_HLL_PRECISION,
+        width=settings.ANALYTICS_CMS_WIDTH,
+        depth=settings.ANALYTICS_CMS_DEPTH,
+        top_n=settings.ANALYTICS_TOP_N,
+        retention_days=settings.ANALYTICS_RETENTION_DAYS,
+    )
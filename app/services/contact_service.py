@@ -0,0 +1,290 @@
+"""
+Contact Service - Queued, batched and retried handling of contact form submissions
+"""
+from typing import Any, Dict, Hashable, List, Optional
+import asyncio
+import logging
+import time
+
+from app.core.config import settings
+from app.core.rate_limit import DuplicateFilter, TokenBucketLimiter
+from app.core.startup import component
+from app.models.contact import ContactMessage
+from app.services.contact_store import ContactMessageStore
+from app.services.mailer import Mailer, SMTPConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+class ContactQueueFullError(Exception):
+    """Raised when the submission queue is at capacity; callers should ask the user to retry later."""
+
+
+class ContactRateLimitedError(Exception):
+    """Raised when a client submits faster than the configured rate."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limit exceeded, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class ContactPipeline:
+    """Moves contact messages from the UI to durable storage and on to SMTP.
+
+    ``submit()`` only enqueues, so form handlers return immediately. A writer
+    task drains the bounded queue in batches into the append-only store, and
+    a delivery task sends stored messages through the pooled mailer, retrying
+    failures with exponential backoff. Undelivered messages survive restarts
+    because delivery always reads from the store.
+
+    Before anything is queued, an optional per-client token bucket rejects
+    floods and an optional content-hash filter drops repeated identical
+    messages, so abusive traffic costs a dict lookup rather than any I/O.
+    """
+
+    def __init__(self, store: ContactMessageStore, mailer: Optional[Mailer] = None,
+                 queue_size: int = 1000, batch_size: int = 50, batch_timeout: float = 0.5,
+                 max_attempts: int = 5, retry_base: float = 2.0, retry_max: float = 300.0,
+                 delivery_concurrency: int = 2, poll_interval: float = 5.0, delivery_lease: float = 300.0,
+                 limiter: Optional[TokenBucketLimiter] = None,
+                 duplicates: Optional[DuplicateFilter] = None):
+        self.store = store
+        self.mailer = mailer
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.delivery_concurrency = delivery_concurrency
+        self.poll_interval = poll_interval
+        self.delivery_lease = delivery_lease
+        self.limiter = limiter
+        self.duplicates = duplicates
+        self._queue: Optional[asyncio.Queue] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self.stats = {"accepted": 0, "rejected": 0, "rate_limited": 0, "duplicates": 0, "stored": 0, "delivered": 0, "retried": 0, "failed": 0}
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    @property
+    def depth(self) -> int:
+        """Number of submissions waiting to be written to the store."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def submit(self, message: ContactMessage, client_key: Optional[Hashable] = None) -> bool:
+        """Enqueue a message without waiting.
+
+        Returns False if the message duplicates a recent one and was dropped.
+        Only accepted messages spend a rate-limit token and are remembered as
+        seen.
+
+        Raises:
+            ContactRateLimitedError: If ``client_key`` exceeded its submission rate.
+            ContactQueueFullError: If the queue is at capacity or the pipeline is not running.
+        """
+        limited = self.limiter is not None and client_key is not None
+        if limited:
+            retry_after = self.limiter.acquire(client_key)
+            if retry_after:
+                self.stats["rate_limited"] += 1
+                raise ContactRateLimitedError(retry_after)
+        fingerprint = None
+        if self.duplicates is not None:
+            fingerprint = DuplicateFilter.fingerprint((message.email, message.subject, message.message))
+            if self.duplicates.seen(fingerprint):
+                self.stats["duplicates"] += 1
+                logger.info(f"Dropped duplicate contact message from {message.email}")
+                if limited:
+                    self.limiter.refund(client_key)
+                return False
+        try:
+            if self._queue is None:
+                raise ContactQueueFullError("Contact pipeline is not running")
+            try:
+                self._queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self.stats["rejected"] += 1
+                raise ContactQueueFullError(f"Contact queue is full ({self.queue_size} messages)") from None
+        except ContactQueueFullError:
+            # Not accepted: the retry the caller is asked for must neither be a duplicate nor cost a token
+            if fingerprint is not None:
+                self.duplicates.forget(fingerprint)
+            if limited:
+                self.limiter.refund(client_key)
+            raise
+        self.stats["accepted"] += 1
+        return True
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._write_batches(), name="contact-writer")]
+        if self.mailer is not None:
+            self._tasks.append(asyncio.create_task(self._deliver(), name="contact-delivery"))
+        else:
+            logger.warning("SMTP_HOST is not configured; contact messages are stored but not delivered")
+        logger.info(f"Contact pipeline started (queue size {self.queue_size}, batch size {self.batch_size})")
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Flush queued submissions to the store, then stop the workers."""
+        if not self.running:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Contact pipeline stopped with {self.depth} unsaved messages")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self.mailer is not None:
+            await asyncio.to_thread(self.mailer.close)
+
+    async def _next_batch(self) -> List[ContactMessage]:
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.batch_timeout
+        while len(batch) < self.batch_size:
+            # Take what is already queued without yielding; only wait when the queue is empty
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _write_batches(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._store_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _store_batch(self, batch: List[ContactMessage]) -> None:
+        delay = self.retry_base
+        while True:
+            try:
+                await asyncio.to_thread(self.store.append_batch, batch)
+                break
+            except Exception as e:
+                logger.error(f"Failed to store {len(batch)} contact messages, retrying in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.retry_max)
+        self.stats["stored"] += len(batch)
+        self._wakeup.set()
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self.retry_base * (2 ** attempts), self.retry_max)
+
+    async def _deliver(self) -> None:
+        while True:
+            self._wakeup.clear()
+            # Claimed with a lease so parallel workers never send the same message
+            due = await asyncio.to_thread(self.store.due, self.batch_size, None, self.delivery_lease)
+            if due:
+                semaphore = asyncio.Semaphore(self.delivery_concurrency)
+                await asyncio.gather(*(self._deliver_one(msg, semaphore) for msg in due))
+                if len(due) == self.batch_size:
+                    continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _deliver_one(self, msg: ContactMessage, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            try:
+                await asyncio.to_thread(self.mailer.send, msg)
+            except Exception as e:
+                attempts = msg.attempts + 1
+                give_up = attempts >= self.max_attempts
+                next_attempt_at = time.time() + self._backoff(msg.attempts)
+                await asyncio.to_thread(self.store.mark_failed, msg.id, str(e), next_attempt_at, give_up)
+                if give_up:
+                    self.stats["failed"] += 1
+                    logger.error(f"Giving up on contact message {msg.id} after {attempts} attempts: {e}")
+                else:
+                    self.stats["retried"] += 1
+                    logger.warning(f"Delivery of contact message {msg.id} failed (attempt {attempts}): {e}")
+                return
+            await asyncio.to_thread(self.store.mark_delivered, msg.id)
+            self.stats["delivered"] += 1
+
+    def status(self) -> Dict[str, Any]:
+        """Runtime view of the pipeline for health and status endpoints."""
+        return {
+            "running": self.running,
+            "queue_depth": self.depth,
+            "queue_capacity": self.queue_size,
+            "delivery_enabled": self.mailer is not None,
+            **self.stats,
+        }
+
+
+def create_mailer() -> Optional[Mailer]:
+    """Build the SMTP mailer from settings, or None if delivery is not configured."""
+    if not settings.SMTP_HOST:
+        return None
+    pool = SMTPConnectionPool(
+        settings.SMTP_HOST,
+        settings.SMTP_PORT,
+        username=settings.SMTP_USERNAME,
+        password=settings.SMTP_PASSWORD,
+        use_tls=settings.SMTP_USE_TLS,
+        use_ssl=settings.SMTP_USE_SSL,
+        timeout=settings.SMTP_TIMEOUT_SECONDS,
+        size=settings.SMTP_POOL_SIZE,
+    )
+    return Mailer(pool, sender=settings.SMTP_FROM or settings.OWNER_EMAIL, recipient=settings.OWNER_EMAIL)
+
+
+def create_limiter() -> Optional[TokenBucketLimiter]:
+    """Build the per-client submission limiter from settings, or None if disabled."""
+    if settings.CONTACT_RATE_LIMIT_BURST <= 0:
+        return None
+    return TokenBucketLimiter(
+        capacity=settings.CONTACT_RATE_LIMIT_BURST,
+        refill_rate=settings.CONTACT_RATE_LIMIT_PER_HOUR / 3600,
+        max_keys=settings.CONTACT_RATE_LIMIT_MAX_CLIENTS,
+    )
+
+
+def create_duplicate_filter() -> Optional[DuplicateFilter]:
+    """Build the duplicate message filter from settings, or None if disabled."""
+    if settings.CONTACT_DEDUP_WINDOW_SECONDS <= 0:
+        return None
+    return DuplicateFilter(ttl=settings.CONTACT_DEDUP_WINDOW_SECONDS,
+                           max_entries=settings.CONTACT_DEDUP_MAX_ENTRIES)
+
+
+@component("contact pipeline")
+def get_contact_pipeline() -> ContactPipeline:
+    """Return the process-wide contact pipeline."""
+    return ContactPipeline(
+        ContactMessageStore(settings.CONTACT_DB_PATH),
+        create_mailer(),
+        queue_size=settings.CONTACT_QUEUE_SIZE,
+        batch_size=settings.CONTACT_BATCH_SIZE,
+        batch_timeout=settings.CONTACT_BATCH_TIMEOUT_SECONDS,
+        max_attempts=settings.CONTACT_MAX_ATTEMPTS,
+        retry_base=settings.CONTACT_RETRY_BASE_SECONDS,
+        retry_max=settings.CONTACT_RETRY_MAX_SECONDS,
+        delivery_concurrency=settings.SMTP_POOL_SIZE,
+        delivery_lease=settings.CONTACT_DELIVERY_LEASE_SECONDS,
+        limiter=create_limiter(),
+        duplicates=create_duplicate_filter(),
+    )
@@ -0,0 +1,127 @@
+"""
+Contact Store - Append-only SQLite log of contact messages and their delivery state
+"""
+from typing import List, Optional
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from app.models.contact import ContactMessage
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    source TEXT NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    message TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    delivered_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_messages_due ON messages (status, next_attempt_at);
+"""
+
+
+class ContactMessageStore:
+    """Durable, append-only message log in a WAL-mode SQLite file.
+
+    Messages are written in batches and never rewritten except for their
+    delivery columns, so a crash loses at most the batch being written.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def append_batch(self, messages: List[ContactMessage]) -> None:
+        """Persist a batch of messages in a single transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for msg in messages:
+                    cursor = self._conn.execute(
+                        "INSERT INTO messages (created_at, source, name, email, subject, message) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (msg.created_at, msg.source, msg.name, msg.email, msg.subject, msg.message),
+                    )
+                    msg.id = cursor.lastrowid
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def due(self, limit: int, now: Optional[float] = None, lease: float = 0.0) -> List[ContactMessage]:
+        """Return pending messages whose next delivery attempt is due.
+
+        With a ``lease``, the returned messages are also claimed: their next
+        attempt moves ``lease`` seconds ahead in the same statement, so other
+        worker processes sharing the database skip them. Delivery outcomes
+        overwrite the lease; after a crash the messages become due again.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            if lease <= 0:
+                rows = self._conn.execute(
+                    "SELECT id, created_at, source, name, email, subject, message, attempts FROM messages "
+                    "WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY next_attempt_at, id LIMIT ?",
+                    (now, limit),
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "UPDATE messages SET next_attempt_at = ? WHERE id IN ("
+                    "SELECT id FROM messages WHERE status = 'pending' AND next_attempt_at <= ? "
+                    "ORDER BY next_attempt_at, id LIMIT ?) "
+                    "RETURNING id, created_at, source, name, email, subject, message, attempts",
+                    (now + lease, now, limit),
+                ).fetchall()
+                rows.sort(key=lambda row: row[0])
+        return [
+            ContactMessage(id=row[0], created_at=row[1], source=row[2], name=row[3], email=row[4],
+                           subject=row[5], message=row[6], attempts=row[7])
+            for row in rows
+        ]
+
+    def mark_delivered(self, message_id: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE messages SET status = 'delivered', attempts = attempts + 1, delivered_at = ? WHERE id = ?",
+                (time.time(), message_id),
+            )
+
+    def mark_failed(self, message_id: int, error: str, next_attempt_at: float, give_up: bool) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE messages SET status = ?, attempts = attempts + 1, next_attempt_at = ?, last_error = ? "
+                "WHERE id = ?",
+                ("failed" if give_up else "pending", next_attempt_at, error[:500], message_id),
+            )
+
+    def count_by_status(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM messages GROUP BY status").fetchall()
+        return dict(rows)
+
+    def ping(self) -> None:
+        """Raise if the database cannot serve queries (used by the readiness check)."""
+        with self._lock:
+            self._conn.execute("SELECT 1").fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,174 @@
+"""
+Incremental compiler from the Markdown/YAML content sources to a bundle.
+
+Source layout (``CONTENT_SOURCE_DIR``, default ``content/``)::
+
+    bio.md, about.md          markdown
+    skills.yaml               {technical: [...], ai_ml: [...], tools_platforms: [...]}
+    projects/*.md             YAML front matter between ``---`` lines, markdown
+    experience/*.md           body as the description; entries are ordered by
+    education/*.md            file name (hence the numeric prefixes)
+
+The bundle keeps each source file's hash and parsed result next to the
+assembled content. A rebuild reads the previous bundle and re-parses (and
+re-renders) only the files whose hash changed; when none did, nothing is
+written.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import logging
+import marshal
+import os
+
+from app.services.portfolio_content import (
+    BUNDLE_FORMAT, BUNDLE_MAGIC, REQUIRED_FIELDS, PortfolioContent, content_from_dict, load_content, read_bundle,
+)
+
+logger = logging.getLogger(__name__)
+
+TEXT_SOURCES = {"bio.md": "bio", "about.md": "about"}
+SKILLS_SOURCE = "skills.yaml"
+ENTRY_KINDS = tuple(REQUIRED_FIELDS)
+# Front matter values shown as text even when YAML reads them as numbers (e.g. 2015)
+TEXT_FIELDS = ("start_date", "end_date")
+
+
+@dataclass
+class CompileResult:
+    """Outcome of a build: the content plus which sources had to be parsed."""
+    content: PortfolioContent
+    parsed: List[str] = field(default_factory=list)
+    reused: int = 0
+    removed: List[str] = field(default_factory=list)
+    written: bool = False
+
+
+def _source_files(source_dir: str) -> List[str]:
+    """Content files under ``source_dir`` as sorted, '/'-separated relative paths."""
+    files = [name for name in (*TEXT_SOURCES, SKILLS_SOURCE) if os.path.isfile(os.path.join(source_dir, name))]
+    for kind in ENTRY_KINDS:
+        directory = os.path.join(source_dir, kind)
+        if os.path.isdir(directory):
+            files.extend(f"{kind}/{name}" for name in sorted(os.listdir(directory)) if name.endswith(".md"))
+    return files
+
+
+def _split_front_matter(text: str, path: str) -> Tuple[Dict[str, Any], str]:
+    import yaml
+    if not text.startswith("---\n"):
+        return {}, text
+    end = text.find("\n---\n", 3)
+    if end == -1:
+        raise ValueError(f"{path}: front matter is not closed by a '---' line")
+    meta = yaml.safe_load(text[4:end]) or {}
+    if not isinstance(meta, dict):
+        raise ValueError(f"{path}: front matter must be a mapping")
+    return meta, text[end + 5:]
+
+
+def _parse_source(path: str, raw: bytes) -> Tuple[Any, Dict[str, str]]:
+    """Parse one source file into its value and the HTML of its markdown body."""
+    from app.frontend.markup import render_markdown
+    text = raw.decode("utf-8")
+    if path == SKILLS_SOURCE:
+        import yaml
+        skills = yaml.safe_load(text) or {}
+        if not isinstance(skills, dict) or not all(isinstance(items, list) for items in skills.values()):
+            raise ValueError(f"{path}: expected a list of skills per category")
+        return {kind: [str(skill) for skill in items] for kind, items in skills.items()}, {}
+    meta, body = _split_front_matter(text, path)
+    body = body.strip()
+    html = {body: str(render_markdown(body))} if body else {}
+    if path in TEXT_SOURCES:
+        return body, html
+    kind = path.split("/", 1)[0]
+    entry = {**meta, "description": body}
+    for name in TEXT_FIELDS:
+        if name in entry and not isinstance(entry[name], str):
+            entry[name] = str(entry[name])
+    missing = [name for name in REQUIRED_FIELDS[kind] if name not in entry]
+    if missing:
+        raise ValueError(f"{path}: missing {', '.join(missing)}")
+    try:
+        marshal.dumps(entry)
+    except ValueError:
+        raise ValueError(f"{path}: front matter values must be text, numbers, booleans or lists (quote dates)")
+    return entry, html
+
+
+def _read_previous(bundle_path: str) -> Dict[str, Any]:
+    try:
+        with open(bundle_path, "rb") as f:
+            return read_bundle(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_bundle(bundle_path: str, bundle: Dict[str, Any]) -> None:
+    """Write atomically, so readers and concurrently starting workers never see a partial file."""
+    directory = os.path.dirname(bundle_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    payload = BUNDLE_MAGIC + bytes((BUNDLE_FORMAT, marshal.version)) + marshal.dumps(bundle)
+    temp_path = f"{bundle_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(payload)
+    os.replace(temp_path, bundle_path)
+
+
+def compile_content(source_dir: str, bundle_path: str) -> CompileResult:
+    """Bring the bundle at ``bundle_path`` up to date with ``source_dir`` (blocking).
+
+    Raises:
+        ValueError: If a source file is invalid; the existing bundle is kept.
+    """
+    previous = _read_previous(bundle_path)
+    previous_sources: Dict[str, Tuple[str, Any, Dict[str, str]]] = previous.get("sources", {})
+    sources: Dict[str, Tuple[str, Any, Dict[str, str]]] = {}
+    parsed: List[str] = []
+    for path in _source_files(source_dir):
+        with open(os.path.join(source_dir, path), "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        cached = previous_sources.get(path)
+        if cached is not None and cached[0] == digest:
+            sources[path] = cached
+        else:
+            sources[path] = (digest, *_parse_source(path, raw))
+            parsed.append(path)
+    removed = sorted(set(previous_sources) - set(sources))
+
+    data: Dict[str, Any] = {kind: [] for kind in ENTRY_KINDS}
+    html: Dict[str, str] = {}
+    for path, (_, value, rendered) in sources.items():
+        html.update(rendered)
+        if path in TEXT_SOURCES:
+            data[TEXT_SOURCES[path]] = value
+        elif path == SKILLS_SOURCE:
+            data["skills"] = value
+        else:
+            data[path.split("/", 1)[0]].append(value)
+    digest = hashlib.sha256("\n".join(f"{path} {entry[0]}" for path, entry in sources.items()).encode()).hexdigest()
+    content = content_from_dict(data, digest, html)
+
+    result = CompileResult(content, parsed=parsed, reused=len(sources) - len(parsed), removed=removed)
+    if parsed or removed or previous.get("digest") != digest:
+        _write_bundle(bundle_path, {"digest": digest, "content": data, "html": html, "sources": sources})
+        result.written = True
+        logger.info(f"Compiled portfolio content to {bundle_path} ({len(parsed)} parsed, {result.reused} unchanged, "
+                    f"{len(removed)} removed)")
+    return result
+
+
+def load_or_compile(bundle_path: str, source_dir: Optional[str]) -> Optional[PortfolioContent]:
+    """The content at ``bundle_path``, rebuilt first from ``source_dir`` when it exists.
+
+    Checking the sources costs one hash per file, so a bundle left stale on a
+    persistent volume by an older image is still replaced at startup.
+    """
+    if source_dir and os.path.isdir(source_dir) and not bundle_path.endswith(".json"):
+        return compile_content(source_dir, bundle_path).content
+    if os.path.exists(bundle_path):
+        return load_content(bundle_path)
+    return None
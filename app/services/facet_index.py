@@ -0,0 +1,100 @@
+"""
+Facet Index - Inverted index from facet values (e.g. technologies) to entries
+"""
+from typing import Dict, Iterable, List, Optional
+
+_CHUNK_BITS = 4096
+_CHUNK_MASK = (1 << _CHUNK_BITS) - 1
+
+
+class FacetIndex:
+    """Maps each facet value to the set of entry positions carrying it.
+
+    Posting lists are Python ints used as bitsets (bit ``i`` set means entry
+    ``i`` has the facet), so AND/OR filters and counts run as big-int
+    operations in C instead of per-entry Python loops. Entries are append-only
+    and identified by their insertion position.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, int] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, position: int, facets: Iterable[str]) -> None:
+        """Index the entry at ``position`` under each of its facet values."""
+        bit = 1 << position
+        for facet in facets:
+            self._postings[facet] = self._postings.get(facet, 0) | bit
+        self._size = max(self._size, position + 1)
+
+    def reserve(self, size: int) -> None:
+        """Grow the universe to ``size`` entries, e.g. for trailing entries without facets."""
+        self._size = max(self._size, size)
+
+    def append(self, facets: Iterable[str]) -> int:
+        """Index a new entry after the current last one and return its position."""
+        position = self._size
+        self.add(position, facets)
+        return position
+
+    @property
+    def facets(self) -> List[str]:
+        return list(self._postings)
+
+    def match(self, all_of: Iterable[str] = (), any_of: Iterable[str] = ()) -> int:
+        """Return the bitset of entries having every ``all_of`` and at least one ``any_of`` facet."""
+        bits = (1 << self._size) - 1
+        for facet in all_of:
+            bits &= self._postings.get(facet, 0)
+            if not bits:
+                return 0
+        any_of = list(any_of)
+        if any_of:
+            union = 0
+            for facet in any_of:
+                union |= self._postings.get(facet, 0)
+            bits &= union
+        return bits
+
+    @staticmethod
+    def count(bits: int) -> int:
+        return bits.bit_count()
+
+    @staticmethod
+    def positions(bits: int, offset: int = 0, limit: Optional[int] = None) -> List[int]:
+        """Return the positions set in ``bits`` in ascending order, paginated."""
+        result: List[int] = []
+        base = 0
+        while bits and (limit is None or len(result) < limit):
+            chunk = bits & _CHUNK_MASK
+            if chunk:
+                matched = chunk.bit_count()
+                if matched <= offset:
+                    # Skip whole chunks by popcount instead of visiting each match
+                    offset -= matched
+                else:
+                    digits = bin(chunk)[:1:-1]
+                    index = digits.find("1")
+                    while index != -1 and (limit is None or len(result) < limit):
+                        if offset:
+                            offset -= 1
+                        else:
+                            result.append(base + index)
+                        index = digits.find("1", index + 1)
+            bits >>= _CHUNK_BITS
+            base += _CHUNK_BITS
+        return result
+
+    def facet_counts(self, bits: Optional[int] = None) -> Dict[str, int]:
+        """Count matches per facet value within ``bits`` (all entries if omitted)."""
+        if bits is None:
+            return {facet: self.count(posting) for facet, posting in self._postings.items()}
+        counts = {}
+        for facet, posting in self._postings.items():
+            count = self.count(posting & bits)
+            if count:
+                counts[facet] = count
+        return counts
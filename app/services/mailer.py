@@ -0,0 +1,126 @@
+"""
+Mailer - Pooled SMTP delivery for contact messages
+"""
+from contextlib import contextmanager
+from email.message import EmailMessage
+from typing import Iterator, List, Optional
+import logging
+import smtplib
+import ssl
+import threading
+import time
+
+from app.models.contact import ContactMessage
+
+logger = logging.getLogger(__name__)
+
+
+class SMTPConnectionPool:
+    """A small pool of persistent SMTP connections.
+
+    Connections are reused across messages instead of paying the TCP, TLS
+    and AUTH handshakes per delivery. A connection that errors is discarded;
+    one that sat idle longer than ``idle_check_seconds`` is probed with NOOP
+    before reuse.
+
+    ``use_tls`` upgrades plain connections with STARTTLS; ``use_ssl`` connects
+    with implicit TLS instead and defaults to on for port 465. Either way the
+    server certificate and host name are verified.
+    """
+
+    def __init__(self, host: str, port: int, username: Optional[str] = None, password: Optional[str] = None,
+                 use_tls: bool = True, timeout: float = 10.0, size: int = 2, idle_check_seconds: float = 30.0,
+                 use_ssl: Optional[bool] = None, ssl_context: Optional[ssl.SSLContext] = None):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.use_ssl = port == 465 if use_ssl is None else use_ssl
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.timeout = timeout
+        self.idle_check_seconds = idle_check_seconds
+        self._idle: List[tuple] = []
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        if self.use_ssl:
+            smtp = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout, context=self.ssl_context)
+        else:
+            smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.use_tls:
+                smtp.starttls(context=self.ssl_context)
+        if self.username:
+            smtp.login(self.username, self.password or "")
+        return smtp
+
+    def _checkout(self) -> smtplib.SMTP:
+        with self._lock:
+            entry = self._idle.pop() if self._idle else None
+        if entry is not None:
+            smtp, last_used = entry
+            if time.monotonic() - last_used < self.idle_check_seconds:
+                return smtp
+            try:
+                if smtp.noop()[0] == 250:
+                    return smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._discard(smtp)
+        return self._connect()
+
+    @staticmethod
+    def _discard(smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.close()
+        except Exception:
+            pass
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """Borrow a connection; it is returned to the pool unless the caller raised."""
+        with self._slots:
+            smtp = self._checkout()
+            try:
+                yield smtp
+            except BaseException:
+                self._discard(smtp)
+                raise
+            with self._lock:
+                self._idle.append((smtp, time.monotonic()))
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            try:
+                smtp.quit()
+            except Exception:
+                self._discard(smtp)
+
+
+class Mailer:
+    """Formats contact messages as emails and sends them through the pool."""
+
+    def __init__(self, pool: SMTPConnectionPool, sender: str, recipient: str):
+        self.pool = pool
+        self.sender = sender
+        self.recipient = recipient
+
+    def build_email(self, msg: ContactMessage) -> EmailMessage:
+        email = EmailMessage()
+        email["From"] = self.sender
+        email["To"] = self.recipient
+        email["Reply-To"] = msg.email
+        email["Subject"] = f"[Portfolio] {msg.subject or 'New message'} from {msg.name}"
+        email.set_content(f"From: {msg.name} <{msg.email}>\n\n{msg.message}\n")
+        return email
+
+    def send(self, msg: ContactMessage) -> None:
+        """Send one message; blocking, so call it from a worker thread."""
+        with self.pool.connection() as smtp:
+            smtp.send_message(self.build_email(msg))
+
+    def close(self) -> None:
+        self.pool.close()
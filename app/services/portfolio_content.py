@@ -0,0 +1,139 @@
+"""
+Portfolio content sources, loaded into an immutable snapshot.
+
+Content is written as Markdown and YAML under ``content/`` and compiled into
+a bundle (see ``content_compiler``): a marshal dump that loads in well under
+a millisecond and carries every markdown body pre-rendered to HTML. A plain
+JSON file holding the whole portfolio is accepted as well::
+
+    {
+      "bio": "...", "about": "...",
+      "skills": {"technical": [...], "ai_ml": [...], "tools_platforms": [...]},
+      "projects": [{"title": ..., "description": ..., "technologies": [...], ...}],
+      "experience": [...],
+      "education": [...]
+    }
+
+``PortfolioStore.replace_content`` swaps a snapshot in as one change, so
+readers see either the old or the new portfolio, never a mix.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional, Tuple
+import hashlib
+import json
+import marshal
+
+from app.models.portfolio import Education, Experience, Project
+from app.services.portfolio_store import SKILL_KINDS
+
+REQUIRED_FIELDS = {
+    "projects": ("title", "description", "category", "technologies"),
+    "experience": ("title", "company", "start_date", "end_date", "description", "technologies"),
+    "education": ("degree", "institution", "start_date", "end_date", "description"),
+}
+ENTRY_MODELS = {"projects": Project, "experience": Experience, "education": Education}
+
+BUNDLE_MAGIC = b"PORTFOLIO-BUNDLE"
+# Bump when the bundle layout changes; older bundles are then rebuilt
+BUNDLE_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class PortfolioContent:
+    """A complete, validated portfolio."""
+    bio: str
+    about: str
+    skills: Mapping[str, Tuple[str, ...]]
+    projects: Tuple[Project, ...]
+    experience: Tuple[Experience, ...]
+    education: Tuple[Education, ...]
+    digest: str
+    # Markdown source -> rendered HTML, for the bodies pre-rendered by the compiler
+    html: Mapping[str, str] = field(default_factory=dict)
+
+
+def content_from_dict(data: Mapping[str, Any], digest: str, html: Optional[Mapping[str, str]] = None) -> PortfolioContent:
+    """Validate a parsed content document and freeze it.
+
+    Raises:
+        ValueError: If required fields are missing or have the wrong shape.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("content must be a JSON object")
+    skills = data.get("skills") or {}
+    unknown = set(skills) - set(SKILL_KINDS)
+    if unknown:
+        raise ValueError(f"unknown skill kinds: {', '.join(sorted(unknown))}")
+    entries = {}
+    for kind, fields in REQUIRED_FIELDS.items():
+        items = data.get(kind, [])
+        if not isinstance(items, list):
+            raise ValueError(f"'{kind}' must be a list")
+        for position, item in enumerate(items):
+            missing = [name for name in fields if name not in item]
+            if missing:
+                raise ValueError(f"{kind}[{position}] is missing {', '.join(missing)}")
+            if not isinstance(item.get("technologies", []), list):
+                raise ValueError(f"{kind}[{position}]: 'technologies' must be a list")
+        entries[kind] = tuple(ENTRY_MODELS[kind].from_dict(item) for item in items)
+    return PortfolioContent(
+        bio=str(data.get("bio", "")),
+        about=str(data.get("about", "")),
+        skills={kind: tuple(skills.get(kind) or ()) for kind in SKILL_KINDS},
+        projects=entries["projects"],
+        experience=entries["experience"],
+        education=entries["education"],
+        digest=digest,
+        html=dict(html or {}),
+    )
+
+
+def parse_content(raw: bytes) -> PortfolioContent:
+    """Parse and validate a JSON content document.
+
+    Raises:
+        ValueError: If the document is not valid JSON or misses required fields.
+    """
+    return content_from_dict(json.loads(raw), hashlib.sha256(raw).hexdigest())
+
+
+def read_bundle(raw: bytes) -> Dict[str, Any]:
+    """Decode a compiled bundle into its raw dict (``content``, ``html``, ``digest``, ``sources``).
+
+    Raises:
+        ValueError: If ``raw`` is not a bundle of the current format.
+    """
+    header = BUNDLE_MAGIC + bytes((BUNDLE_FORMAT, marshal.version))
+    if not raw.startswith(header):
+        raise ValueError("not a portfolio bundle of the current format; rebuild it with scripts/build_content.py")
+    try:
+        bundle = marshal.loads(raw[len(header):])
+    except (EOFError, TypeError, ValueError) as e:
+        raise ValueError(f"corrupt portfolio bundle: {e}") from e
+    if not isinstance(bundle, dict):
+        raise ValueError("corrupt portfolio bundle")
+    return bundle
+
+
+def load_content(path: str) -> PortfolioContent:
+    """Read a compiled bundle, or a ``.json`` content file, at ``path`` (blocking; run it off the event loop)."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if path.endswith(".json"):
+        return parse_content(raw)
+    bundle = read_bundle(raw)
+    return content_from_dict(bundle["content"], bundle["digest"], bundle["html"])
+
+
+_rendered_markdown: Mapping[str, str] = {}
+
+
+def use_rendered_markdown(html: Mapping[str, str]) -> None:
+    """Make the pre-rendered HTML of the current content available to ``rendered_markdown``."""
+    global _rendered_markdown
+    _rendered_markdown = html
+
+
+def rendered_markdown(text: str) -> Optional[str]:
+    """Pre-rendered HTML for the markdown ``text``, if the content bundle has it."""
+    return _rendered_markdown.get(text)
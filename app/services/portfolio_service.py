@@ -0,0 +1,198 @@
+"""
+Portfolio Service - Manages portfolio data and content
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import logging
+from app.core.config import settings
+from app.core.startup import component
+from app.models.portfolio import Education, Experience, Project
+from app.services.content_compiler import load_or_compile
+from app.services.portfolio_content import PortfolioContent, use_rendered_markdown
+from app.services.portfolio_store import PortfolioStore, create_store
+from app.services.facet_index import FacetIndex
+
+logger = logging.getLogger(__name__)
+
+class PortfolioService:
+    """Service for managing portfolio content."""
+    
+    FACET_KINDS = ("projects", "experience")
+    
+    def __init__(self, store: Optional[PortfolioStore] = None, content_path: Optional[str] = None,
+                 source_dir: Optional[str] = None):
+        """Initialize the portfolio service from the compiled content.
+        
+        Args:
+            store: Storage backend; defaults to the one selected by ``PORTFOLIO_BACKEND``.
+            content_path: Content bundle, or a JSON content file (see ``portfolio_content``).
+            source_dir: Markdown/YAML sources; the bundle is rebuilt from them if they changed.
+        """
+        self._store = store if store is not None else create_store(settings.PORTFOLIO_BACKEND, settings.PORTFOLIO_DB_PATH)
+        content = load_or_compile(content_path, source_dir) if content_path else None
+        if content is not None:
+            self.apply_content(content)
+        elif self._store.is_empty():
+            logger.warning(f"No portfolio content at {content_path} or {source_dir}; the portfolio is empty")
+        self._index_version = -1
+        self._technology_index: Dict[str, FacetIndex] = {}
+        self._indexes()
+    
+    def _build_index(self, kind: str) -> FacetIndex:
+        """Build the technology index for projects or experience from the store."""
+        index = FacetIndex()
+        postings: Dict[int, List[str]] = {}
+        for position, tech in self._store.technology_postings(kind):
+            postings.setdefault(position, []).append(tech)
+        for position, techs in postings.items():
+            index.add(position, techs)
+        index.reserve(self._store.count_projects() if kind == "projects" else self._store.count_experience())
+        return index
+    
+    def _indexes(self) -> Dict[str, FacetIndex]:
+        """The technology indexes, rebuilt if the content changed since they were built.
+
+        With the SQLite backend several worker processes share one database,
+        so another worker's write shows up here as a new store version.
+        """
+        version = self._store.version
+        if version != self._index_version:
+            self._technology_index = {kind: self._build_index(kind) for kind in self.FACET_KINDS}
+            self._index_version = version
+        return self._technology_index
+
+    def _add_entry(self, kind: str, entry: Union[Project, Experience],
+                   add: Callable[[Union[Project, Experience]], None]) -> None:
+        """Store ``entry`` and extend the matching index in place when nothing else changed meanwhile."""
+        before = self._store.version
+        add(entry)
+        if self._index_version == before and self._store.version == before + 1:
+            self._technology_index[kind].append(entry.technologies)
+            self._index_version = before + 1
+
+    @property
+    def store(self) -> PortfolioStore:
+        """The storage backend holding the content."""
+        return self._store
+    
+    @property
+    def version(self) -> int:
+        """Content version, incremented on every mutation."""
+        return self._store.version
+    
+    @property
+    def updated_at(self) -> float:
+        """Timestamp of the last content mutation."""
+        return self._store.updated_at
+    
+    def get_bio(self) -> str:
+        """Get the short bio."""
+        return self._store.get_text("bio")
+    
+    def get_about(self) -> str:
+        """Get the about section content."""
+        return self._store.get_text("about")
+    
+    def get_technical_skills(self) -> Tuple[str, ...]:
+        """Get technical skills list."""
+        return self._store.get_skills("technical")
+    
+    def get_ai_ml_skills(self) -> Tuple[str, ...]:
+        """Get AI and ML specific skills."""
+        return self._store.get_skills("ai_ml")
+    
+    def get_tools_platforms(self) -> Tuple[str, ...]:
+        """Get tools and platforms list."""
+        return self._store.get_skills("tools_platforms")
+    
+    def get_projects(self, offset: int = 0, limit: Optional[int] = None,
+                     category: Optional[str] = None, technology: Optional[str] = None,
+                     newest_first: bool = False) -> Tuple[Project, ...]:
+        """Get a page of projects, optionally filtered by category and technology.
+
+        Entries are immutable and the full listing is returned without copying.
+        """
+        return self._store.get_projects(offset, limit, category=category, technology=technology,
+                                        newest_first=newest_first)
+    
+    def count_projects(self, category: Optional[str] = None, technology: Optional[str] = None) -> int:
+        """Count projects matching the given filters."""
+        return self._store.count_projects(category=category, technology=technology)
+    
+    def get_experience(self, offset: int = 0, limit: Optional[int] = None,
+                       technology: Optional[str] = None) -> Tuple[Experience, ...]:
+        """Get a page of work experience, optionally filtered by technology."""
+        return self._store.get_experience(offset, limit, technology=technology)
+    
+    def count_experience(self, technology: Optional[str] = None) -> int:
+        """Count work experience entries matching the given filter."""
+        return self._store.count_experience(technology=technology)
+    
+    def get_education(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[Education, ...]:
+        """Get a page of education entries."""
+        return self._store.get_education(offset, limit)
+    
+    def filter_by_technologies(self, all_of: Optional[List[str]] = None, any_of: Optional[List[str]] = None,
+                               offset: int = 0, limit: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Filter projects and experience by technology facets.
+        
+        Args:
+            all_of: Technologies an entry must all use (AND).
+            any_of: Technologies of which an entry must use at least one (OR).
+            offset: Number of matches to skip per kind.
+            limit: Maximum number of matches to return per kind.
+        
+        Returns:
+            Per kind, the total match count, the requested page of entries and
+            the number of matches carrying each technology.
+        """
+        result = {}
+        indexes = self._indexes()
+        for kind in self.FACET_KINDS:
+            index = indexes[kind]
+            bits = index.match(all_of or (), any_of or ())
+            positions = index.positions(bits, offset, limit)
+            result[kind] = {
+                "total": index.count(bits),
+                "items": self._store.get_entries_at(kind, positions),
+                "facets": index.facet_counts(bits),
+            }
+        return result
+    
+    def get_technology_counts(self) -> Dict[str, Dict[str, int]]:
+        """Number of projects and experience entries per technology."""
+        return {kind: index.facet_counts() for kind, index in self._indexes().items()}
+    
+    def apply_content(self, content: PortfolioContent) -> bool:
+        """Swap in a complete portfolio; returns False if the store already holds it."""
+        use_rendered_markdown(content.html)
+        changed = self._store.replace_content(content)
+        if changed:
+            logger.info(f"Loaded portfolio content {content.digest[:12]} ({len(content.projects)} projects, "
+                        f"{len(content.experience)} experience entries)")
+        return changed
+    
+    def update_bio(self, new_bio: str) -> None:
+        """Update the bio."""
+        self._store.set_text("bio", new_bio)
+    
+    def update_about(self, new_about: str) -> None:
+        """Update the about section."""
+        self._store.set_text("about", new_about)
+    
+    def add_project(self, project: Project) -> None:
+        """Add a new project."""
+        self._add_entry("projects", project, self._store.add_project)
+    
+    def add_experience(self, experience: Experience) -> None:
+        """Add a new work experience."""
+        self._add_entry("experience", experience, self._store.add_experience)
+    
+    def add_education(self, education: Education) -> None:
+        """Add a new education entry."""
+        self._store.add_education(education)
+
+
+@component("portfolio service")
+def get_portfolio_service() -> PortfolioService:
+    """Return the process-wide portfolio service shared by pages and API routes."""
+    return PortfolioService(content_path=settings.PORTFOLIO_CONTENT_PATH, source_dir=settings.CONTENT_SOURCE_DIR)
@@ -0,0 +1,541 @@
+"""
+Portfolio Store - Storage backends behind PortfolioService
+"""
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, List, Iterator, Mapping, Optional, Sequence, Tuple, TypeVar, Union
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from app.models.portfolio import Education, Experience, Project
+
+if TYPE_CHECKING:
+    from app.services.portfolio_content import PortfolioContent
+
+logger = logging.getLogger(__name__)
+
+SKILL_KINDS = ("technical", "ai_ml", "tools_platforms")
+
+E = TypeVar("E")
+
+
+class PortfolioStore(ABC):
+    """Interface shared by the portfolio storage backends.
+
+    Every mutation bumps ``version`` so render and response caches keyed on it
+    are invalidated. Getters return tuples of immutable entries, so callers
+    can keep and share them without copying.
+    """
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        ...
+
+    @property
+    @abstractmethod
+    def updated_at(self) -> float:
+        ...
+
+    @abstractmethod
+    def is_empty(self) -> bool:
+        ...
+
+    @abstractmethod
+    def replace_content(self, content: "PortfolioContent") -> bool:
+        """Replace the whole portfolio with ``content`` as a single change (one version bump).
+
+        Returns False without changing anything if ``content`` is what the
+        store already holds (same digest), e.g. when several workers load
+        the same file.
+        """
+
+    @abstractmethod
+    def get_text(self, key: str) -> str:
+        ...
+
+    @abstractmethod
+    def set_text(self, key: str, value: str) -> None:
+        ...
+
+    @abstractmethod
+    def get_skills(self, kind: str) -> Tuple[str, ...]:
+        ...
+
+    @abstractmethod
+    def set_skills(self, kind: str, skills: Sequence[str]) -> None:
+        ...
+
+    @abstractmethod
+    def get_projects(self, offset: int = 0, limit: Optional[int] = None,
+                     category: Optional[str] = None, technology: Optional[str] = None,
+                     newest_first: bool = False) -> Tuple[Project, ...]:
+        ...
+
+    @abstractmethod
+    def count_projects(self, category: Optional[str] = None, technology: Optional[str] = None) -> int:
+        ...
+
+    @abstractmethod
+    def add_project(self, project: Project) -> None:
+        ...
+
+    @abstractmethod
+    def get_experience(self, offset: int = 0, limit: Optional[int] = None,
+                       technology: Optional[str] = None) -> Tuple[Experience, ...]:
+        ...
+
+    @abstractmethod
+    def count_experience(self, technology: Optional[str] = None) -> int:
+        ...
+
+    @abstractmethod
+    def add_experience(self, experience: Experience) -> None:
+        ...
+
+    @abstractmethod
+    def get_education(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[Education, ...]:
+        ...
+
+    @abstractmethod
+    def get_entries_at(self, kind: str, positions: List[int]) -> Tuple[Union[Project, Experience], ...]:
+        """Fetch projects or experience by insertion position (entries are append-only)."""
+
+    @abstractmethod
+    def technology_postings(self, kind: str) -> List[Tuple[int, str]]:
+        """Return ``(position, technology)`` pairs for all projects or experience entries."""
+
+    @abstractmethod
+    def add_education(self, education: Education) -> None:
+        ...
+
+    def ping(self) -> None:
+        """Raise if the backend cannot serve queries (used by the readiness check)."""
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+
+
+def _page(items: Tuple[E, ...], offset: int, limit: Optional[int]) -> Tuple[E, ...]:
+    if offset == 0 and limit is None:
+        return items
+    return items[offset:None if limit is None else offset + limit]
+
+
+@dataclass(frozen=True)
+class _MemoryContent:
+    """Everything an ``InMemoryPortfolioStore`` holds, replaced as a whole on each change."""
+    version: int = 1
+    updated_at: float = field(default_factory=time.time)
+    digest: Optional[str] = None
+    texts: Mapping[str, str] = field(default_factory=dict)
+    skills: Mapping[str, Tuple[str, ...]] = field(default_factory=lambda: {kind: () for kind in SKILL_KINDS})
+    projects: Tuple[Project, ...] = ()
+    experience: Tuple[Experience, ...] = ()
+    education: Tuple[Education, ...] = ()
+
+
+class InMemoryPortfolioStore(PortfolioStore):
+    """Keeps portfolio content in Python tuples; used for tests and small portfolios.
+
+    All content lives in one frozen snapshot whose reference is swapped on
+    every change, so a reader sees the old or the new content, never a mix,
+    and a full listing is returned as is.
+    """
+
+    def __init__(self):
+        self._content = _MemoryContent()
+
+    def _change(self, **changes) -> None:
+        content = self._content
+        self._content = replace(content, version=content.version + 1, updated_at=time.time(), **changes)
+
+    @property
+    def version(self) -> int:
+        return self._content.version
+
+    @property
+    def updated_at(self) -> float:
+        return self._content.updated_at
+
+    def is_empty(self) -> bool:
+        content = self._content
+        return not (content.texts or content.projects or content.experience or content.education)
+
+    def replace_content(self, content: "PortfolioContent") -> bool:
+        if content.digest == self._content.digest:
+            return False
+        self._change(
+            digest=content.digest,
+            texts={"bio": content.bio, "about": content.about},
+            skills=dict(content.skills),
+            projects=content.projects,
+            experience=content.experience,
+            education=content.education,
+        )
+        return True
+
+    def get_text(self, key: str) -> str:
+        return self._content.texts.get(key, "")
+
+    def set_text(self, key: str, value: str) -> None:
+        self._change(texts={**self._content.texts, key: value})
+
+    def get_skills(self, kind: str) -> Tuple[str, ...]:
+        return self._content.skills[kind]
+
+    def set_skills(self, kind: str, skills: Sequence[str]) -> None:
+        self._change(skills={**self._content.skills, kind: tuple(skills)})
+
+    def _filter_projects(self, category: Optional[str], technology: Optional[str]) -> Tuple[Project, ...]:
+        projects = self._content.projects
+        if category is not None:
+            projects = tuple(p for p in projects if p.category == category)
+        if technology is not None:
+            projects = tuple(p for p in projects if technology in p.technologies)
+        return projects
+
+    def get_projects(self, offset: int = 0, limit: Optional[int] = None,
+                     category: Optional[str] = None, technology: Optional[str] = None,
+                     newest_first: bool = False) -> Tuple[Project, ...]:
+        projects = self._filter_projects(category, technology)
+        if newest_first:
+            dated = sorted((p for p in projects if p.date), key=lambda p: p.date, reverse=True)
+            projects = (*dated, *(p for p in projects if not p.date))
+        return _page(projects, offset, limit)
+
+    def count_projects(self, category: Optional[str] = None, technology: Optional[str] = None) -> int:
+        return len(self._filter_projects(category, technology))
+
+    def add_project(self, project: Project) -> None:
+        self._change(projects=self._content.projects + (project,))
+
+    def _filter_experience(self, technology: Optional[str]) -> Tuple[Experience, ...]:
+        experience = self._content.experience
+        if technology is None:
+            return experience
+        return tuple(job for job in experience if technology in job.technologies)
+
+    def get_experience(self, offset: int = 0, limit: Optional[int] = None,
+                       technology: Optional[str] = None) -> Tuple[Experience, ...]:
+        return _page(self._filter_experience(technology), offset, limit)
+
+    def count_experience(self, technology: Optional[str] = None) -> int:
+        return len(self._filter_experience(technology))
+
+    def add_experience(self, experience: Experience) -> None:
+        self._change(experience=self._content.experience + (experience,))
+
+    def get_education(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[Education, ...]:
+        return _page(self._content.education, offset, limit)
+
+    def add_education(self, education: Education) -> None:
+        self._change(education=self._content.education + (education,))
+
+    def _entries(self, kind: str) -> Tuple[Union[Project, Experience], ...]:
+        content = self._content
+        return content.projects if kind == "projects" else content.experience
+
+    def get_entries_at(self, kind: str, positions: List[int]) -> Tuple[Union[Project, Experience], ...]:
+        entries = self._entries(kind)
+        return tuple(entries[position] for position in positions)
+
+    def technology_postings(self, kind: str) -> List[Tuple[int, str]]:
+        return [
+            (position, tech)
+            for position, entry in enumerate(self._entries(kind))
+            for tech in entry.technologies
+        ]
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS texts (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS skills (
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (kind, position)
+);
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category TEXT NOT NULL DEFAULT '',
+    date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_projects_category ON projects (category, id);
+-- Matches get_projects(newest_first=True), undated projects last; the old
+-- idx_projects_date (date DESC, id) could not serve that ORDER BY
+DROP INDEX IF EXISTS idx_projects_date;
+CREATE INDEX IF NOT EXISTS idx_projects_newest ON projects (date IS NULL, date DESC, id);
+CREATE TABLE IF NOT EXISTS project_technologies (
+    technology TEXT NOT NULL,
+    project_id INTEGER NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+    PRIMARY KEY (technology, project_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS experience (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS experience_technologies (
+    technology TEXT NOT NULL,
+    experience_id INTEGER NOT NULL REFERENCES experience (id) ON DELETE CASCADE,
+    PRIMARY KEY (technology, experience_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS education (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data TEXT NOT NULL
+);
+"""
+
+
+class _ContentUnchanged(Exception):
+    """Rolls back a content replacement that another worker already applied."""
+
+
+class SQLitePortfolioStore(PortfolioStore):
+    """Stores portfolio content in a local SQLite file in WAL mode.
+
+    Entries are kept as JSON documents; the columns and link tables that
+    queries filter on (category, technology, date) are indexed so pages only
+    fetch the rows they render.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('version', '1')")
+        self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('updated_at', ?)", (str(time.time()),))
+        logger.info(f"Using SQLite portfolio store at {path}")
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run writes in one transaction that also bumps the content version."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'version'")
+                self._conn.execute("UPDATE meta SET value = ? WHERE key = 'updated_at'", (str(time.time()),))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    @property
+    def version(self) -> int:
+        return int(self._query("SELECT value FROM meta WHERE key = 'version'")[0][0])
+
+    @property
+    def updated_at(self) -> float:
+        return float(self._query("SELECT value FROM meta WHERE key = 'updated_at'")[0][0])
+
+    def replace_content(self, content: "PortfolioContent") -> bool:
+        with self._lock:
+            rows = self._conn.execute("SELECT value FROM meta WHERE key = 'content_digest'").fetchall()
+        if rows and rows[0][0] == content.digest:
+            return False
+        try:
+            with self._transaction() as conn:
+                self._replace_content(conn, content)
+        except _ContentUnchanged:
+            return False
+        return True
+
+    def _replace_content(self, conn: sqlite3.Connection, content: "PortfolioContent") -> None:
+        # Re-checked inside the write transaction: another worker may have applied it meanwhile
+        rows = conn.execute("SELECT value FROM meta WHERE key = 'content_digest'").fetchall()
+        if rows and rows[0][0] == content.digest:
+            raise _ContentUnchanged()
+        for table in ("texts", "skills", "project_technologies", "projects",
+                      "experience_technologies", "experience", "education"):
+            conn.execute(f"DELETE FROM {table}")
+        # Restart the ids so entry positions stay id - 1 (see get_entries_at)
+        conn.execute("DELETE FROM sqlite_sequence WHERE name IN ('projects', 'experience', 'education')")
+        conn.executemany("INSERT INTO texts (key, value) VALUES (?, ?)",
+                         [("bio", content.bio), ("about", content.about)])
+        conn.executemany(
+            "INSERT INTO skills (kind, position, name) VALUES (?, ?, ?)",
+            [(kind, position, name) for kind, skills in content.skills.items()
+             for position, name in enumerate(skills)],
+        )
+        for project in content.projects:
+            self._insert_project(conn, project)
+        for experience in content.experience:
+            self._insert_experience(conn, experience)
+        conn.executemany("INSERT INTO education (data) VALUES (?)",
+                         [(json.dumps(education.to_dict()),) for education in content.education])
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('content_digest', ?)", (content.digest,))
+
+    def is_empty(self) -> bool:
+        rows = self._query(
+            "SELECT EXISTS (SELECT 1 FROM texts) OR EXISTS (SELECT 1 FROM projects) "
+            "OR EXISTS (SELECT 1 FROM experience) OR EXISTS (SELECT 1 FROM education)"
+        )
+        return not rows[0][0]
+
+    def get_text(self, key: str) -> str:
+        rows = self._query("SELECT value FROM texts WHERE key = ?", (key,))
+        return rows[0][0] if rows else ""
+
+    def set_text(self, key: str, value: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO texts (key, value) VALUES (?, ?)", (key, value))
+
+    def get_skills(self, kind: str) -> Tuple[str, ...]:
+        return tuple(row[0] for row in self._query("SELECT name FROM skills WHERE kind = ? ORDER BY position", (kind,)))
+
+    def set_skills(self, kind: str, skills: Sequence[str]) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM skills WHERE kind = ?", (kind,))
+            conn.executemany(
+                "INSERT INTO skills (kind, position, name) VALUES (?, ?, ?)",
+                [(kind, position, name) for position, name in enumerate(skills)],
+            )
+
+    @staticmethod
+    def _project_filter(category: Optional[str], technology: Optional[str]) -> tuple:
+        clauses, params = [], []
+        if category is not None:
+            clauses.append("p.category = ?")
+            params.append(category)
+        if technology is not None:
+            clauses.append("p.id IN (SELECT project_id FROM project_technologies WHERE technology = ?)")
+            params.append(technology)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def get_projects(self, offset: int = 0, limit: Optional[int] = None,
+                     category: Optional[str] = None, technology: Optional[str] = None,
+                     newest_first: bool = False) -> Tuple[Project, ...]:
+        where, params = self._project_filter(category, technology)
+        # Same expressions as idx_projects_newest, so the index provides the order
+        order = "p.date IS NULL, p.date DESC, p.id" if newest_first else "p.id"
+        sql = f"SELECT p.data FROM projects p{where} ORDER BY {order} LIMIT ? OFFSET ?"
+        rows = self._query(sql, (*params, -1 if limit is None else limit, offset))
+        return tuple(Project.from_dict(json.loads(row[0])) for row in rows)
+
+    def count_projects(self, category: Optional[str] = None, technology: Optional[str] = None) -> int:
+        where, params = self._project_filter(category, technology)
+        return self._query(f"SELECT COUNT(*) FROM projects p{where}", tuple(params))[0][0]
+
+    @staticmethod
+    def _insert_project(conn: sqlite3.Connection, project: Project) -> None:
+        cursor = conn.execute(
+            "INSERT INTO projects (category, date, data) VALUES (?, ?, ?)",
+            (project.category, project.date, json.dumps(project.to_dict())),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO project_technologies (technology, project_id) VALUES (?, ?)",
+            [(tech, cursor.lastrowid) for tech in project.technologies],
+        )
+
+    def add_project(self, project: Project) -> None:
+        with self._transaction() as conn:
+            self._insert_project(conn, project)
+
+    @staticmethod
+    def _experience_filter(technology: Optional[str]) -> tuple:
+        if technology is None:
+            return "", []
+        return " WHERE e.id IN (SELECT experience_id FROM experience_technologies WHERE technology = ?)", [technology]
+
+    def get_experience(self, offset: int = 0, limit: Optional[int] = None,
+                       technology: Optional[str] = None) -> Tuple[Experience, ...]:
+        where, params = self._experience_filter(technology)
+        rows = self._query(
+            f"SELECT e.data FROM experience e{where} ORDER BY e.id LIMIT ? OFFSET ?",
+            (*params, -1 if limit is None else limit, offset),
+        )
+        return tuple(Experience.from_dict(json.loads(row[0])) for row in rows)
+
+    def count_experience(self, technology: Optional[str] = None) -> int:
+        where, params = self._experience_filter(technology)
+        return self._query(f"SELECT COUNT(*) FROM experience e{where}", tuple(params))[0][0]
+
+    @staticmethod
+    def _insert_experience(conn: sqlite3.Connection, experience: Experience) -> None:
+        cursor = conn.execute("INSERT INTO experience (data) VALUES (?)", (json.dumps(experience.to_dict()),))
+        conn.executemany(
+            "INSERT OR IGNORE INTO experience_technologies (technology, experience_id) VALUES (?, ?)",
+            [(tech, cursor.lastrowid) for tech in experience.technologies],
+        )
+
+    def add_experience(self, experience: Experience) -> None:
+        with self._transaction() as conn:
+            self._insert_experience(conn, experience)
+
+    def get_education(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[Education, ...]:
+        rows = self._query(
+            "SELECT data FROM education ORDER BY id LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, offset),
+        )
+        return tuple(Education.from_dict(json.loads(row[0])) for row in rows)
+
+    def add_education(self, education: Education) -> None:
+        with self._transaction() as conn:
+            conn.execute("INSERT INTO education (data) VALUES (?)", (json.dumps(education.to_dict()),))
+
+    # Entries are append-only, so AUTOINCREMENT ids are contiguous and
+    # position == id - 1.
+    _ENTRY_TABLES = {
+        "projects": ("projects", "project_technologies", "project_id"),
+        "experience": ("experience", "experience_technologies", "experience_id"),
+    }
+    _ENTRY_MODELS = {"projects": Project, "experience": Experience}
+
+    def get_entries_at(self, kind: str, positions: List[int]) -> Tuple[Union[Project, Experience], ...]:
+        if not positions:
+            return ()
+        table = self._ENTRY_TABLES[kind][0]
+        model = self._ENTRY_MODELS[kind]
+        placeholders = ",".join("?" * len(positions))
+        rows = self._query(
+            f"SELECT id, data FROM {table} WHERE id IN ({placeholders})",
+            tuple(position + 1 for position in positions),
+        )
+        by_id = {row[0]: row[1] for row in rows}
+        return tuple(model.from_dict(json.loads(by_id[position + 1])) for position in positions if position + 1 in by_id)
+
+    def technology_postings(self, kind: str) -> List[Tuple[int, str]]:
+        _, link_table, id_column = self._ENTRY_TABLES[kind]
+        return [(row[0] - 1, row[1]) for row in self._query(f"SELECT {id_column}, technology FROM {link_table}")]
+
+    def ping(self) -> None:
+        self._query("SELECT 1")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_store(backend: str, db_path: str) -> PortfolioStore:
+    """Create the storage backend selected by ``PORTFOLIO_BACKEND``."""
+    if backend == "sqlite":
+        return SQLitePortfolioStore(db_path)
+    if backend != "memory":
+        logger.warning(f"Unknown portfolio backend '{backend}', falling back to in-memory store")
+    return InMemoryPortfolioStore()
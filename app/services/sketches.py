@@ -0,0 +1,137 @@
+"""
+Sketches - Fixed-size probabilistic counters (HyperLogLog, count-min, top-k)
+
+Each structure uses the same memory however many items it has seen, and two
+sketches of the same shape merge into the sketch of the combined stream, so
+per-process batches can be folded into stored totals.
+"""
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+import hashlib
+import math
+
+
+def hash128(key: str) -> Tuple[int, int]:
+    """Two independent 64-bit hashes of ``key``."""
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little')
+
+
+class HyperLogLog:
+    """Cardinality estimate with ~1.04/sqrt(2**precision) relative error in 2**precision bytes."""
+
+    def __init__(self, precision: int = 12, registers: Optional[bytes] = None):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(registers) if registers is not None else bytearray(self.size)
+        if len(self.registers) != self.size:
+            raise ValueError(f"expected {self.size} registers, got {len(self.registers)}")
+
+    def add(self, key: str) -> None:
+        value = hash128(key)[0]
+        index = value & (self.size - 1)
+        rest = value >> self.precision
+        # Position of the lowest set bit in the remaining 64 - p bits
+        rank = (rest & -rest).bit_length() if rest else 64 - self.precision + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.precision != self.precision:
+            raise ValueError("cannot merge HyperLogLogs of different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        estimate = alpha * self.size * self.size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.size and zeros:
+            # Linear counting is more accurate while many registers are still empty
+            estimate = self.size * math.log(self.size / zeros)
+        return round(estimate)
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.registers)
+
+
+class CountMinSketch:
+    """Frequency estimates that never undercount; overcount by at most ~2N/width with high probability."""
+
+    def __init__(self, width: int = 2048, depth: int = 4, rows: Optional[List[bytes]] = None):
+        self.width = width
+        self.depth = depth
+        self.rows = [array('Q', bytes(8 * width)) for _ in range(depth)]
+        if rows is not None:
+            if len(rows) != depth:
+                raise ValueError(f"expected {depth} rows, got {len(rows)}")
+            for row, raw in zip(self.rows, rows):
+                row[:] = array('Q', raw)
+                if len(row) != width:
+                    raise ValueError(f"expected rows of {width} counters")
+
+    def _indexes(self, key: str) -> Iterable[int]:
+        first, second = hash128(key)
+        # Kirsch-Mitzenmacher: depth indexes from two hashes
+        return ((first + i * second) % self.width for i in range(self.depth))
+
+    def add(self, key: str, count: int = 1) -> int:
+        """Count ``key`` and return its new estimate."""
+        estimate = None
+        for row, index in zip(self.rows, self._indexes(key)):
+            row[index] += count
+            estimate = row[index] if estimate is None else min(estimate, row[index])
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        return min(row[index] for row, index in zip(self.rows, self._indexes(key)))
+
+    def merge(self, other: "CountMinSketch") -> None:
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("cannot merge count-min sketches of different shape")
+        for row, other_row in zip(self.rows, other.rows):
+            for index, value in enumerate(other_row):
+                if value:
+                    row[index] += value
+
+    def to_rows(self) -> List[bytes]:
+        return [row.tobytes() for row in self.rows]
+
+
+class TopK:
+    """The ``k`` most frequent keys of a stream, counted in a count-min sketch.
+
+    Only ``k`` candidate keys are kept; a key displaces the least frequent
+    candidate once its estimate is higher.
+    """
+
+    def __init__(self, k: int = 20, sketch: Optional[CountMinSketch] = None, candidates: Iterable[str] = ()):
+        self.k = k
+        self.sketch = sketch or CountMinSketch()
+        self.candidates: Dict[str, int] = {key: self.sketch.estimate(key) for key in candidates}
+        self._trim()
+
+    def add(self, key: str, count: int = 1) -> None:
+        estimate = self.sketch.add(key, count)
+        if key in self.candidates or len(self.candidates) < self.k:
+            self.candidates[key] = estimate
+            return
+        smallest = min(self.candidates, key=self.candidates.__getitem__)
+        if estimate > self.candidates[smallest]:
+            del self.candidates[smallest]
+            self.candidates[key] = estimate
+
+    def merge(self, other: "TopK") -> None:
+        self.sketch.merge(other.sketch)
+        keys = set(self.candidates) | set(other.candidates)
+        self.candidates = {key: self.sketch.estimate(key) for key in keys}
+        self._trim()
+
+    def _trim(self) -> None:
+        if len(self.candidates) > self.k:
+            self.candidates = dict(self.items())
+
+    def items(self) -> List[Tuple[str, int]]:
+        """Candidates with their estimates, most frequent first."""
+        return sorted(self.candidates.items(), key=lambda item: (-item[1], item[0]))[:self.k]
@@ -0,0 +1,84 @@
+"""
+Benchmark: cold-start time to first byte, measured from process spawn.
+
+Starts the server in a fresh process for each run, polls until the first
+byte of the response to --path arrives and stops the server again, i.e. what
+the first visitor to a scaled-to-zero machine waits for (minus the VM boot).
+
+Usage:
+    python benchmarks/bench_cold_start.py [--framework fastapi|nicegui] [--modes eager,lazy] [--runs 5] [--path /]
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVERS = {
+    'fastapi': "import uvicorn, main; uvicorn.run(main.app, host='127.0.0.1', port={port}, log_level='warning')",
+    'nicegui': "import main; main.ui.run(host='127.0.0.1', port={port}, reload=False, show=False)",
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def first_byte(port: int, path: str) -> bool:
+    """Send one request; True once the server answers with at least one byte."""
+    try:
+        with socket.create_connection(('127.0.0.1', port), timeout=5) as sock:
+            sock.sendall(f'GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n'.encode())
+            return bool(sock.recv(1))
+    except OSError:
+        return False
+
+
+def cold_start(framework: str, mode: str, path: str, timeout: float) -> float:
+    port = free_port()
+    env = dict(os.environ, FRAMEWORK=framework, STARTUP_MODE=mode)
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, '-c', SERVERS[framework].format(port=port)], cwd=ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - start < timeout:
+            if first_byte(port, path):
+                return time.perf_counter() - start
+            if proc.poll() is not None:
+                raise RuntimeError(f'{framework} server exited with code {proc.returncode}')
+            time.sleep(0.005)
+        raise RuntimeError(f'No response from {framework} server within {timeout}s')
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--framework', choices=sorted(SERVERS), default='fastapi')
+    parser.add_argument('--modes', default='eager,lazy', help='Comma-separated STARTUP_MODE values')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--path', default='/')
+    parser.add_argument('--timeout', type=float, default=60.0)
+    args = parser.parse_args()
+
+    # One unmeasured start so every mode sees warm .pyc files and page cache
+    cold_start(args.framework, 'eager', args.path, args.timeout)
+    print(f'{args.framework} {args.path} time to first byte from spawn ({args.runs} runs)')
+    for mode in args.modes.split(','):
+        times = [cold_start(args.framework, mode, args.path, args.timeout) for _ in range(args.runs)]
+        print(f'  {mode:<6} median {statistics.median(times) * 1000:7.1f} ms   '
+              f'min {min(times) * 1000:7.1f} ms   max {max(times) * 1000:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
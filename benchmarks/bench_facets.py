@@ -0,0 +1,61 @@
+"""
+Benchmark: technology facet lookups over a large catalog.
+
+Usage:
+    python benchmarks/bench_facets.py [--entries 100000] [--technologies 200]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.facet_index import FacetIndex  # noqa: E402
+
+
+def timed(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entries', type=int, default=100_000)
+    parser.add_argument('--technologies', type=int, default=200)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    vocabulary = [f"tech-{i}" for i in range(args.technologies)]
+    # Skewed popularity, like real technology tags
+    weights = [1 / (rank + 1) for rank in range(args.technologies)]
+
+    index = FacetIndex()
+    start = time.perf_counter()
+    for _ in range(args.entries):
+        index.append(set(rng.choices(vocabulary, weights=weights, k=5)))
+    build = time.perf_counter() - start
+    per_append = build / args.entries
+
+    popular, common, rare = vocabulary[0], vocabulary[3], vocabulary[50]
+    cases = {
+        "AND of 2 facets (count)": lambda: index.count(index.match(all_of=[popular, common])),
+        "OR of 3 facets (count)": lambda: index.count(index.match(any_of=[common, rare, vocabulary[10]])),
+        "AND + OR (count + first 20)": lambda: index.positions(
+            index.match(all_of=[popular], any_of=[common, rare]), 0, 20),
+        "page at offset 1000": lambda: index.positions(index.match(all_of=[popular]), 1000, 20),
+        "facet counts for AND result": lambda: index.facet_counts(index.match(all_of=[popular, common])),
+    }
+
+    print(f"{args.entries} entries, {args.technologies} technologies")
+    print(f"  incremental append:            {per_append * 1e6:9.2f} us/entry")
+    for name, func in cases.items():
+        print(f"  {name:30s} {timed(func, args.iterations) * 1e3:9.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: caller-side cost of a log call with synchronous vs queued handlers.
+
+Measures how long the logging thread (the event loop, in the app) is blocked
+per record, and how a burst is handled under the sampling filter.
+
+Usage:
+    python benchmarks/bench_logging.py [--records 20000]
+"""
+import argparse
+import io
+import logging
+import os
+import queue
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.logging_config import (  # noqa: E402
+    LOG_FORMAT, BatchingQueueListener, BatchStreamHandler, GzipRotatingFileHandler,
+    NonBlockingQueueHandler, SamplingFilter,
+)
+
+
+def make_handlers(log_dir: str, batching: bool):
+    formatter = logging.Formatter(LOG_FORMAT)
+    stream = (BatchStreamHandler if batching else logging.StreamHandler)(io.StringIO())
+    file = GzipRotatingFileHandler(os.path.join(log_dir, 'bench.log'), maxBytes=1024 * 1024, backupCount=3)
+    for handler in (stream, file):
+        handler.setFormatter(formatter)
+    return [stream, file]
+
+
+def run(name: str, logger: logging.Logger, records: int, finish=lambda: None) -> None:
+    start = time.perf_counter()
+    for i in range(records):
+        logger.error('request %d failed: %s', i, 'upstream timeout')
+    caller = time.perf_counter() - start
+    finish()
+    total = time.perf_counter() - start
+    print(f"{name:<22} {caller / records * 1e6:8.2f} us/call on caller   {total:6.3f}s until written")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        sync_logger = logging.getLogger('bench.sync')
+        sync_logger.propagate = False
+        for handler in make_handlers(os.path.join(log_dir), batching=False):
+            sync_logger.addHandler(handler)
+        run('sync', sync_logger, args.records)
+
+        for label, sampling in (('queue', None), ('queue + sampling', SamplingFilter())):
+            log_queue = queue.Queue(maxsize=args.records + 1)
+            queue_dir = tempfile.mkdtemp(dir=log_dir)
+            listener = BatchingQueueListener(log_queue, make_handlers(queue_dir, batching=True))
+            listener.start()
+            queued_logger = logging.getLogger(f'bench.{label}')
+            queued_logger.propagate = False
+            handler = NonBlockingQueueHandler(log_queue)
+            if sampling:
+                handler.addFilter(sampling)
+            queued_logger.addHandler(handler)
+            run(label, queued_logger, args.records, finish=listener.stop)
+
+
+if __name__ == '__main__':
+    main()
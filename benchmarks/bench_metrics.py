@@ -0,0 +1,78 @@
+"""
+Benchmark: per-request overhead of MetricsMiddleware.
+
+Drives a trivial ASGI app directly (no server, no network) with and without
+the middleware and reports the difference per request.
+
+Usage:
+    python benchmarks/bench_metrics.py [--requests 100000] [--routes 20]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.metrics import MetricsMiddleware, registry  # noqa: E402
+
+
+class FakeRoute:
+    def __init__(self, path: str):
+        self.path = path
+
+
+async def endpoint(scope, receive, send) -> None:
+    # Stands in for the router, which records the matched route on the scope
+    scope['route'] = scope['_route']
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b'{"ok":true}'})
+
+
+async def receive():
+    return {'type': 'http.request', 'body': b''}
+
+
+async def send(message) -> None:
+    pass
+
+
+async def drive(app, scopes, requests: int) -> float:
+    start = time.perf_counter()
+    for i in range(requests):
+        await app(dict(scopes[i % len(scopes)]), receive, send)
+    return (time.perf_counter() - start) / requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=100_000)
+    parser.add_argument('--routes', type=int, default=20)
+    args = parser.parse_args()
+
+    scopes = [{'type': 'http', 'method': 'GET', 'path': f'/api/items/{i}', '_route': FakeRoute(f'/api/route-{i}/{{id}}')}
+              for i in range(args.routes)]
+    middleware = MetricsMiddleware(endpoint)
+
+    async def run():
+        # Warm up both paths so label series exist before timing
+        await drive(endpoint, scopes, 1000)
+        await drive(middleware, scopes, 1000)
+        bare = await drive(endpoint, scopes, args.requests)
+        measured = await drive(middleware, scopes, args.requests)
+        return bare, measured
+
+    bare, measured = asyncio.run(run())
+    print(f"requests: {args.requests:,} over {args.routes} routes")
+    print(f"bare app:        {bare * 1e6:6.2f} us/request")
+    print(f"with metrics:    {measured * 1e6:6.2f} us/request")
+    print(f"overhead:        {(measured - bare) * 1e6:6.2f} us/request")
+
+    start = time.perf_counter()
+    body = registry.render()
+    print(f"scrape render:   {(time.perf_counter() - start) * 1e3:6.2f} ms ({len(body):,} bytes)")
+
+
+if __name__ == '__main__':
+    main()
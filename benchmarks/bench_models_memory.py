@@ -0,0 +1,74 @@
+"""
+Benchmark: memory held per portfolio entry, plain dicts vs. the frozen models.
+
+Builds a catalog of projects as JSON (as the SQLite store and the content
+loaders read them), then measures with tracemalloc what stays allocated
+after loading it as plain dicts and as ``Project`` models.
+
+Usage:
+    python benchmarks/bench_models_memory.py [--entries 10000,100000] [--technologies 200]
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.portfolio import Project  # noqa: E402
+
+CATEGORIES = ["web", "ai", "data", "automation", "mobile", "devops"]
+
+
+def catalog(entries: int, technologies: int) -> bytes:
+    rng = random.Random(42)
+    vocabulary = [f"tech-{i}" for i in range(technologies)]
+    weights = [1 / (rank + 1) for rank in range(technologies)]
+    return json.dumps([
+        {
+            "title": f"Project {i}",
+            "category": rng.choice(CATEGORIES),
+            "description": f"Description of project {i}",
+            "technologies": rng.choices(vocabulary, weights=weights, k=5),
+            "github_url": f"https://github.com/example/project-{i}",
+            "date": f"2024-{i % 12 + 1:02d}",
+        }
+        for i in range(entries)
+    ]).encode()
+
+
+def retained(load, raw: bytes) -> int:
+    """Bytes still allocated by ``load(raw)``'s result once temporaries are freed."""
+    gc.collect()
+    tracemalloc.start()
+    result = load(raw)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entries', default='10000,100000', help='comma-separated catalog sizes')
+    parser.add_argument('--technologies', type=int, default=200)
+    args = parser.parse_args()
+
+    loaders = {
+        'dicts': json.loads,
+        'models': lambda raw: tuple(Project.from_dict(item) for item in json.loads(raw)),
+    }
+    print(f"{'entries':>8} {'dicts B/entry':>14} {'models B/entry':>15} {'saved':>6}")
+    for entries in (int(n) for n in args.entries.split(',')):
+        raw = catalog(entries, args.technologies)
+        sizes = {name: retained(load, raw) / entries for name, load in loaders.items()}
+        saved = 1 - sizes['models'] / sizes['dicts']
+        print(f"{entries:>8} {sizes['dicts']:>14.0f} {sizes['models']:>15.0f} {saved:>6.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: per-visitor NiceGUI tree build vs. cached pre-rendered HTML.
+
+Usage:
+    python benchmarks/bench_render.py [--iterations 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nicegui import json as nicegui_json  # noqa: E402
+from nicegui.client import Client  # noqa: E402
+from nicegui.page import page  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+from app.frontend import nicegui_app  # noqa: E402
+from app.frontend.html_renderer import PortfolioPageCache  # noqa: E402
+from app.services.portfolio_service import get_portfolio_service  # noqa: E402
+
+
+def bench_dynamic(iterations: int) -> float:
+    """Build the element tree for a fresh client and serialize it, like the page route does."""
+    bench_page = page('/__bench__')
+    request = Request({'type': 'http', 'method': 'GET', 'path': '/', 'headers': [], 'client': ('127.0.0.1', 0)})
+    start = time.perf_counter()
+    for _ in range(iterations):
+        with Client(bench_page) as client:
+            nicegui_app.home_page(request)
+        nicegui_json.dumps({id: element._to_dict() for id, element in client.elements.items()})
+        client.delete()
+    return (time.perf_counter() - start) / iterations
+
+
+def bench_cached(iterations: int) -> float:
+    """Serve the page from the in-memory cache (one render, then hits)."""
+    cache = PortfolioPageCache(nicegui_app.HEAD_HTML)
+    service = get_portfolio_service()
+    cache.get(service)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        cache.get(service)
+    return (time.perf_counter() - start) / iterations
+
+
+def bench_cached_render(iterations: int) -> float:
+    """Render cost paid once per content version."""
+    cache = PortfolioPageCache(nicegui_app.HEAD_HTML)
+    service = get_portfolio_service()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        cache._page = None
+        cache.get(service)
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    cached = bench_cached(args.iterations * 100)
+    render = bench_cached_render(args.iterations)
+    dynamic = bench_dynamic(args.iterations)
+    print(f"dynamic (per-client NiceGUI build): {dynamic * 1e3:9.3f} ms/request")
+    print(f"cached render (once per version):   {render * 1e3:9.3f} ms")
+    print(f"cached hit:                         {cached * 1e6:9.3f} us/request")
+    print(f"speedup per request:                {dynamic / cached:9.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,381 @@
+"""
+Load test: throughput and latency of the main endpoints under concurrent clients.
+
+Starts the app in a fresh process per scenario (or targets --url), runs each
+scenario for --duration seconds with --concurrency closed-loop clients, and
+reports requests per second, p50/p95/p99 latency, errors, requests shed with
+429/503 + Retry-After, and the server's resident memory growth per client.
+Scenarios:
+
+- home        GET /
+- ping        GET /api/ping
+- health      GET /api/health
+- nicegui     NiceGUI page load plus the socket.io websocket handshake (nicegui only)
+- contact     POST /api/contact with a distinct message per request
+
+Results are written as JSON (--output). With --baseline the run is compared
+against committed numbers and exits with status 1 when throughput drops, or
+p95/p99 latency or the share of shed requests grows, by more than
+--tolerance; --update-baseline records the run as the new baseline for its
+framework instead.
+
+Usage:
+    python benchmarks/load_test.py [--framework fastapi|nicegui] [--scenarios home,ping]
+        [--concurrency 20] [--duration 10] [--output results.json]
+        [--baseline benchmarks/load_baseline.json [--update-baseline]]
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import aiohttp
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, 'benchmarks', 'load_baseline.json')
+
+SERVERS = {
+    'fastapi': "import uvicorn, main; uvicorn.run(main.app, host='127.0.0.1', port={port}, log_level='warning')",
+    'nicegui': "import main; main.ui.run(host='127.0.0.1', port={port}, reload=False, show=False)",
+}
+SCENARIOS = {
+    'fastapi': ['home', 'ping', 'health', 'contact'],
+    'nicegui': ['home', 'ping', 'health', 'nicegui', 'contact'],
+}
+CLIENT_ID = re.compile(r'client_id\W+([0-9a-f-]{36})')
+# Latency percentiles and throughput compared against the baseline
+COMPARED = (('rps', -1), ('p95_ms', 1), ('p99_ms', 1))
+# Growth of the shed share (rejected / attempted) always tolerated, in percentage points
+REJECTED_SLACK = 0.01
+
+Scenario = Callable[[aiohttp.ClientSession, str, int], Awaitable[None]]
+
+
+class ScenarioError(Exception):
+    """A request that did not produce the expected response."""
+
+
+class Rejected(ScenarioError):
+    """The server shed the request on purpose (429/503 with Retry-After)."""
+
+
+async def expect(response: aiohttp.ClientResponse, status: int = 200) -> bytes:
+    body = await response.read()
+    if response.status in (429, 503) and 'Retry-After' in response.headers:
+        raise Rejected(f'{response.method} {response.url.path}: {response.status}')
+    if response.status != status:
+        raise ScenarioError(f'{response.method} {response.url.path}: {response.status}')
+    return body
+
+
+async def get_home(session: aiohttp.ClientSession, base: str, n: int) -> None:
+    async with session.get(f'{base}/') as response:
+        await expect(response)
+
+
+async def get_ping(session: aiohttp.ClientSession, base: str, n: int) -> None:
+    async with session.get(f'{base}/api/ping') as response:
+        await expect(response)
+
+
+async def get_health(session: aiohttp.ClientSession, base: str, n: int) -> None:
+    async with session.get(f'{base}/api/health') as response:
+        await expect(response)
+
+
+async def nicegui_page(session: aiohttp.ClientSession, base: str, n: int) -> None:
+    """Load the page, then connect its socket.io websocket and complete NiceGUI's handshake."""
+    async with session.get(f'{base}/') as response:
+        html = (await expect(response)).decode()
+    match = CLIENT_ID.search(html)
+    if match is None:
+        raise ScenarioError('GET /: no client_id in page')
+    client_id = match.group(1)
+    url = f"{base.replace('http', 'ws', 1)}/_nicegui_ws/socket.io/?EIO=4&transport=websocket&client_id={client_id}"
+    async with session.ws_connect(url) as ws:
+        await ws.receive(timeout=10)  # engine.io open packet
+        await ws.send_str('40')  # connect to the default namespace
+        await ws.receive(timeout=10)
+        await ws.send_str('421' + json.dumps(['handshake', {'client_id': client_id, 'tab_id': f'load-{n}',
+                                                             'old_tab_id': None}]))
+        while True:
+            message = await ws.receive(timeout=10)
+            if message.type != aiohttp.WSMsgType.TEXT:
+                raise ScenarioError(f'websocket closed during handshake ({message.type.name})')
+            if message.data.startswith('431'):
+                if message.data != '431[true]':
+                    raise ScenarioError('handshake rejected')
+                return
+
+
+async def post_contact(session: aiohttp.ClientSession, base: str, n: int) -> None:
+    payload = {'name': 'Load Test', 'email': 'load@example.com', 'subject': f'Load test {n}',
+               'message': f'Load test message {n} at {time.time()}'}
+    async with session.post(f'{base}/api/contact', json=payload) as response:
+        await expect(response, 202)
+
+
+SCENARIO_FUNCTIONS: Dict[str, Scenario] = {
+    'home': get_home,
+    'ping': get_ping,
+    'health': get_health,
+    'nicegui': nicegui_page,
+    'contact': post_contact,
+}
+
+
+def rss_kb(pid: Optional[int]) -> Optional[int]:
+    """Resident set size of ``pid`` in KiB (Linux only; None if unknown)."""
+    if pid is None:
+        return None
+    try:
+        with open(f'/proc/{pid}/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))]
+
+
+async def run_scenario(base: str, scenario: Scenario, concurrency: int, duration: float,
+                       pid: Optional[int]) -> Dict[str, object]:
+    """Run ``concurrency`` closed-loop clients for ``duration`` seconds and summarize their latencies."""
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    rejected = 0
+    counter = itertools.count()
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    rss_before = rss_kb(pid)
+    rss_peak = rss_before
+
+    async with aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar(),
+                                     timeout=aiohttp.ClientTimeout(total=30)) as session:
+        deadline = time.perf_counter() + duration
+
+        async def client() -> None:
+            nonlocal rejected
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    await scenario(session, base, next(counter))
+                except Rejected:
+                    rejected += 1
+                except (aiohttp.ClientError, asyncio.TimeoutError, ScenarioError) as e:
+                    key = str(e) or type(e).__name__
+                    errors[key] = errors.get(key, 0) + 1
+                else:
+                    latencies.append(time.perf_counter() - start)
+
+        async def sample_memory() -> None:
+            nonlocal rss_peak
+            while True:
+                current = rss_kb(pid)
+                if current is not None:
+                    rss_peak = max(rss_peak or 0, current)
+                await asyncio.sleep(0.1)
+
+        sampler = asyncio.create_task(sample_memory())
+        began = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - began
+        sampler.cancel()
+
+    latencies.sort()
+    ms = [value * 1000 for value in latencies]
+    return {
+        'requests': len(latencies),
+        'errors': sum(errors.values()),
+        'error_kinds': dict(sorted(errors.items(), key=lambda item: -item[1])[:5]),
+        'rejected': rejected,
+        'rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(percentile(ms, 0.50), 2),
+        'p95_ms': round(percentile(ms, 0.95), 2),
+        'p99_ms': round(percentile(ms, 0.99), 2),
+        'max_ms': round(ms[-1], 2) if ms else 0.0,
+        'mean_ms': round(statistics.fmean(ms), 2) if ms else 0.0,
+        'rss_per_client_kb': (round((rss_peak - rss_before) / concurrency, 1)
+                              if rss_before is not None and rss_peak is not None else None),
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(framework: str, workdir: str, timeout: float = 60.0):
+    """Start the app on a free port with throwaway databases; returns (process, base URL)."""
+    port = free_port()
+    env = dict(
+        os.environ,
+        FRAMEWORK=framework,
+        DEBUG='false',
+        PORTFOLIO_DB_PATH=os.path.join(workdir, 'portfolio.db'),
+        CONTACT_DB_PATH=os.path.join(workdir, 'messages.db'),
+        LOG_FILE=os.path.join(workdir, 'app.log'),
+        # The contact scenario posts from one address, as fast as the server answers
+        CONTACT_RATE_LIMIT_BURST='0',
+        SMTP_HOST='',
+    )
+    proc = subprocess.Popen([sys.executable, '-c', SERVERS[framework].format(port=port)], cwd=ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f'{framework} server exited with code {proc.returncode}')
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return proc, f'http://127.0.0.1:{port}'
+        except OSError:
+            time.sleep(0.05)
+    stop_server(proc)
+    raise RuntimeError(f'{framework} server did not start within {timeout}s')
+
+
+def stop_server(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def rejected_share(result: Dict[str, object]) -> float:
+    attempted = result['requests'] + result['rejected']
+    return result['rejected'] / attempted if attempted else 0.0
+
+
+def compare(results: Dict[str, Dict[str, object]], baseline: Dict[str, Dict[str, object]],
+            tolerance: float, slack_ms: float) -> List[str]:
+    """Describe every metric that regressed beyond ``tolerance`` (a fraction) against the baseline."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric, direction in COMPARED:
+            old, new = float(base[metric]), float(result[metric])
+            if old <= 0:
+                continue
+            change = (new - old) / old
+            if direction < 0 and change < -tolerance:
+                regressions.append(f'{name}: {metric} {old:g} -> {new:g} ({change:+.0%})')
+            elif direction > 0 and change > tolerance and new - old > slack_ms:
+                regressions.append(f'{name}: {metric} {old:g} -> {new:g} ({change:+.0%})')
+        # Shed requests are not in the latencies, so more shedding could otherwise look like an improvement
+        old, new = rejected_share(base), rejected_share(result)
+        if new - old > REJECTED_SLACK and new > old * (1 + tolerance):
+            regressions.append(f'{name}: rejected {old:.1%} -> {new:.1%} of requests')
+        if result['errors'] and not base.get('errors'):
+            regressions.append(f"{name}: {result['errors']} errors (baseline had none)")
+    return regressions
+
+
+def print_results(results: Dict[str, Dict[str, object]], baseline: Dict[str, Dict[str, object]]) -> None:
+    print(f"  {'scenario':<9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7} "
+          f"{'rejected':>8} {'KiB/client':>10}")
+    for name, r in results.items():
+        memory = '-' if r['rss_per_client_kb'] is None else f"{r['rss_per_client_kb']:.1f}"
+        print(f"  {name:<9} {r['rps']:>8.1f} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+              f"{r['errors']:>7} {r['rejected']:>8} {memory:>10}")
+        base = baseline.get(name)
+        if base:
+            print(f"  {'baseline':<9} {base['rps']:>8.1f} {base['p50_ms']:>8.2f} {base['p95_ms']:>8.2f} "
+                  f"{base['p99_ms']:>8.2f}")
+        for kind, count in r['error_kinds'].items():
+            print(f'      {count} x {kind}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--framework', choices=sorted(SERVERS), default='fastapi')
+    parser.add_argument('--url', help='Target a running server instead of starting one (no memory figures)')
+    parser.add_argument('--scenarios', help='Comma-separated scenarios (default: all for the framework)')
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds per scenario')
+    parser.add_argument('--warmup', type=float, default=2.0, help='Unmeasured seconds per scenario')
+    parser.add_argument('--output', help='Write the results to this JSON file')
+    parser.add_argument('--baseline', nargs='?', const=DEFAULT_BASELINE, help='Compare with this baseline file')
+    parser.add_argument('--update-baseline', action='store_true', help='Store this run in the baseline file')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative regression (0.25 = 25%%)')
+    parser.add_argument('--slack-ms', type=float, default=2.0, help='Latency increases below this never fail')
+    args = parser.parse_args()
+
+    names = args.scenarios.split(',') if args.scenarios else SCENARIOS[args.framework]
+    unknown = [name for name in names if name not in SCENARIO_FUNCTIONS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    baseline_path = args.baseline or (DEFAULT_BASELINE if args.update_baseline else None)
+    baseline_doc = {}
+    if baseline_path and os.path.exists(baseline_path):
+        with open(baseline_path, encoding='utf-8') as f:
+            baseline_doc = json.load(f)
+    baseline = baseline_doc.get(args.framework, {}).get('scenarios', {})
+
+    results = {}
+    for name in names:
+        scenario = SCENARIO_FUNCTIONS[name]
+        # A fresh server per scenario, so clients and caches left by one scenario do not skew the next
+        with tempfile.TemporaryDirectory(prefix='load-test-') as workdir:
+            proc, base = (None, args.url.rstrip('/')) if args.url else start_server(args.framework, workdir)
+            try:
+                if args.warmup > 0:
+                    asyncio.run(run_scenario(base, scenario, args.concurrency, args.warmup, None))
+                results[name] = asyncio.run(run_scenario(base, scenario, args.concurrency, args.duration,
+                                                         proc.pid if proc else None))
+            finally:
+                if proc is not None:
+                    stop_server(proc)
+
+    run = {
+        'framework': args.framework,
+        'concurrency': args.concurrency,
+        'duration': args.duration,
+        'python': platform.python_version(),
+        'machine': f'{platform.system()} {platform.machine()}, {os.cpu_count()} CPUs',
+        'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'scenarios': results,
+    }
+    print(f'{args.framework}: {args.concurrency} clients, {args.duration:g}s per scenario')
+    print_results(results, {} if args.update_baseline else baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(run, f, indent=2)
+    if args.update_baseline:
+        baseline_doc[args.framework] = run
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(baseline_doc, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f'Baseline updated: {baseline_path}')
+    elif baseline:
+        regressions = compare(results, baseline, args.tolerance, args.slack_ms)
+        if regressions:
+            print(f'\nRegressions beyond {args.tolerance:.0%}:')
+            for line in regressions:
+                print(f'  {line}')
+            sys.exit(1)
+        print(f'\nNo regressions beyond {args.tolerance:.0%} against the baseline')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Gunicorn settings for the FastAPI app (started by serve.py).
+
+Workers are uvicorn event loops sized from the container's CPUs and memory.
+The app is imported in each worker rather than preloaded in the master, so
+every worker opens its own SQLite connections and starts its own background
+tasks and log listener; content is shared through the database. With several
+workers each one logs to its own LOG_FILE, suffixed with its index.
+"""
+import itertools
+import os
+
+from serve import recommended_workers
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+workers = recommended_workers()
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = False
+
+# X-Forwarded-* are only honoured from these addresses. fly.io's proxy appends
+# to X-Forwarded-For, so with "*" uvicorn would take the client's own first
+# entry as its address; the app reads CLIENT_IP_HEADER (Fly-Client-IP) instead
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+
+# Leave time for the contact pipeline to flush its queue on shutdown
+graceful_timeout = 30
+timeout = 60
+keepalive = 5
+
+
+def pre_fork(server, worker):
+    # The lowest index no live worker holds, so a restarted worker reuses its predecessor's log file
+    taken = {getattr(other, "index", None) for other in server.WORKERS.values()}
+    worker.index = next(index for index in itertools.count() if index not in taken)
+
+
+def post_fork(server, worker):
+    # Runs in the worker before the app is imported (preload_app is off)
+    if workers > 1:
+        os.environ["WORKER_INDEX"] = str(worker.index)
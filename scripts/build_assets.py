@@ -0,0 +1,40 @@
+"""
+Fingerprint and precompress the static assets in app/static.
+
+Writes app/static/dist/<name>.<hash>.<ext> plus .br/.gz variants and
+app/static/dist/manifest.json, which the app uses to resolve asset URLs,
+then generates the responsive WebP/JPEG variants of every image.
+Run it after changing anything under app/static (the Docker build does).
+
+Usage:
+    python scripts/build_assets.py [--static-dir app/static]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.assets import STATIC_DIR, build_assets  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.images import ImagePipeline  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--static-dir", default=STATIC_DIR)
+    args = parser.parse_args()
+    manifest = build_assets(args.static_dir)
+    for logical, entry in sorted(manifest["assets"].items()):
+        encodings = ", ".join(entry["encodings"]) or "-"
+        print(f"{logical} -> {entry['file']} [{encodings}]")
+    pipeline = ImagePipeline(args.static_dir, widths=settings.IMAGE_VARIANT_WIDTHS,
+                             webp_quality=settings.IMAGE_WEBP_QUALITY, jpeg_quality=settings.IMAGE_JPEG_QUALITY)
+    if pipeline.enabled:
+        print(f"Image variants ready for {pipeline.build_all()} images")
+    else:
+        print("Pillow is not installed; skipped image variants")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compile the Markdown/YAML portfolio content into the bundle the app loads.
+
+Only files whose hash changed since the last build are parsed and rendered
+again. A running app picks up the new bundle through hot reload, so with
+--watch edits under content/ show up without a restart. The app also
+rebuilds a stale bundle at startup; the Docker build runs this once so
+containers start from a ready bundle.
+
+Usage:
+    python scripts/build_content.py [--source content] [--output data/portfolio.bundle] [--watch]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings  # noqa: E402
+from app.services.content_compiler import compile_content  # noqa: E402
+
+
+def _signature(source_dir: str):
+    return sorted(
+        (os.path.join(root, name), os.stat(os.path.join(root, name)).st_mtime_ns)
+        for root, _, files in os.walk(source_dir) for name in files
+    )
+
+
+def build(source_dir: str, output: str) -> None:
+    start = time.perf_counter()
+    try:
+        result = compile_content(source_dir, output)
+    except ValueError as e:
+        print(f"Invalid content, kept the previous bundle: {e}")
+        return
+    elapsed = (time.perf_counter() - start) * 1000
+    status = f"wrote {output}" if result.written else "bundle up to date"
+    print(f"{status}: {len(result.parsed)} parsed, {result.reused} unchanged, "
+          f"{len(result.removed)} removed in {elapsed:.1f} ms")
+    for path in result.parsed:
+        print(f"  parsed {path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default=settings.CONTENT_SOURCE_DIR)
+    parser.add_argument("--output", default=settings.PORTFOLIO_CONTENT_PATH)
+    parser.add_argument("--watch", action="store_true", help="rebuild whenever a source file changes")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between checks with --watch")
+    args = parser.parse_args()
+    if not os.path.isdir(args.source):
+        parser.error(f"content directory {args.source} does not exist")
+    build(args.source, args.output)
+    if args.watch:
+        signature = _signature(args.source)
+        try:
+            while True:
+                time.sleep(args.interval)
+                current = _signature(args.source)
+                if current != signature:
+                    signature = current
+                    build(args.source, args.output)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Subset Inter and the Font Awesome icons to the glyphs the site uses.
+
+Reads the source fonts from --source-dir (default build/fonts), downloading
+the pinned releases there if they are missing, renders the portfolio page to
+collect the characters and icon classes in use, and writes WOFF2 subsets plus
+fonts.json to app/static/fonts. Run it before scripts/build_assets.py so the
+subsets get fingerprinted (the Docker build does both).
+
+Usage:
+    python scripts/build_fonts.py [--source-dir build/fonts] [--inter path/to/InterVariable.ttf]
+"""
+import argparse
+import glob
+import io
+import os
+import sys
+import tarfile
+import urllib.request
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.core.fonts import ICON_STYLES, build_fonts  # noqa: E402
+
+INTER_URL = "https://github.com/rsms/inter/releases/download/v4.0/Inter-4.0.zip"
+INTER_FILE = "InterVariable.ttf"
+FONT_AWESOME_URL = "https://registry.npmjs.org/@fortawesome/fontawesome-free/-/fontawesome-free-6.5.1.tgz"
+
+
+def _download(url: str) -> bytes:
+    print(f"Downloading {url}")
+    with urllib.request.urlopen(url, timeout=60) as response:
+        return response.read()
+
+
+def ensure_sources(source_dir: str, inter: bool = True) -> None:
+    """Fetch the pinned Inter and Font Awesome releases into ``source_dir`` if needed."""
+    os.makedirs(source_dir, exist_ok=True)
+    if inter and not os.path.exists(os.path.join(source_dir, INTER_FILE)):
+        with zipfile.ZipFile(io.BytesIO(_download(INTER_URL))) as archive:
+            member = next(name for name in archive.namelist() if os.path.basename(name) == INTER_FILE)
+            with open(os.path.join(source_dir, INTER_FILE), "wb") as f:
+                f.write(archive.read(member))
+    icon_files = [source_file for source_file, _, _ in ICON_STYLES.values()]
+    if not all(os.path.exists(os.path.join(source_dir, name)) for name in icon_files):
+        with tarfile.open(fileobj=io.BytesIO(_download(FONT_AWESOME_URL)), mode="r:gz") as archive:
+            for name in icon_files:
+                data = archive.extractfile(f"package/webfonts/{name}").read()
+                with open(os.path.join(source_dir, name), "wb") as f:
+                    f.write(data)
+
+
+def collect_texts() -> list:
+    """The rendered portfolio page plus the frontend sources and templates."""
+    from app.frontend.html_renderer import render_portfolio_html
+    from app.services.portfolio_service import get_portfolio_service
+
+    texts = [render_portfolio_html(get_portfolio_service(), "")]
+    patterns = ["app/**/*.py", "app/templates/**/*.html", "templates/**/*.html"]
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(ROOT, pattern), recursive=True):
+            with open(path, encoding="utf-8") as f:
+                texts.append(f.read())
+    return texts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source-dir", default=os.path.join(ROOT, "build", "fonts"))
+    parser.add_argument("--inter", help="Inter font to subset instead of the downloaded variable font")
+    parser.add_argument("--no-download", action="store_true", help="Fail instead of fetching missing sources")
+    args = parser.parse_args()
+
+    if not args.no_download:
+        ensure_sources(args.source_dir, inter=not args.inter)
+    manifest = build_fonts(args.inter or os.path.join(args.source_dir, INTER_FILE), args.source_dir, collect_texts())
+    for face in manifest["faces"]:
+        size = os.path.getsize(os.path.join(ROOT, "app", "static", face["file"]))
+        print(f"{face['family']} ({face['weight']}) -> {face['file']} [{size / 1024:.1f} KiB]")
+    for style, glyphs in manifest["icons"].items():
+        print(f"{style}: {', '.join(sorted(glyphs))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Local stand-in SMTP server for developing and load-testing contact delivery.
+
+Accepts plain SMTP (no TLS/AUTH), keeps received messages in memory and
+prints a one-line summary per message. Point the app at it with:
+
+    SMTP_HOST=127.0.0.1 SMTP_PORT=1025 SMTP_USE_TLS=false
+
+Usage:
+    python scripts/smtp_sink.py [--host 127.0.0.1] [--port 1025] [--fail-rate 0.2]
+"""
+import argparse
+import asyncio
+import random
+from email import message_from_bytes
+from typing import List, Optional, Tuple
+
+
+class SMTPSink:
+    """Minimal asyncio SMTP server that records messages."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 1025, fail_rate: float = 0.0, quiet: bool = False):
+        self.host = host
+        self.port = port
+        self.fail_rate = fail_rate
+        self.quiet = quiet
+        self.messages: List[Tuple[str, List[str], bytes]] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        async def reply(line: str) -> None:
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        sender, recipients = "", []
+        await reply("220 smtp-sink ready")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode(errors="replace").strip()
+                verb = command[:4].upper()
+                if verb in ("EHLO", "HELO"):
+                    await reply("250 smtp-sink")
+                elif verb == "MAIL":
+                    sender, recipients = command[10:].strip("<> "), []
+                    await reply("250 OK")
+                elif verb == "RCPT":
+                    recipients.append(command[8:].strip("<> "))
+                    await reply("250 OK")
+                elif verb == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    data = bytearray()
+                    while True:
+                        chunk = await reader.readline()
+                        if chunk in (b".\r\n", b".\n", b""):
+                            break
+                        data += chunk[1:] if chunk.startswith(b"..") else chunk
+                    if self.fail_rate and random.random() < self.fail_rate:
+                        await reply("451 Temporary failure, try again")
+                        continue
+                    self.messages.append((sender, recipients, bytes(data)))
+                    if not self.quiet:
+                        subject = message_from_bytes(bytes(data)).get("Subject", "")
+                        print(f"[{len(self.messages)}] {sender} -> {', '.join(recipients)}: {subject}")
+                    await reply("250 OK: queued")
+                elif verb in ("RSET", "NOOP"):
+                    sender, recipients = ("", []) if verb == "RSET" else (sender, recipients)
+                    await reply("250 OK")
+                elif verb == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("502 Command not implemented")
+        finally:
+            writer.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="fraction of messages to reject with 451")
+    args = parser.parse_args()
+
+    sink = SMTPSink(args.host, args.port, args.fail_rate)
+    await sink.start()
+    print(f"SMTP sink listening on {args.host}:{sink.port}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
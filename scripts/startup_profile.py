@@ -0,0 +1,117 @@
+"""
+Startup profile: where the time goes between process spawn and ready.
+
+Imports ``main`` in a fresh interpreter under ``python -X importtime``, runs
+the application's startup handlers, and prints:
+
+- the import time per top-level package and the slowest app modules;
+- the time of each startup handler;
+- the init time of each lazily built component (see app/core/startup.py).
+
+Usage:
+    python scripts/startup_profile.py [--framework fastapi|nicegui] [--mode eager|lazy] [--top 15]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the child: import the app, then run its startup and shutdown handlers
+CHILD = r"""
+import asyncio, inspect, json, sys, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter() - start
+from app.core import startup
+
+application = main.app
+if hasattr(application, '_startup_handlers'):  # NiceGUI keeps its own handler lists
+    on_startup, on_shutdown = application._startup_handlers, application._shutdown_handlers
+else:
+    on_startup, on_shutdown = application.router.on_startup, application.router.on_shutdown
+
+async def run(handlers, timings):
+    for handler in handlers:
+        if getattr(handler, '__module__', '').startswith('nicegui'):
+            continue  # NiceGUI's own handlers (e.g. the outbox loop) run for the server's lifetime
+        began = time.perf_counter()
+        result = handler()
+        if inspect.isawaitable(result):
+            await result
+        name = getattr(handler, '__qualname__', repr(handler))
+        timings.append([f"{getattr(handler, '__module__', '?')}.{name}", time.perf_counter() - began])
+
+async def main_():
+    handlers = []
+    await run(on_startup, handlers)
+    ready = time.perf_counter() - start
+    init = dict(startup.init_timings)
+    pending = startup.pending_components()
+    await run(on_shutdown, [])
+    return {'import': imported, 'ready': ready, 'handlers': handlers, 'init': init, 'pending': pending}
+
+report = asyncio.run(main_())
+sys.stdout.write('\n@@PROFILE@@' + json.dumps(report) + '\n')
+"""
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module, self us, cumulative us) for every ``-X importtime`` line."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def print_table(title: str, rows: List[Tuple[str, float]], unit: str = "ms") -> None:
+    print(f"\n{title}")
+    width = max((len(name) for name, _ in rows), default=10)
+    for name, value in rows:
+        print(f"  {name:<{width}}  {value:8.1f} {unit}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--framework", choices=("fastapi", "nicegui"), default=os.getenv("FRAMEWORK", "fastapi"))
+    parser.add_argument("--mode", choices=("eager", "lazy"), default=os.getenv("STARTUP_MODE", "eager"))
+    parser.add_argument("--top", type=int, default=15, help="Rows per import table")
+    args = parser.parse_args()
+
+    env = dict(os.environ, FRAMEWORK=args.framework, STARTUP_MODE=args.mode, PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", CHILD], cwd=ROOT, env=env,
+                          capture_output=True, text=True)
+    marker = proc.stdout.rfind("@@PROFILE@@")
+    if proc.returncode != 0 or marker < 0:
+        sys.stderr.write(proc.stderr[-4000:])
+        sys.exit(f"Profiling run failed (exit code {proc.returncode})")
+    report = json.loads(proc.stdout[marker + len("@@PROFILE@@"):])
+    modules = parse_importtime(proc.stderr)
+
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in modules:
+        by_package[name.split(".")[0]] += self_us
+    packages = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:args.top]
+    own = [(name, cumulative) for name, _, cumulative in modules if name in ("main", "app") or name.startswith("app.")]
+    own = sorted(own, key=lambda item: item[1], reverse=True)[:args.top]
+
+    print(f"Startup profile: FRAMEWORK={args.framework} STARTUP_MODE={args.mode}")
+    print(f"  import main       {report['import'] * 1000:8.1f} ms")
+    print(f"  ready (handlers)  {report['ready'] * 1000:8.1f} ms")
+    print_table("Import time by top-level package (self time)", [(name, us / 1000) for name, us in packages])
+    print_table("Slowest app modules (cumulative import time)", [(name, us / 1000) for name, us in own])
+    print_table("Startup handlers", [(name, seconds * 1000) for name, seconds in report["handlers"]])
+    print_table("Component init", [(name, seconds * 1000) for name, seconds in report["init"].items()])
+    if report["pending"]:
+        print(f"\nDeferred until first use: {', '.join(report['pending'])}")
+
+
+if __name__ == "__main__":
+    main()
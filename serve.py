@@ -0,0 +1,167 @@
+"""
+Production runner: sizes the worker pool and starts the configured framework.
+
+- FRAMEWORK=fastapi: gunicorn with uvicorn workers (see gunicorn.conf.py).
+- FRAMEWORK=nicegui: one NiceGUI process per worker on WORKER_BASE_PORT + i,
+  behind a cookie-sticky proxy on HOST:PORT that keeps every browser (and its
+  websocket) on the worker holding its page. A single worker runs directly
+  on HOST:PORT without the proxy.
+
+Workers share content through the SQLite portfolio store; with more than one
+worker the in-memory backend is replaced by SQLite.
+
+Environment:
+    WEB_CONCURRENCY   worker count (default: sized from CPUs and memory)
+    WORKER_MEMORY_MB  memory budget per worker used for sizing (default 200)
+    MAX_WORKERS       upper bound for the sized worker count (default 8)
+    WORKER_BASE_PORT  first internal port for NiceGUI workers (default 8100)
+    STICKY_COOKIE_NAME  cookie pinning a browser to a NiceGUI worker (default "worker")
+
+This module deliberately does not import the ``app`` package, so neither the
+runner nor the gunicorn master pays for (or forks) the application import;
+the sticky proxy lives in the top-level sticky_proxy.py for the same reason.
+"""
+import logging
+import math
+import os
+import subprocess
+import sys
+import threading
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+logger = logging.getLogger("serve")
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+NICEGUI_WORKER = "import main; main.ui.run(host={host!r}, port={port}, reload=False, show=False)"
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def available_cpus() -> float:
+    """CPUs this process may use: the cgroup quota if set, else the CPU affinity mask."""
+    try:
+        cpus: float = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS
+        cpus = os.cpu_count() or 1
+    quota = None
+    cpu_max = _read("/sys/fs/cgroup/cpu.max")  # cgroup v2: "<quota> <period>" or "max <period>"
+    if cpu_max and not cpu_max.startswith("max"):
+        limit, period = cpu_max.split()[:2]
+        quota = int(limit) / int(period)
+    else:
+        limit, period = _read("/sys/fs/cgroup/cpu/cpu.cfs_quota_us"), _read("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+        if limit and period and int(limit) > 0:
+            quota = int(limit) / int(period)
+    return min(cpus, quota) if quota else cpus
+
+
+def available_memory_mb() -> Optional[int]:
+    """Memory limit of the container in MiB, else the machine's total memory (None if unknown)."""
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        value = _read(path)
+        # cgroup v1 reports "no limit" as a huge number
+        if value and value.isdigit() and int(value) < 1 << 60:
+            return int(value) // (1024 * 1024)
+    meminfo = _read("/proc/meminfo")
+    if meminfo:
+        for line in meminfo.splitlines():
+            if line.startswith("MemTotal:"):
+                return int(line.split()[1]) // 1024
+    return None
+
+
+def recommended_workers(cpus: Optional[float] = None, memory_mb: Optional[int] = None) -> int:
+    """Worker processes to run: ``WEB_CONCURRENCY`` if set, else sized from CPUs and memory.
+
+    Workers are async, so one per CPU keeps every core busy; more would only
+    add memory and context switches. Memory caps the count at one worker per
+    ``WORKER_MEMORY_MB``.
+    """
+    configured = int(os.getenv("WEB_CONCURRENCY") or 0)
+    if configured > 0:
+        return configured
+    cpus = available_cpus() if cpus is None else cpus
+    memory_mb = available_memory_mb() if memory_mb is None else memory_mb
+    per_worker_mb = int(os.getenv("WORKER_MEMORY_MB", "200"))
+    workers = max(1, math.ceil(cpus))
+    if memory_mb and per_worker_mb > 0:
+        workers = min(workers, max(1, memory_mb // per_worker_mb))
+    return max(1, min(workers, int(os.getenv("MAX_WORKERS", "8"))))
+
+
+def supervise(ports: List[int], env: dict, stopping: threading.Event) -> None:
+    """Run one NiceGUI worker per port, restarting any that exit until ``stopping`` is set."""
+    procs = {}
+    while not stopping.is_set():
+        for port in ports:
+            proc = procs.get(port)
+            if proc is not None and proc.poll() is None:
+                continue
+            if proc is not None:
+                logger.warning(f"Worker on port {port} exited with code {proc.returncode}; restarting")
+            # Each worker logs to its own file (see app/core/logging_config.py:log_file_path)
+            worker_env = dict(env, WORKER_INDEX=str(ports.index(port)))
+            procs[port] = subprocess.Popen(
+                [sys.executable, "-c", NICEGUI_WORKER.format(host="127.0.0.1", port=port)], cwd=ROOT, env=worker_env)
+        stopping.wait(1.0)
+    for proc in procs.values():
+        proc.terminate()
+    for proc in procs.values():
+        try:
+            proc.wait(30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    framework = os.getenv("FRAMEWORK", "fastapi").lower()
+    host = os.getenv("HOST", "0.0.0.0")
+    port = int(os.getenv("PORT", "8000"))
+    workers = recommended_workers()
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers))
+    if workers > 1 and env.get("PORTFOLIO_BACKEND", "memory").lower() == "memory":
+        logger.warning("The in-memory portfolio store is per process; using PORTFOLIO_BACKEND=sqlite for workers")
+        env["PORTFOLIO_BACKEND"] = "sqlite"
+    logger.info(f"Starting {framework} with {workers} worker(s) on {host}:{port} "
+                f"({available_cpus():g} CPUs, {available_memory_mb()} MiB)")
+
+    if framework != "nicegui":
+        os.execvpe(sys.executable, [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "main:app"], env)
+    # uvicorn reads WEB_CONCURRENCY as its own worker count; every NiceGUI worker is a single process
+    env.pop("WEB_CONCURRENCY")
+    if workers == 1:
+        os.execvpe(sys.executable, [sys.executable, "-c", NICEGUI_WORKER.format(host=host, port=port)], env)
+
+    base_port = int(os.getenv("WORKER_BASE_PORT", "8100"))
+    ports = [base_port + i for i in range(workers)]
+    # Workers only see the proxy, which overwrites X-Client-IP with the client address
+    # (taken from CLIENT_IP_HEADER when the proxy in front sets one), so they key clients on that alone
+    client_ip_header = env.get("CLIENT_IP_HEADER") or None
+    worker_env = dict(env, CLIENT_IP_HEADER="X-Client-IP", TRUST_FORWARDED_FOR="false")
+    stopping = threading.Event()
+    supervisor = threading.Thread(target=supervise, args=(ports, worker_env, stopping), name="supervisor")
+    supervisor.start()
+    try:
+        # Imported once the workers are booting, so the two imports overlap
+        from sticky_proxy import run_sticky_proxy
+        run_sticky_proxy(host, port, ports, cookie_name=os.getenv("STICKY_COOKIE_NAME", "worker"),
+                         client_ip_header=client_ip_header)
+    finally:
+        stopping.set()
+        supervisor.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Cookie-sticky reverse proxy in front of several NiceGUI worker processes.
+
+NiceGUI keeps a page's client state in the process that rendered it, and the
+browser's socket.io connection has to reach that same process. The proxy
+assigns each new browser a worker, remembers the choice in a cookie set on
+the page response, and routes every later request from that browser to the
+same worker, including socket.io polling and websocket upgrades.
+
+It runs in the serve.py process and is kept outside the ``app`` package, so
+starting it does not import the application.
+"""
+from typing import List, Optional, Sequence
+import asyncio
+import itertools
+import logging
+
+from aiohttp import ClientConnectorError, ClientSession, ClientTimeout, DummyCookieJar, WSMsgType, web
+
+logger = logging.getLogger(__name__)
+
+# Per-connection headers that must not be forwarded (RFC 9110, section 7.6.1)
+HOP_BY_HOP = frozenset(('connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization', 'te',
+                        'trailer', 'trailers', 'transfer-encoding', 'upgrade'))
+# Client address passed to the workers, which key rate limits and visitors on it
+# (serve.py sets their CLIENT_IP_HEADER to it)
+CLIENT_IP_HEADER = 'X-Client-IP'
+WEBSOCKET_HANDSHAKE = frozenset(('sec-websocket-key', 'sec-websocket-version', 'sec-websocket-extensions',
+                                 'sec-websocket-protocol', 'sec-websocket-accept'))
+
+
+class StickyProxy:
+    """Routes each browser to one upstream worker, keyed by a cookie."""
+
+    def __init__(self, upstreams: Sequence[str], cookie_name: str = 'worker', timeout: float = 60.0,
+                 client_ip_header: Optional[str] = None):
+        self.upstreams = list(upstreams)  # base URLs, e.g. http://127.0.0.1:8100
+        self.cookie_name = cookie_name
+        self.timeout = timeout
+        # Header the proxy in front sets to the client address (e.g. Fly-Client-IP); else the peer address
+        self.client_ip_header = client_ip_header
+        self._next = itertools.cycle(range(len(self.upstreams)))
+        self._session: Optional[ClientSession] = None
+
+    def _pinned(self, request: web.Request) -> Optional[int]:
+        value = request.cookies.get(self.cookie_name, '')
+        if value.isdigit() and int(value) < len(self.upstreams):
+            return int(value)
+        return None
+
+    def _forward_headers(self, request: web.Request, websocket: bool = False) -> dict:
+        headers = {}
+        for name, value in request.headers.items():
+            lower = name.lower()
+            if lower in HOP_BY_HOP or lower in ('content-length', CLIENT_IP_HEADER.lower()) or (
+                    websocket and lower in WEBSOCKET_HANDSHAKE):
+                continue
+            headers[name] = value
+        forwarded_for = request.headers.get('X-Forwarded-For')
+        remote = request.remote or ''
+        headers['X-Forwarded-For'] = f'{forwarded_for}, {remote}' if forwarded_for else remote
+        headers.setdefault('X-Forwarded-Proto', request.scheme)
+        # Always overwritten, so a browser cannot choose the address workers see
+        client = request.headers.get(self.client_ip_header, '').strip() if self.client_ip_header else ''
+        headers[CLIENT_IP_HEADER] = client or remote
+        return headers
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        pinned = self._pinned(request)
+        if request.headers.get('Upgrade', '').lower() == 'websocket':
+            return await self._websocket(request, pinned if pinned is not None else next(self._next))
+        # A new browser, or one pinned to a worker that is down, gets the next live worker
+        start = next(self._next)
+        candidates = [pinned] if pinned is not None else []
+        candidates += [(start + i) % len(self.upstreams) for i in range(len(self.upstreams))]
+        body = await request.read()
+        for index in dict.fromkeys(candidates):
+            try:
+                return await self._http(request, index, body, set_cookie=index != pinned)
+            except ClientConnectorError:
+                logger.warning(f"Worker {index} ({self.upstreams[index]}) is unreachable")
+        raise web.HTTPBadGateway(text='No worker available')
+
+    async def _http(self, request: web.Request, index: int, body: bytes, set_cookie: bool) -> web.StreamResponse:
+        url = self.upstreams[index] + request.rel_url.raw_path_qs
+        async with self._session.request(request.method, url, headers=self._forward_headers(request),
+                                         data=body or None, allow_redirects=False) as upstream:
+            response = web.StreamResponse(status=upstream.status, reason=upstream.reason)
+            for name, value in upstream.headers.items():
+                if name.lower() not in HOP_BY_HOP:
+                    response.headers.add(name, value)
+            if set_cookie:
+                response.set_cookie(self.cookie_name, str(index), path='/', httponly=True, samesite='Lax')
+            await response.prepare(request)
+            async for chunk in upstream.content.iter_any():
+                await response.write(chunk)
+            await response.write_eof()
+            return response
+
+    async def _websocket(self, request: web.Request, index: int) -> web.StreamResponse:
+        protocols = [p.strip() for p in request.headers.get('Sec-WebSocket-Protocol', '').split(',') if p.strip()]
+        url = self.upstreams[index].replace('http', 'ws', 1) + request.rel_url.raw_path_qs
+        try:
+            upstream = await self._session.ws_connect(url, headers=self._forward_headers(request, websocket=True),
+                                                      protocols=protocols, autoping=False)
+        except ClientConnectorError:
+            logger.warning(f"Worker {index} ({self.upstreams[index]}) is unreachable for a websocket")
+            raise web.HTTPBadGateway(text='Worker unavailable') from None
+        client = web.WebSocketResponse(protocols=protocols, autoping=False)
+        await client.prepare(request)
+
+        async def pump(source, target) -> None:
+            async for message in source:
+                if message.type == WSMsgType.TEXT:
+                    await target.send_str(message.data)
+                elif message.type == WSMsgType.BINARY:
+                    await target.send_bytes(message.data)
+                elif message.type == WSMsgType.PING:
+                    await target.ping(message.data)
+                elif message.type == WSMsgType.PONG:
+                    await target.pong(message.data)
+            await target.close()
+
+        try:
+            await asyncio.gather(pump(client, upstream), pump(upstream, client))
+        finally:
+            await upstream.close()
+            await client.close()
+        return client
+
+    async def _start(self, app: web.Application) -> None:
+        # Bodies and cookies pass through untouched and only the browser's own headers are sent
+        # (aiohttp would otherwise ask for gzip on behalf of clients that cannot decode it)
+        self._session = ClientSession(timeout=ClientTimeout(total=None, sock_read=self.timeout),
+                                      auto_decompress=False, cookie_jar=DummyCookieJar(),
+                                      skip_auto_headers=('Accept-Encoding', 'User-Agent'))
+
+    async def _stop(self, app: web.Application) -> None:
+        await self._session.close()
+
+    def application(self) -> web.Application:
+        app = web.Application(client_max_size=16 * 1024 * 1024)
+        app.router.add_route('*', '/{path:.*}', self.handle)
+        app.on_startup.append(self._start)
+        app.on_cleanup.append(self._stop)
+        return app
+
+
+def run_sticky_proxy(host: str, port: int, upstream_ports: List[int], cookie_name: str = 'worker',
+                     client_ip_header: Optional[str] = None) -> None:
+    """Serve the proxy until interrupted; upstream workers listen on localhost."""
+    proxy = StickyProxy([f'http://127.0.0.1:{p}' for p in upstream_ports], cookie_name=cookie_name,
+                        client_ip_header=client_ip_header)
+    logger.info(f"Sticky proxy on {host}:{port} -> workers on ports {', '.join(map(str, upstream_ports))}")
+    web.run_app(proxy.application(), host=host, port=port, print=None, access_log=None)
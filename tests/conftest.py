@@ -0,0 +1,14 @@
+import os
+import sys
+import tempfile
+
+# Importing any app module imports the app; keep its files out of the checkout
+_TMP = tempfile.mkdtemp(prefix="portfolio-tests-")
+os.environ.setdefault("LOG_FILE", os.path.join(_TMP, "app.log"))
+os.environ.setdefault("CONTACT_DB_PATH", os.path.join(_TMP, "messages.db"))
+os.environ.setdefault("ANALYTICS_DB_PATH", os.path.join(_TMP, "analytics.db"))
+os.environ.setdefault("PORTFOLIO_DB_PATH", os.path.join(_TMP, "portfolio.db"))
+os.environ.setdefault("TEMPLATE_BYTECODE_CACHE_DIR", "")
+os.environ.setdefault("HOT_RELOAD", "false")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from app.core.admission import CLASSES, AdmissionController, ClassLimits, Rejected, classify
+
+
+def controller(max_in_flight=2, api=(2, 2, 1.0), page=(2, 2, 1.0), form=(1, 1, 1.0)) -> AdmissionController:
+    limits = {"health": ClassLimits(0, 0, 0.0), "api": ClassLimits(*api),
+              "page": ClassLimits(*page), "form": ClassLimits(*form)}
+    return AdmissionController(max_in_flight, limits)
+
+
+def test_classify():
+    def scope(method, path):
+        return {"method": method, "path": path}
+
+    assert classify(scope("GET", "/api/health/live")) == "health"
+    assert classify(scope("GET", "/_nicegui/1.4.21/static/x.js")) == "health"
+    assert classify(scope("GET", "/api/projects")) == "api"
+    assert classify(scope("POST", "/api/contact")) == "form"
+    assert classify(scope("GET", "/")) == "page"
+    assert classify(scope("HEAD", "/")) == "page"
+
+
+def test_admits_up_to_the_limits_and_health_always():
+    async def run():
+        admission = controller(max_in_flight=2)
+        await admission.acquire("api")
+        await admission.acquire("page")
+        for _ in range(5):
+            await admission.acquire("health")
+        assert admission.total_in_flight == 2
+        assert admission.in_flight["health"] == 5
+
+    asyncio.run(run())
+
+
+def test_full_queue_is_rejected_immediately():
+    async def run():
+        admission = controller(max_in_flight=1, page=(1, 1, 1.0))
+        await admission.acquire("page")
+        waiting = asyncio.create_task(admission.acquire("page"))
+        await asyncio.sleep(0)
+        with pytest.raises(Rejected) as rejected:
+            await admission.acquire("page")
+        assert rejected.value.reason == "rejected"
+        admission.release("page")
+        await waiting
+        assert admission.in_flight["page"] == 1
+
+    asyncio.run(run())
+
+
+def test_waiter_times_out_and_leaves_the_queue():
+    async def run():
+        admission = controller(max_in_flight=1, api=(1, 5, 0.05))
+        await admission.acquire("api")
+        with pytest.raises(Rejected) as rejected:
+            await admission.acquire("api")
+        assert rejected.value.reason == "timeout"
+        assert admission.status()["api"] == {"in_flight": 1, "queued": 0}
+
+    asyncio.run(run())
+
+
+def test_zero_timeout_sheds_instead_of_queueing():
+    async def run():
+        admission = controller(max_in_flight=1, form=(1, 10, 0.0))
+        await admission.acquire("form")
+        with pytest.raises(Rejected):
+            await admission.acquire("form")
+
+    asyncio.run(run())
+
+
+def test_freed_slot_goes_to_the_most_important_waiting_class():
+    async def run():
+        admission = controller(max_in_flight=1)
+        await admission.acquire("page")
+        order = []
+
+        async def wait(name):
+            await admission.acquire(name)
+            order.append(name)
+
+        form = asyncio.create_task(wait("form"))
+        await asyncio.sleep(0)
+        api = asyncio.create_task(wait("api"))
+        await asyncio.sleep(0)
+        admission.release("page")
+        await api
+        assert order == ["api"] and not form.done()
+        admission.release("api")
+        await form
+        assert order == ["api", "form"]
+
+    asyncio.run(run())
+
+
+def test_new_request_does_not_jump_the_queue():
+    async def run():
+        admission = controller(max_in_flight=1, page=(1, 5, 1.0))
+        await admission.acquire("page")
+        waiting = asyncio.create_task(admission.acquire("page"))
+        await asyncio.sleep(0)
+        admission.release("page")
+        # The slot was handed to the waiter, so a newcomer has to queue behind it
+        newcomer = asyncio.create_task(admission.acquire("page"))
+        await waiting
+        assert not newcomer.done()
+        admission.release("page")
+        await newcomer
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_passes_on_its_slot():
+    async def run():
+        admission = controller(max_in_flight=1, api=(1, 5, 1.0))
+        await admission.acquire("api")
+        first = asyncio.create_task(admission.acquire("api"))
+        second = asyncio.create_task(admission.acquire("api"))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        admission.release("api")
+        await second
+        assert admission.status()["api"] == {"in_flight": 1, "queued": 0}
+        assert set(admission.status()) == set(CLASSES)
+
+    asyncio.run(run())
@@ -0,0 +1,62 @@
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.error_capture import ErrorAggregator, ErrorCaptureMiddleware
+
+
+def make_client(aggregator: ErrorAggregator, debug: bool = False) -> TestClient:
+    app = FastAPI(debug=debug)
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/other")
+    async def other():
+        raise KeyError("other")
+
+    app.add_middleware(ErrorCaptureMiddleware, aggregator=aggregator)
+    return TestClient(app)
+
+
+def traces(caplog) -> list:
+    return [record for record in caplog.records
+            if record.name == "app.core.error_capture" and record.exc_info is not None]
+
+
+def test_one_traceback_per_fingerprint_per_interval(caplog):
+    aggregator = ErrorAggregator(trace_interval=60.0)
+    client = make_client(aggregator)
+    with caplog.at_level(logging.INFO):
+        for _ in range(5):
+            response = client.get("/boom")
+            assert response.status_code == 500
+            assert response.json() == {"detail": "An unexpected internal server error occurred."}
+        client.get("/other")
+    assert len(traces(caplog)) == 2
+    counts = {entry["type"]: entry["count"] for entry in aggregator.snapshot()}
+    assert counts == {"RuntimeError": 5, "KeyError": 1}
+
+
+def test_traceback_logged_again_after_interval(caplog):
+    aggregator = ErrorAggregator(trace_interval=60.0)
+    client = make_client(aggregator)
+    with caplog.at_level(logging.INFO):
+        client.get("/boom")
+        for entry in aggregator._entries.values():
+            entry.last_trace_at -= 61.0
+        client.get("/boom")
+        client.get("/boom")
+    assert len(traces(caplog)) == 2
+
+
+def test_debug_mode_is_captured_too(caplog):
+    aggregator = ErrorAggregator(trace_interval=60.0)
+    client = make_client(aggregator, debug=True)
+    with caplog.at_level(logging.INFO):
+        assert client.get("/boom").status_code == 500
+        assert client.get("/boom").status_code == 500
+    assert len(traces(caplog)) == 1
+    assert aggregator.snapshot()[0]["count"] == 2
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from app.models.portfolio import Project
+from app.services.facet_index import FacetIndex
+from app.services.portfolio_service import PortfolioService
+from app.services.portfolio_store import InMemoryPortfolioStore, SQLitePortfolioStore
+
+TECHNOLOGIES = ["Python", "PyTorch", "FastAPI", "React", "SQL", "Docker", "Rust"]
+
+
+def random_entries(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    return [set(rng.sample(TECHNOLOGIES, rng.randint(0, 3))) for _ in range(count)]
+
+
+def expected(entries, all_of=(), any_of=()):
+    return [position for position, facets in enumerate(entries)
+            if set(all_of) <= facets and (not any_of or facets & set(any_of))]
+
+
+@pytest.mark.parametrize("all_of, any_of", [
+    ((), ()),
+    (("Python",), ()),
+    (("Python", "PyTorch"), ()),
+    ((), ("React", "Rust")),
+    (("Python",), ("FastAPI", "SQL")),
+    (("Unknown",), ()),
+    ((), ("Unknown",)),
+])
+def test_match_agrees_with_a_linear_scan(all_of, any_of):
+    entries = random_entries(10_000)
+    index = FacetIndex()
+    for facets in entries:
+        index.append(facets)
+    bits = index.match(all_of, any_of)
+    matches = expected(entries, all_of, any_of)
+    assert index.count(bits) == len(matches)
+    assert index.positions(bits) == matches
+
+
+def test_positions_paginate_across_chunks():
+    entries = random_entries(10_000)
+    index = FacetIndex()
+    for facets in entries:
+        index.append(facets)
+    bits = index.match(("Python",))
+    matches = expected(entries, ("Python",))
+    for offset, limit in [(0, 10), (5, 7), (1000, 50), (len(matches) - 3, 10), (len(matches), 10)]:
+        assert index.positions(bits, offset, limit) == matches[offset:offset + limit]
+
+
+def test_entries_without_facets_count_in_the_universe():
+    index = FacetIndex()
+    index.add(0, ["Python"])
+    index.reserve(3)
+    assert len(index) == 3
+    assert index.positions(index.match()) == [0, 1, 2]
+    assert index.append(["Rust"]) == 3
+
+
+def test_facet_counts_within_a_match():
+    entries = random_entries(2000)
+    index = FacetIndex()
+    for facets in entries:
+        index.append(facets)
+    bits = index.match(any_of=("Docker",))
+    counts = index.facet_counts(bits)
+    matches = expected(entries, any_of=("Docker",))
+    for technology in TECHNOLOGIES:
+        count = sum(1 for position in matches if technology in entries[position])
+        assert counts.get(technology, 0) == count
+    assert index.facet_counts()["Docker"] == len(matches)
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_service_filter_follows_added_projects(backend, tmp_path):
+    store = InMemoryPortfolioStore() if backend == "memory" else SQLitePortfolioStore(str(tmp_path / "p.db"))
+    service = PortfolioService(store=store)
+    for i, facets in enumerate(random_entries(50)):
+        service.add_project(Project(title=f"P{i}", category="ml", description="", technologies=tuple(sorted(facets))))
+    result = service.filter_by_technologies(all_of=["Python"], offset=2, limit=5)["projects"]
+    matches = [project for project in store.get_projects() if "Python" in project.technologies]
+    assert result["total"] == len(matches)
+    assert [project.title for project in result["items"]] == [project.title for project in matches[2:7]]
+    assert result["facets"]["Python"] == len(matches)
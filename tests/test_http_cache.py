@@ -0,0 +1,90 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.api import portfolio
+from app.core.http_cache import etag_matches, is_not_modified, make_etag
+from app.models.portfolio import Project
+from app.services.portfolio_service import PortfolioService, get_portfolio_service
+from app.services.portfolio_store import InMemoryPortfolioStore
+
+
+def request(**headers) -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"",
+                    "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]})
+
+
+def test_etag_depends_on_version_and_body():
+    etag = make_etag(3, b"{}")
+    assert etag.startswith('"3-') and etag.endswith('"')
+    assert make_etag(3, b"{}") == etag
+    assert make_etag(4, b"{}") != etag
+    assert make_etag(3, b"[]") != etag
+
+
+def test_etag_matches_lists_and_wildcard():
+    etag = make_etag(1, b"x")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches("", etag)
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    etag, last_modified = make_etag(1, b"x"), "Sat, 17 Oct 2026 10:00:00 GMT"
+    assert is_not_modified(request(if_modified_since=last_modified), etag, last_modified)
+    assert not is_not_modified(request(if_modified_since="Fri, 16 Oct 2026 10:00:00 GMT"), etag, last_modified)
+    assert not is_not_modified(request(if_none_match='"stale"', if_modified_since=last_modified), etag, last_modified)
+    assert not is_not_modified(request(), etag, last_modified)
+
+
+@pytest.fixture
+def service():
+    service = PortfolioService(store=InMemoryPortfolioStore())
+    service.update_bio("Hello")
+    service.add_project(Project(title="Search", category="ml", description="", technologies=("Python",)))
+    return service
+
+
+@pytest.fixture
+def client(service):
+    app = FastAPI()
+    app.include_router(portfolio.router, prefix="/api")
+    app.dependency_overrides[get_portfolio_service] = lambda: service
+    portfolio.response_cache.clear()
+    yield TestClient(app)
+    portfolio.response_cache.clear()
+
+
+def test_revalidation_answers_304_without_a_body(client):
+    response = client.get("/api/portfolio/bio")
+    assert response.status_code == 200
+    assert response.json() == {"bio": "Hello"}
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "public, no-cache"
+
+    revalidated = client.get("/api/portfolio/bio", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+
+def test_content_change_invalidates_the_etag(client, service):
+    etag = client.get("/api/portfolio/projects").headers["etag"]
+    service.add_project(Project(title="Chat", category="ml", description="", technologies=("Rust",)))
+    response = client.get("/api/portfolio/projects", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["total"] == 2
+
+
+def test_etag_differs_per_query(client):
+    first = client.get("/api/portfolio/projects", params={"technology": "Python"})
+    second = client.get("/api/portfolio/projects", params={"technology": "Rust"})
+    assert first.headers["etag"] != second.headers["etag"]
+    response = client.get("/api/portfolio/projects", params={"technology": "Rust"},
+                          headers={"If-None-Match": first.headers["etag"]})
+    assert response.status_code == 200
@@ -0,0 +1,100 @@
+import pytest
+
+from app.core import rate_limit
+from app.core.rate_limit import DuplicateFilter, TokenBucketLimiter, client_ip
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_bucket_allows_a_burst_then_asks_to_wait(clock):
+    limiter = TokenBucketLimiter(capacity=3, refill_rate=0.5)
+    assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire("a") == pytest.approx(2.0)
+    # Other keys have their own bucket
+    assert limiter.acquire("b") == 0.0
+
+
+def test_bucket_refills_over_time(clock):
+    limiter = TokenBucketLimiter(capacity=2, refill_rate=1.0)
+    limiter.acquire("a")
+    limiter.acquire("a")
+    assert limiter.acquire("a") > 0
+    clock[0] += 1.0
+    assert limiter.acquire("a") == 0.0
+    assert limiter.acquire("a") > 0
+    clock[0] += 100.0
+    # Never more than the capacity
+    assert [limiter.acquire("a") for _ in range(3)][-1] > 0
+
+
+def test_refund_returns_a_token(clock):
+    limiter = TokenBucketLimiter(capacity=1, refill_rate=0.01)
+    assert limiter.acquire("a") == 0.0
+    assert limiter.acquire("a") > 0
+    limiter.refund("a")
+    assert limiter.acquire("a") == 0.0
+
+
+def test_zero_refill_rate_never_recovers(clock):
+    limiter = TokenBucketLimiter(capacity=1, refill_rate=0)
+    assert limiter.acquire("a") == 0.0
+    assert limiter.acquire("a") == float("inf")
+
+
+def test_bucket_count_is_bounded():
+    limiter = TokenBucketLimiter(capacity=1, refill_rate=1.0, max_keys=10)
+    for key in range(100):
+        limiter.acquire(key)
+    assert len(limiter) == 10
+
+
+def test_duplicate_filter_ignores_case_and_whitespace():
+    duplicates = DuplicateFilter(ttl=60)
+    first = DuplicateFilter.fingerprint(["Jane", "Hello  there\n"])
+    assert not duplicates.seen(first)
+    assert duplicates.seen(DuplicateFilter.fingerprint(["jane", "hello there"]))
+    assert not duplicates.seen(DuplicateFilter.fingerprint(["jane", "hello there!"]))
+
+
+def test_duplicate_filter_separates_fields():
+    assert DuplicateFilter.fingerprint(["ab", "c"]) != DuplicateFilter.fingerprint(["a", "bc"])
+
+
+def test_forgotten_fingerprint_is_accepted_again():
+    duplicates = DuplicateFilter(ttl=60)
+    fingerprint = DuplicateFilter.fingerprint(["message"])
+    assert not duplicates.seen(fingerprint)
+    duplicates.forget(fingerprint)
+    assert not duplicates.seen(fingerprint)
+    assert duplicates.seen(fingerprint)
+
+
+def scope(client="10.0.0.1", **headers):
+    return {
+        "client": (client, 1234) if client else None,
+        "headers": [(name.replace("_", "-").lower().encode(), value.encode()) for name, value in headers.items()],
+    }
+
+
+def test_client_ip_uses_the_peer_address_by_default():
+    assert client_ip(scope(x_forwarded_for="1.1.1.1")) == "10.0.0.1"
+    assert client_ip(scope(client=None)) is None
+
+
+def test_client_ip_takes_the_first_forwarded_entry_only_when_trusted():
+    request = scope(x_forwarded_for="1.1.1.1, 2.2.2.2")
+    assert client_ip(request, trust_forwarded=True) == "1.1.1.1"
+    assert client_ip(scope(x_forwarded_for=" "), trust_forwarded=True) == "10.0.0.1"
+
+
+def test_client_ip_header_wins_over_forwarded_for():
+    request = scope(x_forwarded_for="1.1.1.1", fly_client_ip="3.3.3.3")
+    assert client_ip(request, trust_forwarded=True, header="Fly-Client-IP") == "3.3.3.3"
+    # Without the header, the other sources are used
+    assert client_ip(scope(x_forwarded_for="1.1.1.1"), trust_forwarded=True, header="Fly-Client-IP") == "1.1.1.1"
+    assert client_ip(scope(), header="Fly-Client-IP") == "10.0.0.1"
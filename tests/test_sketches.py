@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from app.services.analytics import DailyAggregate
+from app.services.sketches import CountMinSketch, HyperLogLog, TopK
+
+
+@pytest.mark.parametrize("count", [10, 1000, 50_000])
+def test_hyperloglog_estimate_is_within_its_error(count):
+    sketch = HyperLogLog(12)
+    for i in range(count):
+        sketch.add(f"visitor-{i}")
+    # 1.04 / sqrt(4096) is ~1.6%; allow three standard errors
+    assert sketch.count() == pytest.approx(count, rel=0.05)
+
+
+def test_hyperloglog_ignores_repeats():
+    sketch = HyperLogLog(12)
+    for _ in range(20):
+        for i in range(500):
+            sketch.add(f"visitor-{i}")
+    assert sketch.count() == pytest.approx(500, rel=0.05)
+
+
+def test_hyperloglog_merge_counts_the_union():
+    first, second = HyperLogLog(12), HyperLogLog(12)
+    for i in range(6000):
+        first.add(f"visitor-{i}")
+    for i in range(4000, 10_000):
+        second.add(f"visitor-{i}")
+    first.merge(second)
+    assert first.count() == pytest.approx(10_000, rel=0.05)
+
+
+def test_hyperloglog_round_trips_and_checks_shape():
+    sketch = HyperLogLog(10)
+    sketch.add("a")
+    assert HyperLogLog(10, sketch.to_bytes()).registers == sketch.registers
+    with pytest.raises(ValueError):
+        HyperLogLog(12, sketch.to_bytes())
+    with pytest.raises(ValueError):
+        sketch.merge(HyperLogLog(12))
+    with pytest.raises(ValueError):
+        HyperLogLog(3)
+
+
+def zipf_stream(keys: int, length: int, seed: int = 7):
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(keys)]
+    return rng.choices([f"key-{rank}" for rank in range(keys)], weights, k=length)
+
+
+def test_count_min_never_undercounts_and_stays_within_its_bound():
+    stream = zipf_stream(2000, 20_000)
+    sketch = CountMinSketch(width=512, depth=4)
+    exact = {}
+    for key in stream:
+        sketch.add(key)
+        exact[key] = exact.get(key, 0) + 1
+    bound = 2 * len(stream) / sketch.width
+    for key, count in exact.items():
+        assert count <= sketch.estimate(key) <= count + bound
+    assert sketch.estimate("never-seen") <= bound
+
+
+def test_count_min_merge_adds_counts():
+    first, second = CountMinSketch(256, 4), CountMinSketch(256, 4)
+    first.add("a", 3)
+    second.add("a", 4)
+    second.add("b")
+    first.merge(second)
+    assert first.estimate("a") >= 7
+    assert first.estimate("b") >= 1
+    restored = CountMinSketch(256, 4, first.to_rows())
+    assert restored.estimate("a") == first.estimate("a")
+    with pytest.raises(ValueError):
+        first.merge(CountMinSketch(128, 4))
+
+
+def test_top_k_finds_the_heavy_hitters():
+    top = TopK(5, CountMinSketch(1024, 4))
+    for key in zipf_stream(500, 20_000):
+        top.add(key)
+    assert [key for key, _ in top.items()] == [f"key-{rank}" for rank in range(5)]
+
+
+def test_top_k_merge_keeps_the_most_frequent():
+    first, second = TopK(2, CountMinSketch(256, 4)), TopK(2, CountMinSketch(256, 4))
+    for key, count in (("a", 5), ("b", 4)):
+        first.add(key, count)
+    for key, count in (("c", 8), ("b", 3)):
+        second.add(key, count)
+    first.merge(second)
+    assert [key for key, _ in first.items()] == ["c", "b"]
+
+
+def test_daily_aggregate_round_trip_and_merge():
+    shape = dict(precision=10, width=256, depth=4, top_n=3)
+    first, second = DailyAggregate(**shape), DailyAggregate(**shape)
+    for i in range(300):
+        first.visitors.add(f"v{i}")
+        first.count("page_view")
+    for i in range(200, 400):
+        second.visitors.add(f"v{i}")
+        second.count("page_view")
+    second.projects.add("Search")
+    restored = DailyAggregate.from_bytes(second.to_bytes(), top_n=3)
+    first.merge(restored)
+    assert first.events["page_view"] == 500
+    assert first.visitors.count() == pytest.approx(400, rel=0.1)
+    assert first.projects.items()[0][0] == "Search"
+    with pytest.raises(ValueError):
+        DailyAggregate.from_bytes(b"not marshal", top_n=3)